@@ -7,7 +7,6 @@ Low-power wake word listening using OpenWakeWord models.
 import time
 import numpy as np
 import sounddevice as sd
-from scipy import signal
 from typing import Optional, Dict, List
 
 from assistmint.core.logger import wake as log_wake
@@ -97,6 +96,8 @@ class WakeWordEngine:
         target_rate = AUDIO_SAMPLE_RATE
         native_rate = int(samplerate)
         need_resample = native_rate != target_rate
+        if need_resample:
+            from scipy import signal  # Lazy: most of scipy loads with it
 
         # Calculate chunk size for ~80ms of audio at native rate
         native_chunk = int(native_rate * 0.08)
@@ -18,6 +18,10 @@ MAGENTA = "\033[95m"
 CYAN = "\033[96m"
 WHITE = "\033[97m"
 
+# Background colors
+BG_BLUE = "\033[44m"
+BG_CYAN = "\033[46m"
+
 # Tag colors mapping
 TAG_COLORS = {
     "CMD": YELLOW,
@@ -132,9 +132,14 @@ TOP_P = 0.91
 FREQUENCY_PENALTY = 0.42
 PRESENCE_PENALTY = 0.38
 
+# Stream answers and start speaking after the first sentence (False = wait for the full reply)
+OLLAMA_STREAM = True
+
 # Extraction settings (calendar, parsing - always deterministic)
 EXTRACTION_MAX_TOKENS = 300
 EXTRACTION_TEMPERATURE = 0.1
+PARSE_MODEL = "qwen2.5:7b"      # Model for calendar text parsing (better at Dutch time conventions)
+PARSE_MODEL_KEEP_ALIVE = "30m"  # How long Ollama keeps PARSE_MODEL loaded after a request
 
 
 def get_model_settings(model_name: str) -> dict:
@@ -160,6 +165,7 @@ def get_model_settings(model_name: str) -> dict:
 # === SESSION ===
 SESSION_ENABLED = True      # Enable session persistence (save/load conversation history)
 MAX_MESSAGES = 50           # Rolling window size (25 exchanges: user + assistant pairs)
+MAX_PROMPT_TOKENS = 3000    # Drop oldest messages above this (~4 chars/token, 0 = no limit)
 
 # === AUDIO SETTINGS ===
 AUDIO_SAMPLE_RATE = 16000   # Sample rate for mic monitoring (16kHz = speech optimal)
@@ -175,6 +181,7 @@ SILENCE_DURATION_EXT = 2.0  # Seconden stilte voor extended listen (langere vrag
 # Noise reduction
 NOISE_REDUCE = True          # AI noise suppression voor headphones/ruisige omgevingen
 NOISE_REDUCE_STRENGTH = 0.65 # 0.0-1.0: How aggressive (0.8 = strong, 0.5 = mild)
+NOISE_REDUCE_GPU = False     # CUDA: spectral subtraction on the GPU instead of noisereduce (not yet checked on real captures)
 
 # Whisper STT
 # Single model (used when no per-language models configured)
@@ -192,6 +199,9 @@ WHISPER_BEAM_SIZE = 5         #was 5 Higher = better quality, slower (1-10)
 WHISPER_SAMPLE_RATE = 16000   # Whisper vereist 16kHz - niet aanpassen!
 STT_BLOCKSIZE = 4096          # Audio buffer voor spraakopname
 STT_QUEUE_TIMEOUT = 0.35     # was 0.3 Audio queue timeout (seconds) - lower = more responsive
+STT_SPECULATIVE_DECODE = True # Start transcribing when you pause, overlapping the silence wait
+WHISPER_BATCH_SIZE = 8        # Long recordings: decode this many chunks per GPU pass (1 = off)
+WHISPER_BATCH_MIN_SECONDS = 20  # Only recordings at least this long use batched decoding
 
 # Whisper anti-hallucination settings
 # These help prevent Whisper from generating fake text on silence/noise
@@ -202,7 +212,9 @@ WHISPER_HALLUCINATION_SILENCE = 0.4     # Silence duration to trigger hallucinat
 # === GPU SETTINGS ===
 USE_GPU = True              # Probeer GPU te gebruiken (met CPU fallback)
 GPU_DEVICE_ID = 0        # CUDA device ID (None = auto-select beste GPU, 0/1/2 = specifieke GPU)
-WHISPER_COMPUTE_TYPE = "float16"  # GPU: float16, CPU: int8 (auto-detect)
+WHISPER_COMPUTE_TYPE = "int8_float16"  # GPU: int8_float16 (int8 weights, faster + half VRAM), float16
+WHISPER_COMPUTE_TYPE_CPU = "int8"      # CPU: int8 (quantized, ~2x faster than float32), float32
+WARMUP_MODELS = True        # Load Whisper + Piper in the background at startup (first request is fast)
 
 # === TTS SETTINGS (Piper) ===
 # Voice models: ~/.local/share/piper/voices/
@@ -253,6 +265,11 @@ WAKE_WORD = "hey_jarvis"    # Options: hey_jarvis, alexa, hey_mycroft, timer, we
 WAKE_THRESHOLD = 0.4       # 0.0-1.0: sensitivity (hoger = minder vals positief)
                             # 0.5 = gevoelig, 0.7 = strenger, 0.8 = heel streng
 WAKE_WORD_WARMUP_DELAY = 1.0  # Seconds to wait for audio system warmup
+WAKE_INT8 = False           # INT8-quantized wake word model: 2-3x cheaper per frame
+                            # (quantized once to ~/.cache/jarvis/wakeword-int8)
+WAKE_ENERGY_GATE = True     # Skip wake word inference on blocks quieter than the room
+WAKE_GATE_MARGIN_DB = 6.0   # dB above the noise floor (quietest block of the first second)
+WAKE_GATE_HANGOVER = 10     # Keep running this many 80ms blocks after the last loud one
 
 # === STAY AWAKE MODE ===
 # After a command, keep listening without requiring wake word
@@ -267,6 +284,8 @@ CALENDAR_DEFAULT_DURATION = 60  # Default event duration in minutes
 
 CALENDAR_MAX_RETRIES = 5        # How many times to ask again if input not understood (0 = no retry)
 CALENDAR_CANCEL_WORDS = ["cancel", "stop", "never mind", "annuleer", "stop maar", "laat maar"]
+# Replies made only of these words confirm a pending event without asking the LLM
+CALENDAR_CONFIRM_WORDS = ["ja", "yes", "yep", "yeah", "ok", "okay", "oké", "confirm", "bevestig", "prima", "goed"]
 CALENDAR_ASK_LANGUAGE = True    # Ask "English or Dutch?" at start of calendar actions
 
 # Language detection keywords (for calendar language prompt)
@@ -356,6 +375,7 @@ CALENDAR_PROMPTS = {
     "couldnt_understand_date": ("I couldn't understand the date.", "Ik begreep de datum niet."),
     "couldnt_understand_week": ("I didn't understand the week query.", "Ik begreep de week vraag niet."),
     "cancelled": ("Okay, cancelled.", "Oké, geannuleerd."),
+    "event_added": ("Added to your calendar.", "Toegevoegd aan je agenda."),
     "didnt_catch": ("I didn't catch that.", "Ik heb dat niet verstaan."),
     "lets_start_over": ("Let's start over.", "Laten we opnieuw beginnen."),
     "ask_again": ("Let me ask again.", "Ik vraag het nog een keer."),
@@ -1,22 +1,49 @@
-import argparse
-import time
-from speech_recognition import list_microphones, select_microphone_and_samplerate, get_default_microphone, whisper_speech_to_text
+import functools
+import re
+import shutil
+import subprocess
+import sys
 from assistmint.calendar_manager import (
     add_event_to_calendar, check_calendar, remove_event, clear_calendar,
-    set_speak_func, set_calendar_config
+    parse_date, parse_time, set_speak_func, set_calendar_config
 )
-from ollama import ask_ollama, select_ollama_model, set_model, load_session, clear_session, has_pending_calendar, clear_pending_calendar
-from text_to_speech import speak, set_language, get_language
-from wake_word import listen_for_wake_word, init_wake_word
+from text_to_speech import speak, speak_async, set_language, get_language, warmup as _tts_warmup
 from corrections import apply_corrections, add_correction, list_corrections
-from voice2json_intent import recognize_intent
-from colors import cmd, v2j, learn, dictate
+from colors import (cmd, v2j, learn, dictate, RESET, BOLD, DIM, WHITE, CYAN, GREEN,
+                    YELLOW, MAGENTA, BLUE, BG_BLUE, BG_CYAN)
 from config import (DICTATE_EMOJIS, DICTATE_SLEEP_WORDS, WAKE_WORD,
                     LANG_SWITCH_EN, LANG_SWITCH_NL, LANG_SWITCH_AUTO,
-                    CALENDAR_MAX_RETRIES, CALENDAR_CANCEL_WORDS, CALENDAR_PROMPTS,
+                    CALENDAR_MAX_RETRIES, CALENDAR_CANCEL_WORDS, CALENDAR_CONFIRM_WORDS, CALENDAR_PROMPTS,
                     CALENDAR_ASK_LANGUAGE, CALENDAR_LANG_EN, CALENDAR_LANG_NL,
                     LOG_CMD_LENGTH, LOG_OUTPUT_LENGTH,
-                    CALENDAR_BACKEND, CALENDAR_ID, CALENDAR_DEFAULT_DURATION)
+                    CALENDAR_BACKEND, CALENDAR_ID, CALENDAR_DEFAULT_DURATION, WARMUP_MODELS)
+
+# STT, Ollama, wake word and voice2json modules are imported on first use, so
+# startup (and --help) doesn't load Whisper, the Ollama client or openwakeword
+# until needed. text_to_speech (and with it numpy) is still imported above.
+@functools.cache
+def _stt():
+    import speech_recognition
+    return speech_recognition
+
+
+@functools.cache
+def _llm():
+    import ollama
+    return ollama
+
+
+@functools.cache
+def _wake():
+    import wake_word
+    return wake_word
+
+
+@functools.cache
+def _v2j():
+    import voice2json_intent
+    return voice2json_intent
+
 
 # Initialize calendar with V1's TTS and config
 set_speak_func(speak)
@@ -34,124 +61,224 @@ quiet_help = False
 use_voice2json = True
 
 
+# Whitespace and sentence punctuation trimmed from both ends of an utterance
+# before comparing it with command/hallucination lists (one strip pass)
+_NORMALIZE_STRIP = " \t\r\n.,!?"
+
+
+def _keyword_pattern(words):
+    """Whole-word alternation for a keyword list, longest phrases first.
+
+    Longest first so "stop maar" wins over "stop".
+    """
+    alternation = "|".join(map(re.escape, sorted(words, key=len, reverse=True)))
+    return rf"\b(?:{alternation})\b"
+
+
+def _keyword_re(words):
+    """Compile a keyword list into one case-insensitive whole-word alternation."""
+    return re.compile(_keyword_pattern(words), re.IGNORECASE)
+
+
+# Keyword matchers (built once, one regex scan instead of any(... in ...) per list)
+_CANCEL_RE = _keyword_re(CALENDAR_CANCEL_WORDS)
+_LANG_SWITCH_EN_RE = _keyword_re(LANG_SWITCH_EN)
+_LANG_SWITCH_NL_RE = _keyword_re(LANG_SWITCH_NL)
+_LANG_SWITCH_AUTO_RE = _keyword_re(LANG_SWITCH_AUTO)
+_CALENDAR_LANG_EN_RE = _keyword_re(CALENDAR_LANG_EN)
+_CALENDAR_LANG_NL_RE = _keyword_re(CALENDAR_LANG_NL)
+_YES_FALLBACK_RE = _keyword_re(["yes", "ja", "yep", "do it", "go ahead"])
+# Calendar nouns match as word prefixes ("meetings", "scheduled"), including
+# common misspellings; the action words must be whole words ("add" not "address")
+_CAL_RE = re.compile(r"\b(?:calendar|calander|agenda|schedule|event|meeting)", re.IGNORECASE)
+_CAL_ADD_RE = _keyword_re(["add", "put", "create", "new", "schedule"])
+_CAL_CHECK_RE = _keyword_re(["what", "check", "show", "list", "today", "tomorrow"])
+_CAL_CLEAR_RE = _keyword_re(["clear", "delete all", "remove all", "empty"])
+_CAL_REMOVE_RE = _keyword_re(["remove", "delete", "cancel"])
+# Keyword fallback triggers for process_voice_command. One finditer() over
+# _GLOBAL_INTENT_RE collects every group that fired; the caller then checks
+# them in its own priority order.
+_INTENT_TRIGGERS = {
+    "learn": ["learn that", "correct that", "fix that", "that's wrong"],
+    "corrections": ["show corrections", "list corrections"],
+    "session": ["clear session", "forget everything", "vergeet alles"],
+    "lang_en": LANG_SWITCH_EN,
+    "lang_nl": LANG_SWITCH_NL,
+    "lang_auto": LANG_SWITCH_AUTO,
+    "help": ["help me", "help", "what can you do", "commands", "commando's", "lijst",
+             "list commands", "show commands", "options", "opties", "menu"],
+    "shutdown": ["kill yourself", "shut down", "shutdown", "exit", "quit",
+                 "goodbye jarvis", "bye jarvis", "stop jarvis",
+                 "sluit af", "afsluiten", "stop jezelf", "doei jarvis"],
+    "dictate": ["dictate", "diktate", "dik tate", "dicteer", "dicteren", "dictatie",
+                "type this", "start typing"],
+    "terminal": ["run command", "execute", "terminal", "shell"],
+}
+_GLOBAL_INTENT_RE = re.compile(
+    "|".join(f"(?P<{name}>{_keyword_pattern(words)})" for name, words in _INTENT_TRIGGERS.items()),
+    re.IGNORECASE,
+)
+# "this week" / "next week" / "week of <date>" in one scan; the group tells which
+_WEEK_RE = re.compile(
+    r"(?P<this>\bthis week\b|\bdeze week\b)"
+    r"|(?P<next>\bnext week\b|\bvolgende week\b)"
+    r"|\b(?:week of|week van)\s+(?P<of>.+)",
+    re.IGNORECASE,
+)
+
+
+# ANSI escapes are wasted bytes when stdout is a pipe or a log (systemd, CI)
+_ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@functools.cache
+def _help_bytes(text, tty):
+    """Encoded help screen (plain when not on a TTY), built once per text."""
+    return (text if tty else _ANSI_RE.sub("", text)).encode() + b"\n"
+
+
+def _print_help(text):
+    """Print a help screen, without colors when stdout is not a terminal.
+
+    The banners are several KB; writing the pre-encoded bytes skips print()
+    and re-encoding the same text on every call.
+    """
+    data = _help_bytes(text, sys.stdout.isatty())
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:  # stdout replaced by a text-only stream
+        print(data.decode(), end="")
+        return
+    sys.stdout.flush()  # keep ordering with earlier print() output
+    buffer.write(data)
+    buffer.flush()
+
+
+# Help banners, composed once at import (colors come from the colors module)
+_WAKE_PHRASE = WAKE_WORD.replace('_', ' ').title()
+_DICTATION_HELP_TEXT = f"""
+{BOLD}{WHITE}{BG_CYAN}╔═══════════════════════════════════════════════════════════════════════╗
+║  ✍️  DICTATION MODE - "stop"/"klaar" to end, "sleep"/"slaap" to pause  ║
+╚═══════════════════════════════════════════════════════════════════════╝{RESET}
+{CYAN}┌─────────────────────────────────────────────────────────────────────┐{RESET}
+{CYAN}│{RESET} {BOLD}{YELLOW}CONTROL:{RESET}   sleep/slaap/pause → 💤   "{_WAKE_PHRASE}" → ✍️  (no STT) {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{YELLOW}KEYBOARD:{RESET}  backspace  delete  enter  tab  ("three backspaces")  {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{GREEN}SPELL:{RESET}     capital/lower alpha  letter alpha  capital/lower A   {CYAN}│{RESET}
+{CYAN}│{RESET}            number 5 / digit five   (NATO + names: alpha/albert)   {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{MAGENTA}CASE:{RESET}      capital X → X    lowercase X → x    all caps X → X    {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{WHITE}PUNCTUATION:{RESET} period  comma  question mark  exclamation mark       {CYAN}│{RESET}
+{CYAN}│{RESET}              colon  semicolon  new paragraph  space               {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{WHITE}SYMBOLS:{RESET}   at sign @   hashtag #   slash /   backslash \\          {CYAN}│{RESET}
+{CYAN}│{RESET}            underscore _   hyphen -   quote "   single quote '     {CYAN}│{RESET}
+{CYAN}│{RESET}            open/close parenthesis ( )  bracket [ ]  brace {{ }}    {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{WHITE}EMOJIS:{RESET}    house 🏠  heart ❤️  smile 😊  sun ☀️  star ⭐  fire 🔥     {CYAN}│{RESET}
+{CYAN}│{RESET}            dog 🐕  cat 🐈  coffee ☕  pizza 🍕  + many more        {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {BOLD}{YELLOW}LANGUAGE:{RESET} "English" / "Nederlands" / "Dutch" → switch voice        {CYAN}│{RESET}
+{CYAN}│{RESET}            (only works on 1-3 word commands, not in sentences)   {CYAN}│{RESET}
+{CYAN}├─────────────────────────────────────────────────────────────────────┤{RESET}
+{CYAN}│{RESET} {DIM}NATO: alpha/albert bravo/boy charlie delta/david echo foxtrot/fox{RESET}{CYAN}│{RESET}
+{CYAN}│{RESET} {DIM}      golf/george hotel/henry india juliet/john kilo/king lima{RESET} {CYAN}│{RESET}
+{CYAN}│{RESET} {DIM}      mike november oscar papa quebec/queen romeo sierra/sam{RESET}   {CYAN}│{RESET}
+{CYAN}│{RESET} {DIM}      tango/tom uniform/uncle victor whiskey xray yankee zulu{RESET}  {CYAN}│{RESET}
+{CYAN}└─────────────────────────────────────────────────────────────────────┘{RESET}
+"""
+
+_HELP_TEXT = f"""
+{BOLD}{WHITE}{BG_BLUE}╔══════════════════════════════════════════════════════════════════════════════════════╗
+║                    {GREEN}★ ASSISTMINT ★{WHITE}  Voice Assistant                                  ║
+║            {DIM}Whisper STT │ Voice2json Intent │ Ollama LLM{RESET}{BOLD}{WHITE}{BG_BLUE}                           ║
+╚══════════════════════════════════════════════════════════════════════════════════════╝{RESET}
+
+{BOLD}{CYAN}  ENGLISH                              NEDERLANDS{RESET}
+{DIM}  ───────────────────────────────────────────────────────────────────────{RESET}
+
+{YELLOW}  📅 CALENDAR{RESET}                           {YELLOW}📅 KALENDER{RESET}
+     {WHITE}"Add to calendar"{RESET}                     {WHITE}"Voeg toe aan agenda"{RESET}
+     {WHITE}"Check my calendar"{RESET}                   {WHITE}"Bekijk mijn agenda"{RESET}
+     {WHITE}"Remove event"{RESET}                        {WHITE}"Verwijder afspraak"{RESET}
+     {WHITE}"Clear my calendar"{RESET}                   {WHITE}"Wis mijn agenda"{RESET}
+
+{GREEN}  🧠 SESSION{RESET}                            {GREEN}🧠 SESSIE{RESET}
+     {WHITE}"Clear session"{RESET}                       {WHITE}"Vergeet alles"{RESET}
+     {WHITE}"Forget everything"{RESET}                   {WHITE}"Wis sessie"{RESET}
+
+{MAGENTA}  🎓 LEARNING{RESET}                           {MAGENTA}🎓 LEREN{RESET}
+     {WHITE}"Learn that"{RESET} / {WHITE}"Correct that"{RESET}         {WHITE}"Leer dat"{RESET} / {WHITE}"Corrigeer dat"{RESET}
+     {WHITE}"Show corrections"{RESET}                    {WHITE}"Toon correcties"{RESET}
+
+{CYAN}  ✍️  DICTATION{RESET}                          {CYAN}✍️  DICTATIE{RESET}
+     {WHITE}"Dictate"{RESET} → {DIM}"Stop" to end{RESET}             {WHITE}"Dicteer"{RESET} → {DIM}"Stop" / "Klaar"{RESET}
+
+{BLUE}  💻 TERMINAL{RESET}                            {BLUE}💬 QUESTIONS{RESET}
+     {WHITE}"Run command"{RESET} / {WHITE}"Terminal"{RESET}            {DIM}Just ask anything → Ollama{RESET}
+
+{DIM}  ═══════════════════════════════════════════════════════════════════════{RESET}
+  {BOLD}{WHITE}DICTATION GRAMMAR{RESET}
+  {YELLOW}Keyboard:{RESET}  {DIM}"backspace" "delete" "enter" "tab" + "three backspaces" "5 tabs"{RESET}
+  {YELLOW}Case:{RESET}      {DIM}"capital X" "lowercase X" "all caps X" "hoofdletter X"{RESET}
+  {YELLOW}Spell:{RESET}     {DIM}"capital/lower A" "letter alpha" "capital alpha" "number 5" "cijfer vijf"{RESET}
+  {YELLOW}Punct:{RESET}     {DIM}"period/punt" "comma/komma" "question mark" "exclamation mark"{RESET}
+  {YELLOW}Format:{RESET}    {DIM}"new paragraph" "space/spatie"{RESET}
+  {YELLOW}Symbols:{RESET}   {DIM}"at sign" "hashtag" "slash" "backslash" "underscore" "hyphen" "asterisk"{RESET}
+  {YELLOW}Brackets:{RESET}  {DIM}"open/close parenthesis" "open/close bracket" "open/close brace"{RESET}
+  {YELLOW}Quotes:{RESET}    {DIM}"quote" "single quote" "aanhalingsteken" "apostrof"{RESET}
+  {YELLOW}Emojis:{RESET}    {DIM}"house" 🏠  "heart" ❤️  "smile" 😊  "sun" ☀️  "fire" 🔥 + many more{RESET}
+{DIM}  ═══════════════════════════════════════════════════════════════════════{RESET}
+  {BOLD}{WHITE}TERMINAL SPELL MODE{RESET}
+  {DIM}Example: "letter lima letter sierra space hyphen letter lima letter alpha" → ls -la{RESET}
+  {DIM}Or names: "letter london letter sam space hyphen letter london letter albert" → ls -la{RESET}
+{DIM}  ═══════════════════════════════════════════════════════════════════════{RESET}
+  {BOLD}{WHITE}NATO + NAMES{RESET}
+  {DIM}alpha/albert bravo/boy charlie delta/david echo foxtrot/fox golf/george{RESET}
+  {DIM}hotel/henry india juliet/john kilo/king lima/london mike/michael november{RESET}
+  {DIM}oscar papa/peter quebec/queen romeo/roger sierra/sam tango/tom uniform{RESET}
+  {DIM}victor whiskey/william xray yankee/yellow zulu/zebra{RESET}
+{DIM}  ═══════════════════════════════════════════════════════════════════════{RESET}
+"""
+
+_COMMANDS_TEXT = f"""
+{BLUE}╔════════════════════════════════════════════════════════════════════════════════╗
+║                              AVAILABLE COMMANDS                                ║
+╠════════════════════════════════════════════════════════════════════════════════╣
+║ 📅 CALENDAR              │ 💬 QUESTIONS            │ 🎓 LEARNING               ║
+║    • "Add to calendar"   │    • Just ask anything  │    • "Learn that"         ║
+║    • "Check my agenda"   │                         │    • "Correct that"       ║
+║    • "Remove event"      │                         │    • "Show corrections"   ║
+╠════════════════════════════════════════════════════════════════════════════════╣
+║ 🧠 SESSION               │ 💻 TERMINAL             │ ✍️ DICTATION              ║
+║    • "Clear session"     │    • "Run command"      │    • "Dictate"/"Dicteer"  ║
+║    • "Vergeet alles"     │    • "Execute"          │    • "Stop" to end        ║
+╠════════════════════════════════════════════════════════════════════════════════╣
+║ 🌐 LANGUAGE SWITCHING (say word alone, 1-3 words only)                         ║
+║    • "English" / "Nederlands" / "Dutch" - switch voice                         ║
+║    • "Auto" / "Automatisch" - auto-detect language                             ║
+║    NOTE: Won't trigger in sentences like "I want to learn English"             ║
+╠════════════════════════════════════════════════════════════════════════════════╣
+║ DICTATION GRAMMAR                                                              ║
+║ Case:    "capital X" "lowercase X" "all caps X" "hoofdletter X"                ║
+║ Punct:   "period/punt" "comma/komma" "question mark" "exclamation mark"        ║
+║ Format:  "new line" "new paragraph" "tab" "space"                              ║
+║ Symbols: "at sign" "hashtag" "slash" "underscore" "hyphen" "asterisk"          ║
+║ Brackets: "open/close parenthesis" "open/close bracket" "open/close brace"    ║
+║ Quotes:  "quote" "single quote" "aanhalingsteken" "apostrof"                   ║
+╚════════════════════════════════════════════════════════════════════════════════╝{RESET}
+"""
+
+
 def _show_dictation_help():
     """Display compact dictation help when entering dictation mode."""
-    # ANSI colors
-    R = "\033[0m"
-    B = "\033[1m"
-    DIM = "\033[2m"
-    CYAN = "\033[96m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    MAGENTA = "\033[95m"
-    WHITE = "\033[97m"
-    BG_CYAN = "\033[46m"
-
-    wake_phrase = WAKE_WORD.replace('_', ' ').title()
-    print(f"""
-{B}{WHITE}{BG_CYAN}╔═══════════════════════════════════════════════════════════════════════╗
-║  ✍️  DICTATION MODE - "stop"/"klaar" to end, "sleep"/"slaap" to pause  ║
-╚═══════════════════════════════════════════════════════════════════════╝{R}
-{CYAN}┌─────────────────────────────────────────────────────────────────────┐{R}
-{CYAN}│{R} {B}{YELLOW}CONTROL:{R}   sleep/slaap/pause → 💤   "{wake_phrase}" → ✍️  (no STT) {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{YELLOW}KEYBOARD:{R}  backspace  delete  enter  tab  ("three backspaces")  {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{GREEN}SPELL:{R}     capital/lower alpha  letter alpha  capital/lower A   {CYAN}│{R}
-{CYAN}│{R}            number 5 / digit five   (NATO + names: alpha/albert)   {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{MAGENTA}CASE:{R}      capital X → X    lowercase X → x    all caps X → X    {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{WHITE}PUNCTUATION:{R} period  comma  question mark  exclamation mark       {CYAN}│{R}
-{CYAN}│{R}              colon  semicolon  new paragraph  space               {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{WHITE}SYMBOLS:{R}   at sign @   hashtag #   slash /   backslash \\          {CYAN}│{R}
-{CYAN}│{R}            underscore _   hyphen -   quote "   single quote '     {CYAN}│{R}
-{CYAN}│{R}            open/close parenthesis ( )  bracket [ ]  brace {{ }}    {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{WHITE}EMOJIS:{R}    house 🏠  heart ❤️  smile 😊  sun ☀️  star ⭐  fire 🔥     {CYAN}│{R}
-{CYAN}│{R}            dog 🐕  cat 🐈  coffee ☕  pizza 🍕  + many more        {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {B}{YELLOW}LANGUAGE:{R} "English" / "Nederlands" / "Dutch" → switch voice        {CYAN}│{R}
-{CYAN}│{R}            (only works on 1-3 word commands, not in sentences)   {CYAN}│{R}
-{CYAN}├─────────────────────────────────────────────────────────────────────┤{R}
-{CYAN}│{R} {DIM}NATO: alpha/albert bravo/boy charlie delta/david echo foxtrot/fox{R}{CYAN}│{R}
-{CYAN}│{R} {DIM}      golf/george hotel/henry india juliet/john kilo/king lima{R} {CYAN}│{R}
-{CYAN}│{R} {DIM}      mike november oscar papa quebec/queen romeo sierra/sam{R}   {CYAN}│{R}
-{CYAN}│{R} {DIM}      tango/tom uniform/uncle victor whiskey xray yankee zulu{R}  {CYAN}│{R}
-{CYAN}└─────────────────────────────────────────────────────────────────────┘{R}
-""")
+    _print_help(_DICTATION_HELP_TEXT)
 
 
 def _show_help():
     """Display help menu."""
-    # ANSI colors
-    R = "\033[0m"       # Reset
-    B = "\033[1m"       # Bold
-    DIM = "\033[2m"     # Dim
-    # Foreground
-    WHITE = "\033[97m"
-    CYAN = "\033[96m"
-    GREEN = "\033[92m"
-    YELLOW = "\033[93m"
-    MAGENTA = "\033[95m"
-    BLUE = "\033[94m"
-    # Background
-    BG_BLUE = "\033[44m"
-    BG_BLACK = "\033[40m"
-
-    print(f"""
-{B}{WHITE}{BG_BLUE}╔══════════════════════════════════════════════════════════════════════════════════════╗
-║                    {GREEN}★ ASSISTMINT ★{WHITE}  Voice Assistant                                  ║
-║            {DIM}Whisper STT │ Voice2json Intent │ Ollama LLM{R}{B}{WHITE}{BG_BLUE}                           ║
-╚══════════════════════════════════════════════════════════════════════════════════════╝{R}
-
-{B}{CYAN}  ENGLISH                              NEDERLANDS{R}
-{DIM}  ───────────────────────────────────────────────────────────────────────{R}
-
-{YELLOW}  📅 CALENDAR{R}                           {YELLOW}📅 KALENDER{R}
-     {WHITE}"Add to calendar"{R}                     {WHITE}"Voeg toe aan agenda"{R}
-     {WHITE}"Check my calendar"{R}                   {WHITE}"Bekijk mijn agenda"{R}
-     {WHITE}"Remove event"{R}                        {WHITE}"Verwijder afspraak"{R}
-     {WHITE}"Clear my calendar"{R}                   {WHITE}"Wis mijn agenda"{R}
-
-{GREEN}  🧠 SESSION{R}                            {GREEN}🧠 SESSIE{R}
-     {WHITE}"Clear session"{R}                       {WHITE}"Vergeet alles"{R}
-     {WHITE}"Forget everything"{R}                   {WHITE}"Wis sessie"{R}
-
-{MAGENTA}  🎓 LEARNING{R}                           {MAGENTA}🎓 LEREN{R}
-     {WHITE}"Learn that"{R} / {WHITE}"Correct that"{R}         {WHITE}"Leer dat"{R} / {WHITE}"Corrigeer dat"{R}
-     {WHITE}"Show corrections"{R}                    {WHITE}"Toon correcties"{R}
-
-{CYAN}  ✍️  DICTATION{R}                          {CYAN}✍️  DICTATIE{R}
-     {WHITE}"Dictate"{R} → {DIM}"Stop" to end{R}             {WHITE}"Dicteer"{R} → {DIM}"Stop" / "Klaar"{R}
-
-{BLUE}  💻 TERMINAL{R}                            {BLUE}💬 QUESTIONS{R}
-     {WHITE}"Run command"{R} / {WHITE}"Terminal"{R}            {DIM}Just ask anything → Ollama{R}
-
-{DIM}  ═══════════════════════════════════════════════════════════════════════{R}
-  {B}{WHITE}DICTATION GRAMMAR{R}
-  {YELLOW}Keyboard:{R}  {DIM}"backspace" "delete" "enter" "tab" + "three backspaces" "5 tabs"{R}
-  {YELLOW}Case:{R}      {DIM}"capital X" "lowercase X" "all caps X" "hoofdletter X"{R}
-  {YELLOW}Spell:{R}     {DIM}"capital/lower A" "letter alpha" "capital alpha" "number 5" "cijfer vijf"{R}
-  {YELLOW}Punct:{R}     {DIM}"period/punt" "comma/komma" "question mark" "exclamation mark"{R}
-  {YELLOW}Format:{R}    {DIM}"new paragraph" "space/spatie"{R}
-  {YELLOW}Symbols:{R}   {DIM}"at sign" "hashtag" "slash" "backslash" "underscore" "hyphen" "asterisk"{R}
-  {YELLOW}Brackets:{R}  {DIM}"open/close parenthesis" "open/close bracket" "open/close brace"{R}
-  {YELLOW}Quotes:{R}    {DIM}"quote" "single quote" "aanhalingsteken" "apostrof"{R}
-  {YELLOW}Emojis:{R}    {DIM}"house" 🏠  "heart" ❤️  "smile" 😊  "sun" ☀️  "fire" 🔥 + many more{R}
-{DIM}  ═══════════════════════════════════════════════════════════════════════{R}
-  {B}{WHITE}TERMINAL SPELL MODE{R}
-  {DIM}Example: "letter lima letter sierra space hyphen letter lima letter alpha" → ls -la{R}
-  {DIM}Or names: "letter london letter sam space hyphen letter london letter albert" → ls -la{R}
-{DIM}  ═══════════════════════════════════════════════════════════════════════{R}
-  {B}{WHITE}NATO + NAMES{R}
-  {DIM}alpha/albert bravo/boy charlie delta/david echo foxtrot/fox golf/george{R}
-  {DIM}hotel/henry india juliet/john kilo/king lima/london mike/michael november{R}
-  {DIM}oscar papa/peter quebec/queen romeo/roger sierra/sam tango/tom uniform{R}
-  {DIM}victor whiskey/william xray yankee/yellow zulu/zebra{R}
-{DIM}  ═══════════════════════════════════════════════════════════════════════{R}
-""")
+    _print_help(_HELP_TEXT)
     if not quiet_help:
         speak("Calendar: add to calendar, check my agenda. Session: clear session or vergeet alles. Dictation: say dictate to type. Or just ask me anything.")
 
@@ -162,7 +289,7 @@ def _handle_learn_correction(selected_device, samplerate):
     if _last_transcription:
         print(learn("Learning mode activated"))
         speak("What should it be?")
-        correct_phrase = whisper_speech_to_text(selected_device, samplerate).strip()
+        correct_phrase = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
         if correct_phrase:
             add_correction(_last_transcription, correct_phrase)
             speak(f"Got it. I'll remember that {_last_transcription} means {correct_phrase}.")
@@ -181,38 +308,41 @@ def _handle_show_corrections():
         speak("No corrections stored yet.")
 
 
-def _get_prompt(key):
+# Flat per-language views of CALENDAR_PROMPTS (one dict lookup per prompt)
+_PROMPTS_EN = {key: en for key, (en, nl) in CALENDAR_PROMPTS.items()}
+_PROMPTS_NL = {key: nl for key, (en, nl) in CALENDAR_PROMPTS.items()}
+
+
+def _get_prompt(key, nl=None):
     """Get bilingual prompt based on current language setting.
 
     Returns the Dutch version if language is set to 'nl', otherwise English.
+    Callers that already looked up the language can pass nl to skip it.
     """
-    lang = get_language()
-    prompts = CALENDAR_PROMPTS.get(key, (key, key))  # Fallback to key itself
-    return prompts[1] if lang == "nl" else prompts[0]
+    if nl is None:
+        nl = get_language() == "nl"
+    return (_PROMPTS_NL if nl else _PROMPTS_EN).get(key, key)  # Fallback to key itself
 
 
-def _ask_calendar_language(selected_device, samplerate):
+def _ask_calendar_language_impl(selected_device, samplerate):
     """Ask user which language they want to use for this calendar action.
 
     Returns True if language was set, False if cancelled.
     Only asks if CALENDAR_ASK_LANGUAGE is True.
     """
-    if not CALENDAR_ASK_LANGUAGE:
-        return True  # Skip, use current language
-
     speak(_get_prompt("which_language"))
-    response = whisper_speech_to_text(selected_device, samplerate).strip().lower()
+    response = _stt().whisper_speech_to_text(selected_device, samplerate).strip().lower()
 
     # Check for cancel
-    if any(cancel in response for cancel in CALENDAR_CANCEL_WORDS):
+    if _CANCEL_RE.search(response):
         speak(_get_prompt("cancelled"))
         return False
 
     # Detect language choice
-    if any(keyword in response for keyword in CALENDAR_LANG_NL):
+    if _CALENDAR_LANG_NL_RE.search(response):
         set_language("nl")
         speak("Nederlands.", interruptable=False)
-    elif any(keyword in response for keyword in CALENDAR_LANG_EN):
+    elif _CALENDAR_LANG_EN_RE.search(response):
         set_language("en")
         speak("English.", interruptable=False)
     # else: keep current language (user might have said something unclear, proceed anyway)
@@ -220,33 +350,34 @@ def _ask_calendar_language(selected_device, samplerate):
     return True
 
 
-def _check_language_switch(response):
-    """Check if response is a language switch command and apply it.
+# Language prompt disabled in config: keep the current language
+_ask_calendar_language = _ask_calendar_language_impl if CALENDAR_ASK_LANGUAGE else (lambda d, s: True)
+
+
+def _check_language_switch(response_lower):
+    """Check if a lowercased response is a language switch command and apply it.
 
     Returns True if language was switched (caller should re-ask), False otherwise.
     Only triggers on short responses (1-3 words) to avoid accidental switches.
     """
-    response_lower = response.lower()
-    word_count = len(response_lower.split())
-
-    # Only switch on short isolated commands
-    if word_count > 3:
+    # Only switch on short isolated commands (words = spaces + 1)
+    if response_lower.count(" ") + 1 > 3:
         return False
 
     # Check for English switch
-    if any(cmd in response_lower for cmd in LANG_SWITCH_EN):
+    if _LANG_SWITCH_EN_RE.search(response_lower):
         set_language("en")
         speak("Switched to English.", interruptable=False)
         return True
 
     # Check for Dutch switch
-    if any(cmd in response_lower for cmd in LANG_SWITCH_NL):
+    if _LANG_SWITCH_NL_RE.search(response_lower):
         set_language("nl")
         speak("Nederlands.", interruptable=False)
         return True
 
     # Check for auto switch
-    if any(cmd in response_lower for cmd in LANG_SWITCH_AUTO):
+    if _LANG_SWITCH_AUTO_RE.search(response_lower):
         set_language(None)
         speak("Auto.", interruptable=False)
         return True
@@ -254,15 +385,72 @@ def _check_language_switch(response):
     return False
 
 
-def _ask_with_retry(prompt_key, selected_device, samplerate, validator=None, retry_prompt_key=None):
-    """Ask a question and retry if not understood.
+def _speak_while_stt_loads(text):
+    """Speak a prompt and load Whisper in the meantime.
+
+    The first question of a session otherwise waits for the prompt and then
+    for the model load; once Whisper is loaded init_whisper() is a no-op.
+    """
+    playback = speak_async(text)
+    _stt().init_whisper()
+    playback.result()
+
+
+def _ask_simple(prompt_key, selected_device, samplerate):
+    """Ask a question that accepts any non-empty answer, re-asking if nothing was heard.
 
     Args:
         prompt_key: Key for CALENDAR_PROMPTS or direct text
         selected_device: Microphone device
         samplerate: Audio sample rate
-        validator: Optional function(response) -> (success, error_msg)
-                   If None, any non-empty response is accepted
+
+    Returns:
+        (response, cancelled) tuple - response is the answer, cancelled=True if user said cancel
+    """
+    attempts = 0
+    max_attempts = CALENDAR_MAX_RETRIES + 1  # +1 for initial attempt
+    first_ask = True
+
+    while attempts < max_attempts:
+        # Get prompts fresh each time (language may have changed), but look
+        # the language up only once per attempt
+        nl = get_language() == "nl"
+        prompt = _get_prompt(prompt_key, nl)
+
+        if first_ask:
+            _speak_while_stt_loads(prompt)
+            first_ask = False
+        else:
+            _speak_while_stt_loads(f"{_get_prompt('ask_again', nl)} {prompt}")
+
+        response = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
+
+        # Check for language switch commands (don't count as attempt)
+        if _check_language_switch(response.lower()):
+            first_ask = True  # Re-ask in new language
+            continue
+
+        # Check for cancel words
+        if _CANCEL_RE.search(response):
+            speak(_get_prompt("cancelled", nl), wait=False)
+            return None, True
+
+        if response:
+            return response, False
+        attempts += 1
+        speak(_get_prompt("didnt_catch" if attempts < max_attempts else "lets_start_over", nl))
+
+    return None, False
+
+
+def _ask_validated(prompt_key, selected_device, samplerate, validator, retry_prompt_key):
+    """Ask a question and retry until the validator accepts the answer.
+
+    Args:
+        prompt_key: Key for CALENDAR_PROMPTS or direct text
+        selected_device: Microphone device
+        samplerate: Audio sample rate
+        validator: function(response) -> (success, error_msg)
         retry_prompt_key: Key for retry prompt in CALENDAR_PROMPTS
 
     Returns:
@@ -273,61 +461,40 @@ def _ask_with_retry(prompt_key, selected_device, samplerate, validator=None, ret
     first_ask = True
 
     while attempts < max_attempts:
-        # Get prompts fresh each time (language may have changed)
-        prompt = _get_prompt(prompt_key) if prompt_key in CALENDAR_PROMPTS else prompt_key
-        retry_prompt = _get_prompt(retry_prompt_key) if retry_prompt_key and retry_prompt_key in CALENDAR_PROMPTS else retry_prompt_key
+        nl = get_language() == "nl"
 
         if first_ask:
-            speak(prompt)
+            _speak_while_stt_loads(_get_prompt(prompt_key, nl))
             first_ask = False
-        elif attempts > 0:
-            if retry_prompt:
-                speak(retry_prompt)
-            else:
-                speak(f"{_get_prompt('ask_again')} {prompt}")
+        else:
+            _speak_while_stt_loads(_get_prompt(retry_prompt_key, nl))
 
-        response = whisper_speech_to_text(selected_device, samplerate).strip()
+        response = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         # Check for language switch commands (don't count as attempt)
-        if _check_language_switch(response):
+        if _check_language_switch(response.lower()):
             first_ask = True  # Re-ask in new language
             continue
 
         # Check for cancel words
-        if any(cancel in response.lower() for cancel in CALENDAR_CANCEL_WORDS):
-            speak(_get_prompt("cancelled"))
+        if _CANCEL_RE.search(response):
+            speak(_get_prompt("cancelled", nl), wait=False)
             return None, True
 
-        # Validate response
-        if validator:
-            success, error_msg = validator(response)
-            if success:
-                return response, False
-            else:
-                attempts += 1
-                if attempts < max_attempts:
-                    speak(error_msg if error_msg else _get_prompt("didnt_catch"))
-                else:
-                    speak(f"{error_msg} {_get_prompt('lets_start_over')}")
-                    return None, False
+        success, error_msg = validator(response)
+        if success:
+            return response, False
+        attempts += 1
+        if attempts < max_attempts:
+            speak(error_msg if error_msg else _get_prompt("didnt_catch", nl))
         else:
-            # No validator - accept any non-empty response
-            if response:
-                return response, False
-            attempts += 1
-            if attempts < max_attempts:
-                speak(_get_prompt("didnt_catch"))
-            else:
-                speak(_get_prompt("lets_start_over"))
-                return None, False
+            speak(f"{error_msg} {_get_prompt('lets_start_over', nl)}")
 
     return None, False
 
 
 def _handle_add_calendar(selected_device, samplerate):
     """Add event to calendar with retry logic."""
-    from calendar_manager import parse_time, parse_date
-
     print(cmd("Calendar ADD"))
 
     # Ask for language preference
@@ -335,7 +502,7 @@ def _handle_add_calendar(selected_device, samplerate):
         return
 
     # Ask for event name (no validation needed)
-    event_name, cancelled = _ask_with_retry(
+    event_name, cancelled = _ask_simple(
         "what_event",
         selected_device, samplerate
     )
@@ -343,42 +510,30 @@ def _handle_add_calendar(selected_device, samplerate):
         return
 
     # Ask for start time with validation
-    def validate_time(t):
-        result = parse_time(t, silent=True)
-        if result:
-            return True, None
-        return False, _get_prompt("couldnt_understand_time")
-
-    start_time, cancelled = _ask_with_retry(
+    start_time, cancelled = _ask_validated(
         "what_start_time",
         selected_device, samplerate,
-        validator=validate_time,
+        validator=_validate_time,
         retry_prompt_key="retry_time"
     )
     if cancelled or not start_time:
         return
 
     # Ask for end time with validation
-    end_time, cancelled = _ask_with_retry(
+    end_time, cancelled = _ask_validated(
         "what_end_time",
         selected_device, samplerate,
-        validator=validate_time,
+        validator=_validate_time,
         retry_prompt_key="retry_time"
     )
     if cancelled or not end_time:
         return
 
     # Ask for date with validation
-    def validate_date(d):
-        result = parse_date(d, silent=True)
-        if result:
-            return True, None
-        return False, _get_prompt("couldnt_understand_date")
-
-    event_date, cancelled = _ask_with_retry(
+    event_date, cancelled = _ask_validated(
         "what_date",
         selected_device, samplerate,
-        validator=validate_date,
+        validator=_validate_date,
         retry_prompt_key="retry_date"
     )
     if cancelled or not event_date:
@@ -387,102 +542,100 @@ def _handle_add_calendar(selected_device, samplerate):
     add_event_to_calendar(event_name, start_time, end_time, date=event_date)
 
 
+# Parse results are cached on the normalized answer, so a repeated utterance
+# (common when the user retries) is parsed only once
+@functools.lru_cache(maxsize=256)
+def _parses_as_time(text):
+    return bool(parse_time(text, silent=True))
+
+
+@functools.lru_cache(maxsize=256)
+def _parses_as_date(text):
+    return bool(parse_date(text, silent=True))
+
+
+def _validate_time(t):
+    """Validator for start/end time answers."""
+    if _parses_as_time(t.strip().lower()):
+        return True, None
+    return False, _get_prompt("couldnt_understand_time")
+
+
+def _validate_date(d):
+    """Validator for date answers."""
+    if _parses_as_date(d.strip().lower()):
+        return True, None
+    return False, _get_prompt("couldnt_understand_date")
+
+
+def _validate_date_or_week(q):
+    """Validator for check/clear queries: a week phrase or a parseable date."""
+    # Week queries are always valid (support both EN and NL)
+    if _WEEK_RE.search(q):
+        return True, None
+    if "week" in q.lower():
+        return False, _get_prompt("couldnt_understand_week")
+    # Otherwise validate as a date
+    return _validate_date(q)
+
+
+def _dispatch_week(query, action):
+    """Run check_calendar/clear_calendar for a validated date or week query."""
+    match = _WEEK_RE.search(query)
+    if match is None:
+        action(date=query)
+    elif match.group("this"):
+        action(date="this week", week=True)
+    elif match.group("next"):
+        action(date="next week", week=True)
+    elif action is check_calendar:
+        check_calendar(specific_week_start=match.group("of").strip(), week=True)
+    else:
+        action(date=match.group("of").strip(), week=True)
+
+
 def _handle_check_calendar(selected_device, samplerate):
     """Check calendar for events with retry logic."""
-    from calendar_manager import parse_date
-
     print(cmd("Calendar CHECK"))
 
     # Ask for language preference
     if not _ask_calendar_language(selected_device, samplerate):
         return
 
-    def validate_date_or_week(q):
-        q_lower = q.lower()
-        # Week queries are always valid (support both EN and NL)
-        week_keywords = ["week", "deze week", "volgende week", "week van"]
-        if any(w in q_lower for w in week_keywords):
-            valid_patterns = ["this week", "next week", "week of", "deze week", "volgende week", "week van"]
-            if any(p in q_lower for p in valid_patterns):
-                return True, None
-            return False, _get_prompt("couldnt_understand_week")
-        # Otherwise validate as a date
-        result = parse_date(q, silent=True)
-        if result:
-            return True, None
-        return False, _get_prompt("couldnt_understand_date")
-
-    query, cancelled = _ask_with_retry(
+    query, cancelled = _ask_validated(
         "which_date_or_week",
         selected_device, samplerate,
-        validator=validate_date_or_week,
+        validator=_validate_date_or_week,
         retry_prompt_key="retry_date_or_week"
     )
     if cancelled or not query:
         return
 
-    q_lower = query.lower()
-    if any(w in q_lower for w in ["week", "deze week", "volgende week"]):
-        if "this week" in q_lower or "deze week" in q_lower:
-            check_calendar(date="this week", week=True)
-        elif "next week" in q_lower or "volgende week" in q_lower:
-            check_calendar(date="next week", week=True)
-        elif "week of" in q_lower or "week van" in q_lower:
-            specific_week_start = q_lower.replace("week of", "").replace("week van", "").strip()
-            check_calendar(specific_week_start=specific_week_start, week=True)
-    else:
-        check_calendar(date=query)
+    _dispatch_week(query, check_calendar)
 
 
 def _handle_clear_calendar(selected_device, samplerate):
     """Clear calendar events with retry logic."""
-    from calendar_manager import parse_date
-
     print(cmd("Calendar CLEAR"))
 
     # Ask for language preference
     if not _ask_calendar_language(selected_device, samplerate):
         return
 
-    def validate_date_or_week(q):
-        q_lower = q.lower()
-        week_keywords = ["week", "deze week", "volgende week", "week van"]
-        if any(w in q_lower for w in week_keywords):
-            valid_patterns = ["this week", "next week", "week of", "deze week", "volgende week", "week van"]
-            if any(p in q_lower for p in valid_patterns):
-                return True, None
-            return False, _get_prompt("couldnt_understand_week")
-        result = parse_date(q, silent=True)
-        if result:
-            return True, None
-        return False, _get_prompt("couldnt_understand_date")
-
-    query, cancelled = _ask_with_retry(
+    query, cancelled = _ask_validated(
         "which_date_to_clear",
         selected_device, samplerate,
-        validator=validate_date_or_week,
+        validator=_validate_date_or_week,
         retry_prompt_key="retry_date_or_week"
     )
     if cancelled or not query:
         return
 
-    q_lower = query.lower()
-    if any(w in q_lower for w in ["week", "deze week", "volgende week"]):
-        if "this week" in q_lower or "deze week" in q_lower:
-            clear_calendar(date="this week", week=True)
-        elif "next week" in q_lower or "volgende week" in q_lower:
-            clear_calendar(date="next week", week=True)
-        elif "week of" in q_lower or "week van" in q_lower:
-            specific_week_start = q_lower.replace("week of", "").replace("week van", "").strip()
-            clear_calendar(date=specific_week_start, week=True)
-    else:
-        clear_calendar(date=query)
+    _dispatch_week(query, clear_calendar)
 
 
 def _handle_remove_calendar(selected_device, samplerate):
     """Remove specific event from calendar with retry logic."""
-    from calendar_manager import parse_date
-
     print(cmd("Calendar REMOVE"))
 
     # Ask for language preference
@@ -490,7 +643,7 @@ def _handle_remove_calendar(selected_device, samplerate):
         return
 
     # Ask for event name (no validation needed)
-    event_name, cancelled = _ask_with_retry(
+    event_name, cancelled = _ask_simple(
         "event_name_to_remove",
         selected_device, samplerate
     )
@@ -498,16 +651,10 @@ def _handle_remove_calendar(selected_device, samplerate):
         return
 
     # Ask for date with validation
-    def validate_date(d):
-        result = parse_date(d, silent=True)
-        if result:
-            return True, None
-        return False, _get_prompt("couldnt_understand_date")
-
-    event_date, cancelled = _ask_with_retry(
+    event_date, cancelled = _ask_validated(
         "event_date_to_remove",
         selected_device, samplerate,
-        validator=validate_date,
+        validator=_validate_date,
         retry_prompt_key="retry_date"
     )
     if cancelled or not event_date:
@@ -516,506 +663,593 @@ def _handle_remove_calendar(selected_device, samplerate):
     remove_event(event_name, event_date)
 
 
+# === DICTATION MAPS ===
+# Built once at import; _handle_dictation only reads them.
+
+# NATO phonetic alphabet (+ common Whisper mishearings)
+_NATO = {
+    "alpha": "a", "alfa": "a", "albert": "a",
+    "bravo": "b", "beta": "b", "boy": "b",
+    "charlie": "c", "charles": "c",
+    "delta": "d", "david": "d",
+    "echo": "e", "edward": "e",
+    "foxtrot": "f", "fox": "f", "frank": "f",
+    "golf": "g", "george": "g",
+    "hotel": "h", "henry": "h",
+    "india": "i", "indigo": "i",
+    "juliet": "j", "julia": "j", "john": "j",
+    "kilo": "k", "king": "k",
+    "lima": "l", "london": "l", "louis": "l",
+    "mike": "m", "michael": "m", "mary": "m",
+    "november": "n", "nancy": "n", "nora": "n",
+    "oscar": "o", "oliver": "o",
+    "papa": "p", "peter": "p", "paul": "p",
+    "quebec": "q", "queen": "q",
+    "romeo": "r", "robert": "r", "roger": "r",
+    "sierra": "s", "sugar": "s", "sam": "s",
+    "tango": "t", "tom": "t", "tommy": "t",
+    "uniform": "u", "uncle": "u",
+    "victor": "v", "victoria": "v",
+    "whiskey": "w", "whisky": "w", "william": "w",
+    "xray": "x", "x-ray": "x",
+    "yankee": "y", "yellow": "y", "young": "y",
+    "zulu": "z", "zebra": "z", "zero letter": "z",
+}
+
+# Number words for spelling
+_NUMBER_WORDS = {
+    "zero": "0", "nul": "0", "one": "1", "een": "1", "two": "2", "twee": "2",
+    "three": "3", "drie": "3", "four": "4", "vier": "4", "five": "5", "vijf": "5",
+    "six": "6", "zes": "6", "seven": "7", "zeven": "7", "eight": "8", "acht": "8",
+    "nine": "9", "negen": "9"
+}
+
+# Number words for key repetition
+_NUM_WORDS = {
+    "one": 1, "een": 1, "two": 2, "twee": 2, "three": 3, "drie": 3,
+    "four": 4, "vier": 4, "five": 5, "vijf": 5, "six": 6, "zes": 6,
+    "seven": 7, "zeven": 7, "eight": 8, "acht": 8, "nine": 9, "negen": 9,
+    "ten": 10, "tien": 10
+}
+
+# Keyboard actions
+_KEY_ACTIONS = {
+    "backspace": "BackSpace", "backspaces": "BackSpace", "wissen": "BackSpace",
+    "delete": "Delete", "deletes": "Delete", "verwijderen": "Delete",
+    "enter": "Return", "enters": "Return", "nieuwe regel": "Return", "new line": "Return",
+    "tab": "Tab", "tabs": "Tab", "tabje": "Tab",
+}
+
+# Punctuation and symbols
+_REPLACEMENTS = {
+    "period": ".", "punt": ".", "point": ".",
+    "comma": ",", "komma": ",",
+    "question mark": "?", "vraagteken": "?",
+    "exclamation mark": "!", "uitroepteken": "!",
+    "colon": ":", "dubbele punt": ":",
+    "semicolon": ";", "puntkomma": ";",
+    "new paragraph": "\n\n", "nieuwe paragraaf": "\n\n",
+    "space": " ", "spatie": " ",
+    "at sign": "@", "apenstaartje": "@",
+    "hashtag": "#", "hash": "#",
+    "dollar sign": "$", "dollar": "$",
+    "percent": "%", "procent": "%",
+    "ampersand": "&", "en teken": "&",
+    "asterisk": "*", "sterretje": "*",
+    "underscore": "_", "liggend streepje": "_",
+    "hyphen": "-", "min": "-", "dash": "-",
+    "slash": "/", "schuine streep": "/",
+    "backslash": "\\",
+    "open parenthesis": "(", "haakje openen": "(",
+    "close parenthesis": ")", "haakje sluiten": ")",
+    "open bracket": "[", "close bracket": "]",
+    "open brace": "{", "close brace": "}",
+    "quote": '"', "aanhalingsteken": '"',
+    "single quote": "'", "apostrof": "'",
+}
+
+# Emoji map
+_EMOJI = {
+    # Objects (+ plurals)
+    "house": "🏠", "houses": "🏠", "home": "🏡", "homes": "🏡",
+    "car": "🚗", "cars": "🚗", "phone": "📱", "phones": "📱",
+    "computer": "💻", "computers": "💻", "book": "📖", "books": "📖",
+    "clock": "🕐", "clocks": "🕐", "calendar": "📅", "mail": "📧", "email": "📧",
+    "camera": "📷", "cameras": "📷", "music": "🎵", "movie": "🎬", "movies": "🎬",
+    "key": "🔑", "keys": "🔑", "light": "💡", "lights": "💡",
+    "money": "💰", "gift": "🎁", "gifts": "🎁", "balloon": "🎈", "balloons": "🎈",
+    "rocket": "🚀", "rockets": "🚀", "plane": "✈️", "planes": "✈️",
+    "train": "🚂", "trains": "🚂", "bus": "🚌", "bicycle": "🚲", "bicycles": "🚲",
+    "boat": "⛵", "boats": "⛵", "umbrella": "☂️", "umbrellas": "☂️",
+    # People & body
+    "heart": "❤️", "hearts": "❤️", "love": "💕", "kiss": "💋", "kisses": "💋",
+    "hand": "✋", "hands": "✋", "thumbs up": "👍", "thumbs down": "👎",
+    "clap": "👏", "wave": "👋", "pray": "🙏", "muscle": "💪", "muscles": "💪",
+    "eye": "👁️", "eyes": "👁️", "brain": "🧠", "baby": "👶", "babies": "👶",
+    "man": "👨", "men": "👨", "woman": "👩", "women": "👩",
+    # Faces
+    "smile": "😊", "smiles": "😊", "laugh": "😂", "wink": "😉", "cry": "😢", "sad": "😢",
+    "angry": "😠", "cool": "😎", "thinking": "🤔", "surprised": "😮", "love face": "😍",
+    "sick": "🤒", "sleepy": "😴", "crazy": "🤪", "devil": "😈", "angel": "😇",
+    # Animals (+ plurals)
+    "dog": "🐕", "dogs": "🐕", "cat": "🐈", "cats": "🐈",
+    "bird": "🐦", "birds": "🐦", "fish": "🐟", "butterfly": "🦋", "butterflies": "🦋",
+    "bee": "🐝", "bees": "🐝", "pig": "🐷", "pigs": "🐷", "cow": "🐄", "cows": "🐄",
+    "horse": "🐴", "horses": "🐴", "monkey": "🐵", "monkeys": "🐵",
+    "elephant": "🐘", "elephants": "🐘", "lion": "🦁", "lions": "🦁",
+    "tiger": "🐯", "tigers": "🐯", "bear": "🐻", "bears": "🐻",
+    "rabbit": "🐰", "rabbits": "🐰", "snake": "🐍", "snakes": "🐍",
+    "frog": "🐸", "frogs": "🐸", "chicken": "🐔", "chickens": "🐔",
+    "penguin": "🐧", "penguins": "🐧", "whale": "🐋", "whales": "🐋",
+    # Food & drink (+ plurals)
+    "apple": "🍎", "apples": "🍎", "banana": "🍌", "bananas": "🍌",
+    "orange": "🍊", "oranges": "🍊", "pizza": "🍕", "pizzas": "🍕",
+    "burger": "🍔", "burgers": "🍔", "coffee": "☕", "beer": "🍺", "beers": "🍺",
+    "wine": "🍷", "cake": "🎂", "cakes": "🎂", "ice cream": "🍦",
+    "cookie": "🍪", "cookies": "🍪", "bread": "🍞", "cheese": "🧀",
+    "egg": "🥚", "eggs": "🥚", "chicken leg": "🍗",
+    # Nature & weather (+ plurals)
+    "sun": "☀️", "moon": "🌙", "star": "⭐", "stars": "⭐",
+    "cloud": "☁️", "clouds": "☁️", "rain": "🌧️", "snow": "❄️",
+    "fire": "🔥", "rainbow": "🌈", "rainbows": "🌈",
+    "flower": "🌸", "flowers": "🌸", "tree": "🌳", "trees": "🌳",
+    "leaf": "🍃", "leaves": "🍃", "earth": "🌍", "ocean": "🌊",
+    "mountain": "⛰️", "mountains": "⛰️", "thunder": "⚡",
+    # Symbols
+    "check": "✓", "checkmark": "✓", "cross": "✗", "warning": "⚠️", "stop sign": "🛑",
+    "arrow": "➡️", "sparkle": "✨", "sparkles": "✨", "diamond": "💎", "diamonds": "💎",
+    "crown": "👑", "crowns": "👑", "trophy": "🏆", "trophies": "🏆",
+    "medal": "🏅", "medals": "🏅", "flag": "🚩", "flags": "🚩",
+    "lock": "🔒", "bell": "🔔", "bells": "🔔", "magnifier": "🔍",
+    # Dutch words (+ plurals)
+    "huis": "🏠", "huizen": "🏠", "auto": "🚗", "autos": "🚗",
+    "telefoon": "📱", "telefoons": "📱", "hart": "❤️", "harten": "❤️",
+    "lach": "😊", "zon": "☀️", "maan": "🌙", "ster": "⭐", "sterren": "⭐",
+    "bloem": "🌸", "bloemen": "🌸", "boom": "🌳", "bomen": "🌳",
+    "hond": "🐕", "honden": "🐕", "kat": "🐈", "katten": "🐈",
+    "vogel": "🐦", "vogels": "🐦", "vis": "🐟", "vissen": "🐟",
+    "vuur": "🔥", "regen": "🌧️", "sneeuw": "❄️",
+    "koffie": "☕", "bier": "🍺", "wijn": "🍷", "boek": "📖", "boeken": "📖",
+}
+
+# Known Whisper hallucinations (generated on silence/noise/mumbling)
+# Stored lowercase; callers compare against an already-normalized string.
+_WHISPER_HALLUCINATIONS = frozenset({
+    # YouTube-style hallucinations
+    "you", "thank you", "thanks for watching", "thank you for watching",
+    "subscribe", "like and subscribe", "see you next time", "bye",
+    "thanks", "thank you so much", "you you", "you you you",
+    "thank you thank you", "thank you thank you thank you",
+    "you you you you", "thanks thanks", "thanks thanks thanks",
+    # Dutch TV/media hallucinations
+    "tv gelderland", "tv gelderland 2021", "tv gelderland 2020", "tv gelderland 2019",
+    "nos journaal", "rtl nieuws", "omroep gelderland", "omroep brabant",
+    "ondertiteling", "ondertiteling tuvalu", "ondertitels", "copyright",
+    # Single words / fillers
+    "the", "a", "i", "it", "so", "and", "but", "or", "um", "uh", "oh",
+    "hmm", "hm", "ah", "eh", "er", "mm", "mhm", "yeah", "yep", "nope",
+    # Apologies (common hallucination)
+    "i'm sorry", "sorry", "my apologies", "excuse me", "pardon",
+    # Music/sound descriptions
+    "music", "music playing", "applause", "laughter", "silence",
+    "background music", "upbeat music", "soft music",
+    # Repeated phrases
+    "all right", "alright", "okay okay", "yes yes", "no no",
+    # Mumbling artifacts
+    "blah", "blah blah", "la la", "da da", "na na",
+    # Empty acknowledgments
+    "got it", "i see", "right", "right right", "sure", "sure sure",
+})
+
+_HALLUCINATION_MAX_LEN = max(map(len, _WHISPER_HALLUCINATIONS))
+_HALLUCINATION_FIRST_CHARS = frozenset(h[:1] for h in _WHISPER_HALLUCINATIONS)
+
+# Shorter lists for spoken commands: a real command is never one of these
+_TERMINAL_HALLUCINATIONS = frozenset({
+    "you", "thank you", "thanks", "you you", "you you you", "the", "a", "i",
+    "um", "uh", "hmm", "ah", "eh", "mm", "oh", "yeah", "right", "okay",
+    "music", "silence", "applause", "laughter", "sorry", "i'm sorry",
+})
+_COMMAND_HALLUCINATIONS = _TERMINAL_HALLUCINATIONS | {
+    "thank you for watching", "subscribe", "like and subscribe",
+    # Prevent yes/no loops (not meaningful commands on their own)
+    "yes", "ja", "yep", "nope", "no", "nee", "yes yes", "no no",
+}
+
+# Dictation control words (compared against the normalized utterance)
+_DICTATE_STOP_WORDS = frozenset({"stop", "klaar", "done", "einde"})
+_DICTATE_SLEEP_WORDS = frozenset(DICTATE_SLEEP_WORDS)
+
+# Common Whisper mishearings for "Dutch" / "Nederlands"
+_DUTCH_MISHEARINGS = ("ditch", "touch", "such", "much", "douche", "deutsch",
+                      "neder lands", "nether lands", "need a lands")
+# Dictation language commands in one alternation; the group names the action
+_DICTATE_LANG_RE = re.compile(
+    "|".join(f"(?P<{name}>{_keyword_pattern(words)})" for name, words in (
+        ("mishearing", _DUTCH_MISHEARINGS),
+        ("en", LANG_SWITCH_EN),
+        ("nl", LANG_SWITCH_NL),
+        ("auto", LANG_SWITCH_AUTO),
+    )),
+    re.IGNORECASE,
+)
+
+# Punctuation/symbols and (optionally) emojis share one word -> text table
+_DICTATION_TOKENS = {**_REPLACEMENTS, **_EMOJI} if DICTATE_EMOJIS else dict(_REPLACEMENTS)
+# One alternation over every token, longest first ("single quote" before "quote")
+_DICTATION_TOKENS_RE = _keyword_re(_DICTATION_TOKENS)
+
+
+_SENT_SPLIT_RE = re.compile(r'[.!?]+')
+
+
+def _is_hallucination(t_lower, words):
+    """Check if dictated text is likely a Whisper hallucination.
+
+    Takes the normalized utterance (see _NORMALIZE_STRIP) and its split() words.
+    """
+    # Check known hallucinations (length/first-char prefilter before hashing)
+    if (len(t_lower) <= _HALLUCINATION_MAX_LEN and t_lower[:1] in _HALLUCINATION_FIRST_CHARS
+            and t_lower in _WHISPER_HALLUCINATIONS):
+        return True
+    # Check for repeated single word (e.g., "You You You")
+    if len(words) >= 2 and words.count(words[0]) == len(words):
+        return True
+    # Check for repeated phrases (e.g., "I'm sorry. I'm sorry. I'm sorry.")
+    # Split by sentence-ending punctuation and check if phrases repeat
+    phrases = [p.strip() for p in _SENT_SPLIT_RE.split(t_lower) if p.strip()]
+    if len(phrases) >= 2 and phrases.count(phrases[0]) == len(phrases):
+        return True
+    # Check for very short meaningless output
+    if len(t_lower) <= 2 and t_lower != "ok":
+        return True
+    return False
+
+
+def _replace_token(match):
+    """re.sub callback: map a matched dictation token to its text."""
+    word = match.group(0)
+    return _DICTATION_TOKENS.get(word.lower(), word)
+
+
+# Dictation transformations, compiled once and applied in this order per utterance
+# Case instructions in one scan: "capital X" / "all caps X" → upper, "lowercase X" → lower
+_CASE_RE = re.compile(
+    r'\b(?:capital|uppercase|hoofdletter)\s+(?P<upper>\w+)'
+    r'|\b(?:lowercase|kleine letter)\s+(?P<lower>\w+)'
+    r'|\ball caps\s+(?P<caps>\w+)',
+    re.IGNORECASE,
+)
+
+
+def _apply_case(match):
+    """re.sub callback for _CASE_RE."""
+    kind = match.lastgroup
+    word = match.group(kind)
+    return word.lower() if kind == "lower" else word.upper()
+
+
+# Spelling in one pass; the named group says which rule matched:
+#   up:     "capital alpha" / "upper A" → "A"
+#   low:    "lower alpha" / "kleine b" → "a" / "b"
+#   letter: "letter alpha" → "a"
+#   num:    "number 5" / "digit five" / "cijfer vijf" → "5"
+_NATO_ALT = "|".join(map(re.escape, sorted(_NATO, key=len, reverse=True)))
+_NUMBER_ALT = "|".join(map(re.escape, sorted(_NUMBER_WORDS, key=len, reverse=True)))
+_SPELL_RE = re.compile(
+    rf"\b(?:upper|capital|hoofdletter)\s+(?P<up>{_NATO_ALT}|[a-z])\b"
+    rf"|\b(?:lower|kleine)\s+(?P<low>{_NATO_ALT}|[a-z])\b"
+    rf"|\bletter\s+(?P<letter>{_NATO_ALT})\b"
+    rf"|\b(?:number|digit|cijfer)\s+(?P<num>{_NUMBER_ALT}|\d)\b",
+    re.IGNORECASE,
+)
+
+
+def _spell(match):
+    """re.sub callback for _SPELL_RE."""
+    kind = match.lastgroup
+    word = match.group(kind).lower()
+    if kind == "num":
+        return _NUMBER_WORDS.get(word, word)
+    letter = _NATO.get(word, word)
+    return letter.upper() if kind == "up" else letter
+
+
+# Keyboard actions: "three backspaces", "3 backspaces", "tab"
+_NUM_KEY_PATS = [
+    (re.compile(r'\b' + re.escape(num_word) + r'\s+' + re.escape(key_word) + r'\b', re.IGNORECASE), num_val, key_name)
+    for num_word, num_val in _NUM_WORDS.items()
+    for key_word, key_name in _KEY_ACTIONS.items()
+]
+_DIGIT_KEY_PATS = [
+    (re.compile(r'\b(\d+)\s+' + re.escape(key_word) + r'\b', re.IGNORECASE), key_name)
+    for key_word, key_name in _KEY_ACTIONS.items()
+]
+_KEY_PATS = [
+    (re.compile(r'\b' + re.escape(word) + r'\b', re.IGNORECASE), key)
+    for word, key in _KEY_ACTIONS.items()
+]
+_WHITESPACE_RE = re.compile(r'\s+')
+_DIGIT_RE = re.compile(r'\d')
+
+# Words that can start a transformation, per pass. The dictation loop checks
+# the utterance's words against these before running the regexes.
+_WORD_RE = re.compile(r'\w+')
+
+
+def _trigger_words(phrases):
+    return frozenset(word for phrase in phrases for word in _WORD_RE.findall(phrase.lower()))
+
+
+_CASE_TRIGGERS = frozenset({"capital", "uppercase", "hoofdletter", "lowercase", "kleine", "all"})
+_SPELL_TRIGGERS = frozenset({"upper", "capital", "hoofdletter", "lower", "kleine", "letter",
+                             "number", "digit", "cijfer"})
+_KEY_TRIGGERS = _trigger_words(_KEY_ACTIONS)
+_TOKEN_TRIGGERS = _trigger_words(_DICTATION_TOKENS)
+
+
 def _handle_dictation(selected_device, samplerate):
     """Handle dictation mode - type text into active window."""
-    import subprocess
-    import re
 
     _show_dictation_help()
     speak("Dictating. Say stop to end.")
 
     # Collect all dictated text for summary
-    transcript = []
-
-    # NATO phonetic alphabet (+ common Whisper mishearings)
-    nato = {
-        "alpha": "a", "alfa": "a", "albert": "a",
-        "bravo": "b", "beta": "b", "boy": "b",
-        "charlie": "c", "charles": "c",
-        "delta": "d", "david": "d",
-        "echo": "e", "edward": "e",
-        "foxtrot": "f", "fox": "f", "frank": "f",
-        "golf": "g", "george": "g",
-        "hotel": "h", "henry": "h",
-        "india": "i", "indigo": "i",
-        "juliet": "j", "julia": "j", "john": "j",
-        "kilo": "k", "king": "k",
-        "lima": "l", "london": "l", "louis": "l",
-        "mike": "m", "michael": "m", "mary": "m",
-        "november": "n", "nancy": "n", "nora": "n",
-        "oscar": "o", "oliver": "o",
-        "papa": "p", "peter": "p", "paul": "p",
-        "quebec": "q", "queen": "q",
-        "romeo": "r", "robert": "r", "roger": "r",
-        "sierra": "s", "sugar": "s", "sam": "s",
-        "tango": "t", "tom": "t", "tommy": "t",
-        "uniform": "u", "uncle": "u",
-        "victor": "v", "victoria": "v",
-        "whiskey": "w", "whisky": "w", "william": "w",
-        "xray": "x", "x-ray": "x",
-        "yankee": "y", "yellow": "y", "young": "y",
-        "zulu": "z", "zebra": "z", "zero letter": "z",
-    }
-
-    # Number words for spelling
-    number_words = {
-        "zero": "0", "nul": "0", "one": "1", "een": "1", "two": "2", "twee": "2",
-        "three": "3", "drie": "3", "four": "4", "vier": "4", "five": "5", "vijf": "5",
-        "six": "6", "zes": "6", "seven": "7", "zeven": "7", "eight": "8", "acht": "8",
-        "nine": "9", "negen": "9"
-    }
-
-    # Number words for key repetition
-    num_words = {
-        "one": 1, "een": 1, "two": 2, "twee": 2, "three": 3, "drie": 3,
-        "four": 4, "vier": 4, "five": 5, "vijf": 5, "six": 6, "zes": 6,
-        "seven": 7, "zeven": 7, "eight": 8, "acht": 8, "nine": 9, "negen": 9,
-        "ten": 10, "tien": 10
-    }
-
-    # Keyboard actions
-    key_actions = {
-        "backspace": "BackSpace", "backspaces": "BackSpace", "wissen": "BackSpace",
-        "delete": "Delete", "deletes": "Delete", "verwijderen": "Delete",
-        "enter": "Return", "enters": "Return", "nieuwe regel": "Return", "new line": "Return",
-        "tab": "Tab", "tabs": "Tab", "tabje": "Tab",
-    }
-
-    # Punctuation and symbols
-    replacements = {
-        "period": ".", "punt": ".", "point": ".",
-        "comma": ",", "komma": ",",
-        "question mark": "?", "vraagteken": "?",
-        "exclamation mark": "!", "uitroepteken": "!",
-        "colon": ":", "dubbele punt": ":",
-        "semicolon": ";", "puntkomma": ";",
-        "new paragraph": "\n\n", "nieuwe paragraaf": "\n\n",
-        "space": " ", "spatie": " ",
-        "at sign": "@", "apenstaartje": "@",
-        "hashtag": "#", "hash": "#",
-        "dollar sign": "$", "dollar": "$",
-        "percent": "%", "procent": "%",
-        "ampersand": "&", "en teken": "&",
-        "asterisk": "*", "sterretje": "*",
-        "underscore": "_", "liggend streepje": "_",
-        "hyphen": "-", "min": "-", "dash": "-",
-        "slash": "/", "schuine streep": "/",
-        "backslash": "\\",
-        "open parenthesis": "(", "haakje openen": "(",
-        "close parenthesis": ")", "haakje sluiten": ")",
-        "open bracket": "[", "close bracket": "]",
-        "open brace": "{", "close brace": "}",
-        "quote": '"', "aanhalingsteken": '"',
-        "single quote": "'", "apostrof": "'",
-    }
-
-    # Emoji map
-    emoji_map = {
-        # Objects (+ plurals)
-        "house": "🏠", "houses": "🏠", "home": "🏡", "homes": "🏡",
-        "car": "🚗", "cars": "🚗", "phone": "📱", "phones": "📱",
-        "computer": "💻", "computers": "💻", "book": "📖", "books": "📖",
-        "clock": "🕐", "clocks": "🕐", "calendar": "📅", "mail": "📧", "email": "📧",
-        "camera": "📷", "cameras": "📷", "music": "🎵", "movie": "🎬", "movies": "🎬",
-        "key": "🔑", "keys": "🔑", "light": "💡", "lights": "💡",
-        "money": "💰", "gift": "🎁", "gifts": "🎁", "balloon": "🎈", "balloons": "🎈",
-        "rocket": "🚀", "rockets": "🚀", "plane": "✈️", "planes": "✈️",
-        "train": "🚂", "trains": "🚂", "bus": "🚌", "bicycle": "🚲", "bicycles": "🚲",
-        "boat": "⛵", "boats": "⛵", "umbrella": "☂️", "umbrellas": "☂️",
-        # People & body
-        "heart": "❤️", "hearts": "❤️", "love": "💕", "kiss": "💋", "kisses": "💋",
-        "hand": "✋", "hands": "✋", "thumbs up": "👍", "thumbs down": "👎",
-        "clap": "👏", "wave": "👋", "pray": "🙏", "muscle": "💪", "muscles": "💪",
-        "eye": "👁️", "eyes": "👁️", "brain": "🧠", "baby": "👶", "babies": "👶",
-        "man": "👨", "men": "👨", "woman": "👩", "women": "👩",
-        # Faces
-        "smile": "😊", "smiles": "😊", "laugh": "😂", "wink": "😉", "cry": "😢", "sad": "😢",
-        "angry": "😠", "cool": "😎", "thinking": "🤔", "surprised": "😮", "love face": "😍",
-        "sick": "🤒", "sleepy": "😴", "crazy": "🤪", "devil": "😈", "angel": "😇",
-        # Animals (+ plurals)
-        "dog": "🐕", "dogs": "🐕", "cat": "🐈", "cats": "🐈",
-        "bird": "🐦", "birds": "🐦", "fish": "🐟", "butterfly": "🦋", "butterflies": "🦋",
-        "bee": "🐝", "bees": "🐝", "pig": "🐷", "pigs": "🐷", "cow": "🐄", "cows": "🐄",
-        "horse": "🐴", "horses": "🐴", "monkey": "🐵", "monkeys": "🐵",
-        "elephant": "🐘", "elephants": "🐘", "lion": "🦁", "lions": "🦁",
-        "tiger": "🐯", "tigers": "🐯", "bear": "🐻", "bears": "🐻",
-        "rabbit": "🐰", "rabbits": "🐰", "snake": "🐍", "snakes": "🐍",
-        "frog": "🐸", "frogs": "🐸", "chicken": "🐔", "chickens": "🐔",
-        "penguin": "🐧", "penguins": "🐧", "whale": "🐋", "whales": "🐋",
-        # Food & drink (+ plurals)
-        "apple": "🍎", "apples": "🍎", "banana": "🍌", "bananas": "🍌",
-        "orange": "🍊", "oranges": "🍊", "pizza": "🍕", "pizzas": "🍕",
-        "burger": "🍔", "burgers": "🍔", "coffee": "☕", "beer": "🍺", "beers": "🍺",
-        "wine": "🍷", "cake": "🎂", "cakes": "🎂", "ice cream": "🍦",
-        "cookie": "🍪", "cookies": "🍪", "bread": "🍞", "cheese": "🧀",
-        "egg": "🥚", "eggs": "🥚", "chicken leg": "🍗",
-        # Nature & weather (+ plurals)
-        "sun": "☀️", "moon": "🌙", "star": "⭐", "stars": "⭐",
-        "cloud": "☁️", "clouds": "☁️", "rain": "🌧️", "snow": "❄️",
-        "fire": "🔥", "rainbow": "🌈", "rainbows": "🌈",
-        "flower": "🌸", "flowers": "🌸", "tree": "🌳", "trees": "🌳",
-        "leaf": "🍃", "leaves": "🍃", "earth": "🌍", "ocean": "🌊",
-        "mountain": "⛰️", "mountains": "⛰️", "thunder": "⚡",
-        # Symbols
-        "check": "✓", "checkmark": "✓", "cross": "✗", "warning": "⚠️", "stop sign": "🛑",
-        "arrow": "➡️", "sparkle": "✨", "sparkles": "✨", "diamond": "💎", "diamonds": "💎",
-        "crown": "👑", "crowns": "👑", "trophy": "🏆", "trophies": "🏆",
-        "medal": "🏅", "medals": "🏅", "flag": "🚩", "flags": "🚩",
-        "lock": "🔒", "bell": "🔔", "bells": "🔔", "magnifier": "🔍",
-        # Dutch words (+ plurals)
-        "huis": "🏠", "huizen": "🏠", "auto": "🚗", "autos": "🚗",
-        "telefoon": "📱", "telefoons": "📱", "hart": "❤️", "harten": "❤️",
-        "lach": "😊", "zon": "☀️", "maan": "🌙", "ster": "⭐", "sterren": "⭐",
-        "bloem": "🌸", "bloemen": "🌸", "boom": "🌳", "bomen": "🌳",
-        "hond": "🐕", "honden": "🐕", "kat": "🐈", "katten": "🐈",
-        "vogel": "🐦", "vogels": "🐦", "vis": "🐟", "vissen": "🐟",
-        "vuur": "🔥", "regen": "🌧️", "sneeuw": "❄️",
-        "koffie": "☕", "bier": "🍺", "wijn": "🍷", "boek": "📖", "boeken": "📖",
-    }
-
-    # Known Whisper hallucinations (generated on silence/noise/mumbling)
-    whisper_hallucinations = [
-        # YouTube-style hallucinations
-        "you", "thank you", "thanks for watching", "thank you for watching",
-        "subscribe", "like and subscribe", "see you next time", "bye",
-        "thanks", "thank you so much", "you you", "you you you",
-        "thank you thank you", "thank you thank you thank you",
-        "you you you you", "thanks thanks", "thanks thanks thanks",
-        # Dutch TV/media hallucinations
-        "tv gelderland", "tv gelderland 2021", "tv gelderland 2020", "tv gelderland 2019",
-        "nos journaal", "rtl nieuws", "omroep gelderland", "omroep brabant",
-        "ondertiteling", "ondertiteling tuvalu", "ondertitels", "copyright",
-        # Single words / fillers
-        "the", "a", "i", "it", "so", "and", "but", "or", "um", "uh", "oh",
-        "hmm", "hm", "ah", "eh", "er", "mm", "mhm", "yeah", "yep", "nope",
-        # Apologies (common hallucination)
-        "i'm sorry", "sorry", "my apologies", "excuse me", "pardon",
-        # Music/sound descriptions
-        "music", "music playing", "applause", "laughter", "silence",
-        "background music", "upbeat music", "soft music",
-        # Repeated phrases
-        "all right", "alright", "okay okay", "yes yes", "no no",
-        # Mumbling artifacts
-        "blah", "blah blah", "la la", "da da", "na na",
-        # Empty acknowledgments
-        "got it", "i see", "right", "right right", "sure", "sure sure",
-    ]
-
-    def is_hallucination(t):
-        """Check if text is likely a Whisper hallucination."""
-        t_lower = t.lower().strip().rstrip('.,!?')
-        # Check known hallucinations
-        if t_lower in whisper_hallucinations:
-            return True
-        # Check for repeated single word (e.g., "You You You")
-        words = t_lower.split()
-        if len(words) >= 2 and len(set(words)) == 1:
-            return True
-        # Check for repeated phrases (e.g., "I'm sorry. I'm sorry. I'm sorry.")
-        # Split by sentence-ending punctuation and check if phrases repeat
-        phrases = [p.strip() for p in re.split(r'[.!?]+', t_lower) if p.strip()]
-        if len(phrases) >= 2 and len(set(phrases)) == 1:
-            return True
-        # Check for very short meaningless output
-        if len(t_lower) <= 2 and t_lower not in ["ok"]:
-            return True
-        return False
+    # (kept as UTF-8 bytes: each line is encoded once for xdotool and reused for xclip)
+    transcript = bytearray()
+    word_count = 0
 
     while True:
-        text = whisper_speech_to_text(selected_device, samplerate, extended_listen=True).strip()
+        text = _stt().whisper_speech_to_text(selected_device, samplerate, extended_listen=True).strip()
 
         if not text:
             continue
 
+        # Normalize once: lowercase, strip whitespace and common punctuation.
+        # Hallucination, control, language and trigger checks all reuse it.
+        raw_lower = text.lower().strip(_NORMALIZE_STRIP)
+        raw_words = raw_lower.split()
+
         # Skip Whisper hallucinations
-        if is_hallucination(text):
+        if _is_hallucination(raw_lower, raw_words):
             print(dictate(f"Skipped hallucination: '{text}'"))
             continue
 
         # === CHECK CONTROL COMMANDS FIRST (before any text processing) ===
-        # Normalize: lowercase, strip whitespace and common punctuation
-        raw_lower = text.lower().strip().rstrip('.,!?')
 
         # Stop command - exit dictation
-        if raw_lower in ["stop", "klaar", "done", "einde"]:
-            speak("Dictation ended.")
+        if raw_lower in _DICTATE_STOP_WORDS:
+            speak("Dictation ended.", wait=False)
             break
 
         # Sleep mode - TRUE silence using wake word detection (no Whisper = no transcription)
-        if raw_lower in DICTATE_SLEEP_WORDS:
-            wake_phrase = WAKE_WORD.replace('_', ' ').title()
-            print(dictate(f"💤 SLEEPING - mic silenced, say '{wake_phrase}' to wake"))
+        if raw_lower in _DICTATE_SLEEP_WORDS:
+            print(dictate(f"💤 SLEEPING - mic silenced, say '{_WAKE_PHRASE}' to wake"))
             speak("Sleeping.", interruptable=False)
 
             # Use wake word detection - NO transcription while sleeping
-            detected = listen_for_wake_word(selected_device, samplerate)
+            detected = _wake().listen_for_wake_word(selected_device, samplerate)
 
             if detected:
                 print(dictate("✍️ Dictation resumed"))
                 speak("Resumed.", interruptable=False)
             else:
                 # Wake word detection failed/error - end dictation
-                speak("Dictation ended.")
+                speak("Dictation ended.", wait=False)
                 return
 
             continue  # Back to main dictation loop
 
         # Language switching (only on short isolated commands, not in sentences)
-        dictate_word_count = len(raw_lower.split())
+        dictate_word_count = len(raw_words)
 
         # Debug: show what was heard for short commands
         if dictate_word_count <= 4:
             print(dictate(f"[DEBUG] Short command heard: '{raw_lower}'"))
 
+        # One scan classifies mishearings and language switch phrases
+        lang_hits = {m.lastgroup for m in _DICTATE_LANG_RE.finditer(raw_lower)}
+
         # Common Whisper mishearings for "Dutch" / "Nederlands"
-        dutch_mishearings = ["ditch", "touch", "such", "much", "douche", "deutsch",
-                             "neder lands", "nether lands", "need a lands"]
-        if any(m in raw_lower for m in dutch_mishearings):
+        if "mishearing" in lang_hits:
             set_language("nl")
             speak("Nederlands.", interruptable=False)
             print(dictate(f"[Corrected mishearing to Dutch]"))
             continue
 
         if dictate_word_count <= 3:
-            if any(t in raw_lower for t in LANG_SWITCH_EN):
+            if "en" in lang_hits:
                 set_language("en")
                 speak("Switched to English.", interruptable=False)
                 continue
-            if any(t in raw_lower for t in LANG_SWITCH_NL):
+            if "nl" in lang_hits:
                 set_language("nl")
                 speak("Nederlands.", interruptable=False)
                 continue
-            if any(t in raw_lower for t in LANG_SWITCH_AUTO):
+            if "auto" in lang_hits:
                 set_language(None)
                 speak("Auto.", interruptable=False)
                 continue
 
         # === PROCESS ALL TRANSFORMATIONS ===
+        # Plain sentences contain no trigger words: skip the regex passes
+        words = set(_WORD_RE.findall(raw_lower))
 
-        # Process case instructions for words
-        text = re.sub(r'\b(capital|uppercase|hoofdletter)\s+(\w+)', lambda m: m.group(2).upper(), text, flags=re.IGNORECASE)
-        text = re.sub(r'\b(lowercase|kleine letter)\s+(\w+)', lambda m: m.group(2).lower(), text, flags=re.IGNORECASE)
-        text = re.sub(r'\ball caps\s+(\w+)', lambda m: m.group(1).upper(), text, flags=re.IGNORECASE)
-
-        # SPELL MODE - NATO alphabet
-        for word, letter in nato.items():
-            text = re.sub(r'\b(upper|capital|hoofdletter)\s+' + word + r'\b', lambda m, l=letter: l.upper(), text, flags=re.IGNORECASE)
-            text = re.sub(r'\b(lower|kleine)\s+' + word + r'\b', lambda m, l=letter: l, text, flags=re.IGNORECASE)
-        for word, letter in nato.items():
-            text = re.sub(r'\bletter\s+' + word + r'\b', lambda m, l=letter: l, text, flags=re.IGNORECASE)
-
-        # Direct letter spelling: "upper A" → "A", "lower b" → "b"
-        text = re.sub(r'\b(upper|capital|hoofdletter)\s+([a-z])\b', lambda m: m.group(2).upper(), text, flags=re.IGNORECASE)
-        text = re.sub(r'\b(lower|kleine)\s+([a-z])\b', lambda m: m.group(2).lower(), text, flags=re.IGNORECASE)
-
-        # Numbers: "number 5" / "digit five" / "cijfer vijf" → "5"
-        for word, digit in number_words.items():
-            text = re.sub(r'\b(number|digit|cijfer)\s+' + word + r'\b', lambda m, d=digit: d, text, flags=re.IGNORECASE)
-        text = re.sub(r'\b(number|digit|cijfer)\s+(\d)\b', lambda m: m.group(2), text, flags=re.IGNORECASE)
+        # Case instructions, then NATO/letter/number spelling, one scan each
+        if not words.isdisjoint(_CASE_TRIGGERS):
+            text = _CASE_RE.sub(_apply_case, text)
+        if not words.isdisjoint(_SPELL_TRIGGERS):
+            text = _SPELL_RE.sub(_spell, text)
 
         # Keyboard actions (actual key presses via xdotool)
-        # Handle numbered key actions: "three backspaces", "5 tabs", etc.
-        for num_word, num_val in num_words.items():
-            for key_word, key_name in key_actions.items():
-                pattern = r'\b' + num_word + r'\s+' + key_word + r'\b'
-                if re.search(pattern, text, flags=re.IGNORECASE):
-                    for _ in range(num_val):
-                        subprocess.run(["xdotool", "key", key_name], check=False)
-                    print(dictate(f"Key: {key_name} x{num_val}"))
-                    text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-        # Handle digit + key: "3 backspaces", "5 tabs"
-        for key_word, key_name in key_actions.items():
-            pattern = r'\b(\d+)\s+' + key_word + r'\b'
-            match = re.search(pattern, text, flags=re.IGNORECASE)
-            if match:
-                num_val = int(match.group(1))
-                for _ in range(num_val):
-                    subprocess.run(["xdotool", "key", key_name], check=False)
-                print(dictate(f"Key: {key_name} x{num_val}"))
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE)
-
-        # Handle single key actions
-        for word, key in key_actions.items():
-            pattern = r'\b' + word + r'\b'
-            if re.search(pattern, text, flags=re.IGNORECASE):
-                count = len(re.findall(pattern, text, flags=re.IGNORECASE))
-                for _ in range(count):
-                    subprocess.run(["xdotool", "key", key], check=False)
-                    print(dictate(f"Key: {key}"))
-                text = re.sub(pattern, '', text, flags=re.IGNORECASE)
+        # Collected as (key, count) and sent with the typed text below
+        key_presses = []
+
+        if not words.isdisjoint(_KEY_TRIGGERS):
+            # Handle numbered key actions: "three backspaces", "ten tabs", etc.
+            if not words.isdisjoint(_NUM_WORDS):
+                for pattern, num_val, key_name in _NUM_KEY_PATS:
+                    if pattern.search(text):
+                        key_presses.append((key_name, num_val))
+                        print(dictate(f"Key: {key_name} x{num_val}"))
+                        text = pattern.sub('', text)
+
+            # Handle digit + key: "3 backspaces", "5 tabs" (digits may come from spelling)
+            if _DIGIT_RE.search(text):
+                for pattern, key_name in _DIGIT_KEY_PATS:
+                    match = pattern.search(text)
+                    if match:
+                        num_val = int(match.group(1))
+                        key_presses.append((key_name, num_val))
+                        print(dictate(f"Key: {key_name} x{num_val}"))
+                        text = pattern.sub('', text)
+
+            # Handle single key actions
+            for pattern, key in _KEY_PATS:
+                if pattern.search(text):
+                    count = len(pattern.findall(text))
+                    key_presses.append((key, count))
+                    print(dictate(f"Key: {key} x{count}" if count > 1 else f"Key: {key}"))
+                    text = pattern.sub('', text)
 
         # Clean up extra spaces
-        text = re.sub(r'\s+', ' ', text).strip()
-
-        # Punctuation and grammar
-        for word, symbol in replacements.items():
-            text = re.sub(r'\b' + word + r'\b', lambda m, s=symbol: s, text, flags=re.IGNORECASE)
+        text = _WHITESPACE_RE.sub(' ', text).strip()
 
-        # Emoji replacements (if enabled)
-        if DICTATE_EMOJIS:
-            for word, emoji in emoji_map.items():
-                text = re.sub(r'\b' + word + r'\b', emoji, text, flags=re.IGNORECASE)
+        # Punctuation, symbols and emojis (if enabled) in a single scan
+        if not words.isdisjoint(_TOKEN_TRIGGERS):
+            text = _DICTATION_TOKENS_RE.sub(_replace_token, text)
 
         # Clean up again after all replacements
         text = text.strip()
 
+        # Key presses and typing share one chained xdotool call; the text
+        # goes through stdin ("type --file -"), which must come last
+        xdotool_args = ["xdotool"]
+        for key, count in key_presses:
+            xdotool_args += ["key", "--repeat", str(count), "--delay", "20", key]
+        typed = None
+        if text:
+            print(dictate(f"Typing: {text}"))
+            xdotool_args += ["type", "--file", "-"]
+            typed = (text + " ").encode()
+        if len(xdotool_args) > 1:
+            subprocess.run(xdotool_args, input=typed, check=False)
+
         # If nothing left to type after processing, stay in dictation mode
         if not text:
             continue
 
-        # Type the processed text
-        print(dictate(f"Typing: {text}"))
-        subprocess.run(["xdotool", "type", "--", text + " "], check=False)
-        transcript.append(text)
+        transcript += typed
+        word_count += len(text.split())
 
     # Show transcript summary and copy to clipboard
-    if transcript:
-        full_text = " ".join(transcript)
+    if word_count:
+        del transcript[-1:]  # trailing separator space
+        full_text = transcript.decode()
         print(f"\n{dictate('═' * 60)}")
         print(dictate("DICTATION TRANSCRIPT:"))
         print(f"{dictate('─' * 60)}")
         print(full_text)
         print(f"{dictate('─' * 60)}")
-        print(dictate(f"Words: {len(full_text.split())} | Characters: {len(full_text)}"))
+        print(dictate(f"Words: {word_count} | Characters: {len(full_text)}"))
         print(f"{dictate('═' * 60)}\n")
 
         # Copy to clipboard
         try:
-            subprocess.run(["xclip", "-selection", "clipboard"], input=full_text.encode(), check=True)
+            subprocess.run(["xclip", "-selection", "clipboard"], input=transcript, check=True)
             print(dictate("📋 Copied to clipboard!"))
-            speak(f"Done. {len(full_text.split())} words copied to clipboard.")
+            speak(f"Done. {word_count} words copied to clipboard.", wait=False)
         except FileNotFoundError:
             print(dictate("Install xclip to enable clipboard: sudo apt install xclip"))
-            speak(f"Done. {len(full_text.split())} words dictated.")
+            speak(f"Done. {word_count} words dictated.", wait=False)
     else:
-        speak("No text was dictated.")
+        speak("No text was dictated.", wait=False)
+
+
+# Programs to launch, in order of preference
+_BROWSERS = ("firefox", "google-chrome", "chromium-browser", "brave-browser")
+_TERMINAL_EMULATORS = {  # emulator -> flag that precedes the command
+    "gnome-terminal": "--", "xterm": "-e", "konsole": "-e", "xfce4-terminal": "-e",
+}
+
+
+@functools.cache
+def _first_installed(names):
+    """First of names found on PATH (or None); looked up once per process."""
+    return next((name for name in names if shutil.which(name)), None)
 
 
 def _handle_open_browser():
     """Handle opening browser."""
-    import subprocess
     print(cmd("Opening browser"))
-    # Try common browsers in order of preference
-    browsers = ["firefox", "google-chrome", "chromium-browser", "brave-browser"]
-    for browser in browsers:
-        try:
-            subprocess.Popen([browser], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            speak("Opening browser.")
-            return
-        except FileNotFoundError:
-            continue
-    speak("No browser found.")
+    browser = _first_installed(_BROWSERS)
+    if browser is None:
+        speak("No browser found.")
+        return
+    subprocess.Popen([browser], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    speak("Opening browser.", wait=False)
+
+
+# Spoken symbol names for terminal commands
+_CMD_SYMBOLS = {
+    "hyphen": "-", "dash": "-", "min": "-",
+    "underscore": "_", "liggend streepje": "_",
+    "slash": "/", "schuine streep": "/",
+    "backslash": "\\",
+    "dot": ".", "period": ".", "punt": ".",
+    "space": " ", "spatie": " ",
+}
+_CMD_SYMBOLS_RE = _keyword_re(_CMD_SYMBOLS)
+# Common Linux commands, matched as the whole first word of a command.
+# The lookahead (not \b) lets "g++" match.
+_LINUX_COMMANDS = frozenset({
+    "ls", "cd", "pwd", "cat", "grep", "find", "rm", "cp", "mv", "mkdir", "rmdir",
+    "chmod", "chown", "sudo", "apt", "pip", "python", "python3", "git", "docker",
+    "ssh", "scp", "curl", "wget", "tar", "zip", "unzip", "nano", "vim", "vi",
+    "echo", "touch", "head", "tail", "less", "more", "man", "which", "whereis",
+    "ps", "top", "htop", "kill", "killall", "df", "du", "free", "uname", "whoami",
+    "hostname", "ifconfig", "ip", "ping", "netstat", "ss", "systemctl", "journalctl",
+    "make", "cmake", "gcc", "g++", "npm", "node", "yarn", "cargo", "rustc",
+})
+_LINUX_CMD_RE = re.compile(
+    r"^\s*(?:" + "|".join(map(re.escape, sorted(_LINUX_COMMANDS, key=len, reverse=True))) + r")(?=\s|$)",
+    re.IGNORECASE,
+)
+# Punctuation dropped from a command before it is read back
+_TTS_PUNCT_DELETE = str.maketrans("", "", ".?!,;:")
+
+
+def _replace_cmd_symbol(match):
+    """re.sub callback: map a spoken symbol name to its character."""
+    return _CMD_SYMBOLS[match.group(0).lower()]
 
 
 def _handle_terminal(selected_device, samplerate):
     """Handle terminal command execution."""
-    import subprocess
-    import re
-    from voice2json_intent import recognize_intent
-
-    # Known Whisper hallucinations
-    hallucinations = [
-        "you", "thank you", "thanks", "you you", "you you you", "the", "a", "i",
-        "um", "uh", "hmm", "ah", "eh", "mm", "oh", "yeah", "right", "okay",
-        "music", "silence", "applause", "laughter", "sorry", "i'm sorry",
-    ]
 
     print(cmd("TERMINAL command"))
     speak("What command?")
-    command = whisper_speech_to_text(selected_device, samplerate, extended_listen=True).strip()
+    command = _stt().whisper_speech_to_text(selected_device, samplerate, extended_listen=True).strip()
 
     # Skip hallucinations
-    if command.lower().strip().rstrip('.') in hallucinations:
+    if command.lower().strip().rstrip('.') in _TERMINAL_HALLUCINATIONS:
         print(cmd(f"Skipped hallucination: '{command}'"))
         speak("I didn't catch that. Try again.")
         return
 
     if command:
-        # Process case instructions for words
-        command = re.sub(r'\b(capital|uppercase|hoofdletter)\s+(\w+)', lambda m: m.group(2).upper(), command, flags=re.IGNORECASE)
-        command = re.sub(r'\b(lowercase|kleine letter)\s+(\w+)', lambda m: m.group(2).lower(), command, flags=re.IGNORECASE)
-        command = re.sub(r'\ball caps\s+(\w+)', lambda m: m.group(1).upper(), command, flags=re.IGNORECASE)
-
-        # SPELL MODE - NATO phonetic alphabet (+ common Whisper mishearings)
-        nato = {
-            "alpha": "a", "alfa": "a", "albert": "a",
-            "bravo": "b", "beta": "b", "boy": "b",
-            "charlie": "c", "charles": "c",
-            "delta": "d", "david": "d",
-            "echo": "e", "edward": "e",
-            "foxtrot": "f", "fox": "f", "frank": "f",
-            "golf": "g", "george": "g",
-            "hotel": "h", "henry": "h",
-            "india": "i", "indigo": "i",
-            "juliet": "j", "julia": "j", "john": "j",
-            "kilo": "k", "king": "k",
-            "lima": "l", "london": "l", "louis": "l",
-            "mike": "m", "michael": "m", "mary": "m",
-            "november": "n", "nancy": "n", "nora": "n",
-            "oscar": "o", "oliver": "o",
-            "papa": "p", "peter": "p", "paul": "p",
-            "quebec": "q", "queen": "q",
-            "romeo": "r", "robert": "r", "roger": "r",
-            "sierra": "s", "sugar": "s", "sam": "s",
-            "tango": "t", "tom": "t", "tommy": "t",
-            "uniform": "u", "uncle": "u",
-            "victor": "v", "victoria": "v",
-            "whiskey": "w", "whisky": "w", "william": "w",
-            "xray": "x", "x-ray": "x",
-            "yankee": "y", "yellow": "y", "young": "y",
-            "zulu": "z", "zebra": "z", "zero letter": "z",
-        }
-        for word, letter in nato.items():
-            command = re.sub(r'\b(upper|capital|hoofdletter)\s+' + word + r'\b', lambda m, l=letter: l.upper(), command, flags=re.IGNORECASE)
-            command = re.sub(r'\b(lower|kleine)\s+' + word + r'\b', lambda m, l=letter: l, command, flags=re.IGNORECASE)
-        for word, letter in nato.items():
-            command = re.sub(r'\bletter\s+' + word + r'\b', lambda m, l=letter: l, command, flags=re.IGNORECASE)
-        command = re.sub(r'\b(upper|capital|hoofdletter)\s+([a-z])\b', lambda m: m.group(2).upper(), command, flags=re.IGNORECASE)
-        command = re.sub(r'\b(lower|kleine)\s+([a-z])\b', lambda m: m.group(2).lower(), command, flags=re.IGNORECASE)
-        # Numbers
-        number_words = {
-            "zero": "0", "nul": "0", "one": "1", "een": "1", "two": "2", "twee": "2",
-            "three": "3", "drie": "3", "four": "4", "vier": "4", "five": "5", "vijf": "5",
-            "six": "6", "zes": "6", "seven": "7", "zeven": "7", "eight": "8", "acht": "8",
-            "nine": "9", "negen": "9"
-        }
-        for word, digit in number_words.items():
-            command = re.sub(r'\b(number|digit|cijfer)\s+' + word + r'\b', lambda m, d=digit: d, command, flags=re.IGNORECASE)
-        command = re.sub(r'\b(number|digit|cijfer)\s+(\d)\b', lambda m: m.group(2), command, flags=re.IGNORECASE)
-        # Symbols for commands
-        cmd_symbols = {
-            "hyphen": "-", "dash": "-", "min": "-",
-            "underscore": "_", "liggend streepje": "_",
-            "slash": "/", "schuine streep": "/",
-            "backslash": "\\",
-            "dot": ".", "period": ".", "punt": ".",
-            "space": " ", "spatie": " ",
-        }
-        for word, symbol in cmd_symbols.items():
-            command = re.sub(r'\b' + word + r'\b', lambda m, s=symbol: s, command, flags=re.IGNORECASE)
-
-        # Convert common Linux commands to lowercase (Whisper often capitalizes them)
-        linux_commands = [
-            "ls", "cd", "pwd", "cat", "grep", "find", "rm", "cp", "mv", "mkdir", "rmdir",
-            "chmod", "chown", "sudo", "apt", "pip", "python", "python3", "git", "docker",
-            "ssh", "scp", "curl", "wget", "tar", "zip", "unzip", "nano", "vim", "vi",
-            "echo", "touch", "head", "tail", "less", "more", "man", "which", "whereis",
-            "ps", "top", "htop", "kill", "killall", "df", "du", "free", "uname", "whoami",
-            "hostname", "ifconfig", "ip", "ping", "netstat", "ss", "systemctl", "journalctl",
-            "make", "cmake", "gcc", "g++", "npm", "node", "yarn", "cargo", "rustc",
-        ]
+        # Case instructions, then NATO/letter/number spelling (same tables as dictation)
+        command = _CASE_RE.sub(_apply_case, command)
+        command = _SPELL_RE.sub(_spell, command)
+        # Symbols for commands, in one scan
+        command = _CMD_SYMBOLS_RE.sub(_replace_cmd_symbol, command)
+
         # Convert first word (command name) to lowercase if it's a known command
-        words = command.split()
-        if words:
-            first_word_lower = words[0].lower()
-            if first_word_lower in linux_commands:
-                words[0] = first_word_lower
-                command = ' '.join(words)
+        # (Whisper often capitalizes them)
+        command = _LINUX_CMD_RE.sub(lambda m: m.group(0).lower(), command, count=1)
 
         # Filter non-ASCII and punctuation for TTS
-        command_safe = ''.join(c for c in command if ord(c) < 128 and c not in '.?!,;:')
-        command_safe = command_safe.strip()
+        command_safe = command.encode("ascii", "ignore").decode().translate(_TTS_PUNCT_DELETE).strip()
         print(cmd(f"Command requested: {command}"))
 
         if not command_safe:
@@ -1023,20 +1257,20 @@ def _handle_terminal(selected_device, samplerate):
             return
 
         speak(f"Run {command_safe}, yes or no?")
-        confirm = whisper_speech_to_text(selected_device, samplerate).strip().lower()
+        confirm = _stt().whisper_speech_to_text(selected_device, samplerate).strip().lower()
 
         # Check for confirm/deny intent
         confirmed = False
         if use_voice2json:
-            intent = recognize_intent(confirm, language="auto")
+            intent = _v2j().recognize_intent(confirm, language="auto")
             if intent["action"] == "confirm":
                 confirmed = True
             elif intent["action"] == "deny":
-                speak("Cancelled.")
+                speak("Cancelled.", wait=False)
                 return
 
         # Fallback keyword check
-        if not confirmed and any(w in confirm for w in ["yes", "ja", "yep", "do it", "go ahead"]):
+        if not confirmed and _YES_FALLBACK_RE.search(confirm):
             confirmed = True
 
         if confirmed:
@@ -1048,14 +1282,12 @@ def _handle_terminal(selected_device, samplerate):
                 if use_new_window:
                     # Run in a new terminal window (stays open for 30 sec or until keypress)
                     wrapped_cmd = f'bash -c "{command}; echo; echo Press Enter to close...; read"'
-                    # Try different terminal emulators
-                    for term in ["gnome-terminal --", "xterm -e", "konsole -e", "xfce4-terminal -e"]:
-                        try:
-                            subprocess.Popen(f'{term} {wrapped_cmd}', shell=True)
-                            speak(f"Running {command_safe} in new terminal.")
-                            break
-                        except:
-                            continue
+                    term = _first_installed(tuple(_TERMINAL_EMULATORS))
+                    if term is None:
+                        speak("No terminal emulator found.")
+                    else:
+                        subprocess.Popen(f'{term} {_TERMINAL_EMULATORS[term]} {wrapped_cmd}', shell=True)
+                        speak(f"Running {command_safe} in new terminal.")
                 else:
                     # Run in same terminal, capture output
                     result = subprocess.run(command, shell=True, capture_output=True, text=True, timeout=30)
@@ -1081,7 +1313,7 @@ def _handle_terminal(selected_device, samplerate):
             except Exception as e:
                 speak(f"Error: {str(e)}")
         else:
-            speak("Cancelled.")
+            speak("Cancelled.", wait=False)
 
 
 def process_voice_command(transcription, selected_device, samplerate):
@@ -1090,18 +1322,10 @@ def process_voice_command(transcription, selected_device, samplerate):
 
     # Apply corrections from learning
     transcription = apply_corrections(transcription)
-    transcription_lower = transcription.lower().strip().rstrip('.,!?')
+    transcription_lower = transcription.lower().strip(_NORMALIZE_STRIP)
 
     # Filter hallucinations early
-    main_hallucinations = [
-        "you", "thank you", "thanks", "you you", "you you you", "the", "a", "i",
-        "um", "uh", "hmm", "ah", "eh", "mm", "oh", "yeah", "right", "okay",
-        "music", "silence", "applause", "laughter", "sorry", "i'm sorry",
-        "thank you for watching", "subscribe", "like and subscribe",
-        # Prevent yes/no loops (not meaningful commands on their own)
-        "yes", "ja", "yep", "nope", "no", "nee", "yes yes", "no no",
-    ]
-    if transcription_lower in main_hallucinations:
+    if transcription_lower in _COMMAND_HALLUCINATIONS:
         print(cmd(f"Skipped hallucination: '{transcription}'"))
         return
     # Skip very short gibberish (1-2 chars)
@@ -1110,10 +1334,11 @@ def process_voice_command(transcription, selected_device, samplerate):
         return
 
     print(cmd(f"Processing: {transcription_lower}"))
+    intents = {m.lastgroup for m in _GLOBAL_INTENT_RE.finditer(transcription_lower)}
 
     # Try voice2json intent recognition first (if enabled)
     if use_voice2json:
-        intent_result = recognize_intent(transcription_lower, language="auto")
+        intent_result = _v2j().recognize_intent(transcription_lower, language="auto")
         if intent_result["intent"]:
             print(v2j(f"Intent: {intent_result['intent']} ({intent_result['language']}) conf={intent_result['confidence']:.2f}"))
             action = intent_result["action"]
@@ -1123,8 +1348,8 @@ def process_voice_command(transcription, selected_device, samplerate):
                 _show_help()
                 return
             elif action == "clear_session":
-                clear_session()
-                speak("Session cleared.")
+                _llm().clear_session()
+                speak("Session cleared.", wait=False)
                 return
             elif action == "learn_correction":
                 _handle_learn_correction(selected_device, samplerate)
@@ -1158,12 +1383,11 @@ def process_voice_command(transcription, selected_device, samplerate):
             print(v2j(f"No intent matched, using keyword fallback"))
 
     # Learning mode triggers
-    learn_triggers = ["learn that", "correct that", "fix that", "that's wrong"]
-    if any(trigger in transcription_lower for trigger in learn_triggers):
+    if "learn" in intents:
         if _last_transcription:
             print(learn("Learning mode activated"))
             speak("What should it be?")
-            correct_phrase = whisper_speech_to_text(selected_device, samplerate).strip()
+            correct_phrase = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
             if correct_phrase:
                 add_correction(_last_transcription, correct_phrase)
                 speak(f"Got it. I'll remember that {_last_transcription} means {correct_phrase}.")
@@ -1174,7 +1398,7 @@ def process_voice_command(transcription, selected_device, samplerate):
         return
 
     # Show corrections
-    if "show corrections" in transcription_lower or "list corrections" in transcription_lower:
+    if "corrections" in intents:
         corrections = list_corrections()
         if corrections:
             speak(f"You have {len(corrections)} corrections stored.")
@@ -1183,157 +1407,104 @@ def process_voice_command(transcription, selected_device, samplerate):
         return
 
     # Clear session
-    if "clear session" in transcription_lower or "forget everything" in transcription_lower or "vergeet alles" in transcription_lower:
-        clear_session()
-        speak("Session cleared.")
+    if "session" in intents:
+        _llm().clear_session()
+        speak("Session cleared.", wait=False)
         return
 
     # Language switching - only trigger on short commands (isolated words, not in sentences)
-    word_count = len(transcription_lower.split())
+    word_count = transcription_lower.count(" ") + 1
     if word_count <= 3:  # Short command like "English" or "Speak Nederlands"
-        if any(t in transcription_lower for t in LANG_SWITCH_EN):
+        if "lang_en" in intents:
             set_language("en")
-            clear_session()  # Clear old context to prevent language mixing
+            _llm().clear_session()  # Clear old context to prevent language mixing
             speak("Switched to English voice.")
             return
-        if any(t in transcription_lower for t in LANG_SWITCH_NL):
+        if "lang_nl" in intents:
             set_language("nl")
-            clear_session()  # Clear old context to prevent language mixing
+            _llm().clear_session()  # Clear old context to prevent language mixing
             speak("Overgeschakeld naar Nederlands. Sessie gewist.")
             return
-        if any(t in transcription_lower for t in LANG_SWITCH_AUTO):
+        if "lang_auto" in intents:
             set_language(None)
             speak("Language detection is now automatic.")
             return
 
     # Help command
-    help_triggers = ["help me", "help", "what can you do", "commands", "commando's", "lijst", "list commands", "show commands", "options", "opties", "menu"]
-    if any(t in transcription_lower for t in help_triggers) or transcription_lower in ["help", "commands", "menu"]:
+    if "help" in intents:
         print(cmd(f"Matched help trigger in: '{transcription_lower}'"))
-        # Blue text: \033[94m, Reset: \033[0m
-        blue = "\033[94m"
-        reset = "\033[0m"
-        print(f"""
-{blue}╔════════════════════════════════════════════════════════════════════════════════╗
-║                              AVAILABLE COMMANDS                                ║
-╠════════════════════════════════════════════════════════════════════════════════╣
-║ 📅 CALENDAR              │ 💬 QUESTIONS            │ 🎓 LEARNING               ║
-║    • "Add to calendar"   │    • Just ask anything  │    • "Learn that"         ║
-║    • "Check my agenda"   │                         │    • "Correct that"       ║
-║    • "Remove event"      │                         │    • "Show corrections"   ║
-╠════════════════════════════════════════════════════════════════════════════════╣
-║ 🧠 SESSION               │ 💻 TERMINAL             │ ✍️ DICTATION              ║
-║    • "Clear session"     │    • "Run command"      │    • "Dictate"/"Dicteer"  ║
-║    • "Vergeet alles"     │    • "Execute"          │    • "Stop" to end        ║
-╠════════════════════════════════════════════════════════════════════════════════╣
-║ 🌐 LANGUAGE SWITCHING (say word alone, 1-3 words only)                         ║
-║    • "English" / "Nederlands" / "Dutch" - switch voice                         ║
-║    • "Auto" / "Automatisch" - auto-detect language                             ║
-║    NOTE: Won't trigger in sentences like "I want to learn English"             ║
-╠════════════════════════════════════════════════════════════════════════════════╣
-║ DICTATION GRAMMAR                                                              ║
-║ Case:    "capital X" "lowercase X" "all caps X" "hoofdletter X"                ║
-║ Punct:   "period/punt" "comma/komma" "question mark" "exclamation mark"        ║
-║ Format:  "new line" "new paragraph" "tab" "space"                              ║
-║ Symbols: "at sign" "hashtag" "slash" "underscore" "hyphen" "asterisk"          ║
-║ Brackets: "open/close parenthesis" "open/close bracket" "open/close brace"    ║
-║ Quotes:  "quote" "single quote" "aanhalingsteken" "apostrof"                   ║
-╚════════════════════════════════════════════════════════════════════════════════╝{reset}
-""")
+        _print_help(_COMMANDS_TEXT)
         if not quiet_help:
             speak("Calendar: say add to calendar, check my agenda, or remove event. Questions: just ask me anything. Learning: say learn that or correct that. Session: say clear session to forget everything.")
         return
 
     # Shutdown command
-    shutdown_triggers = [
-        "kill yourself", "shut down", "shutdown", "exit", "quit",
-        "goodbye jarvis", "bye jarvis", "stop jarvis",
-        "sluit af", "afsluiten", "stop jezelf", "doei jarvis"
-    ]
-    if any(trigger in transcription_lower for trigger in shutdown_triggers):
+    if "shutdown" in intents:
         print(cmd("Shutdown requested"))
         speak("Goodbye!", interruptable=False)
-        import sys
         sys.exit(0)
 
     # Store for potential learning
     _last_transcription = transcription
 
     # PRIORITY CHECK: Dictation mode (check BEFORE calendar to avoid "dictate" → "date" misrouting)
-    dictate_triggers = ["dictate", "diktate", "dik tate", "dicteer", "dicteren", "dictatie", "type this", "start typing"]
-    if any(w in transcription_lower for w in dictate_triggers):
+    if "dictate" in intents:
         _handle_dictation(selected_device, samplerate)
         return
 
     # PRIORITY CHECK: Terminal commands
-    terminal_triggers = ["run command", "execute", "terminal", "shell"]
-    if any(w in transcription_lower for w in terminal_triggers):
+    if "terminal" in intents:
         _handle_terminal(selected_device, samplerate)
         return
 
     # Calendar keywords (flexible matching, including common misspellings)
-    cal_words = ["calendar", "calander", "agenda", "schedule", "event", "meeting"]
-    has_cal = any(w in transcription_lower for w in cal_words)
+    has_cal = _CAL_RE.search(transcription_lower) is not None
 
-    if has_cal and any(w in transcription_lower for w in ["add", "put", "create", "new", "schedule"]):
+    if has_cal and _CAL_ADD_RE.search(transcription_lower):
         print(cmd(f"Calendar ADD matched: has_cal={has_cal}, triggers=['add','put','create','new','schedule']"))
         speak("What is the event?")
-        event_name = whisper_speech_to_text(selected_device, samplerate).strip()
+        event_name = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         speak("What time does the event start?")
-        start_time = whisper_speech_to_text(selected_device, samplerate).strip()
+        start_time = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         speak("What time does the event end?")
-        end_time = whisper_speech_to_text(selected_device, samplerate).strip()
+        end_time = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         speak("What date is the event on?")
-        event_date = whisper_speech_to_text(selected_device, samplerate).strip()
+        event_date = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         add_event_to_calendar(event_name, start_time, end_time, date=event_date)
 
-    elif has_cal and any(w in transcription_lower for w in ["what", "check", "show", "list", "today", "tomorrow"]):
+    elif has_cal and _CAL_CHECK_RE.search(transcription_lower):
         print(cmd(f"Calendar CHECK matched: has_cal={has_cal}, triggers=['what','check','show','list','today','tomorrow']"))
         speak("For which date or week?")
-        query = whisper_speech_to_text(selected_device, samplerate).strip()
-
-        if "week" in query.lower():
-            if "this week" in query.lower():
-                check_calendar(date="this week", week=True)
-            elif "next week" in query.lower():
-                check_calendar(date="next week", week=True)
-            elif "week of" in query.lower():
-                specific_week_start = query.lower().replace("week of", "").strip()
-                check_calendar(specific_week_start=specific_week_start, week=True)
-            else:
-                speak("I couldn't understand the week query.")
+        query = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
+
+        valid, error_msg = _validate_date_or_week(query)
+        if valid:
+            _dispatch_week(query, check_calendar)
         else:
-            check_calendar(date=query)
+            speak(error_msg)
 
-    elif has_cal and any(w in transcription_lower for w in ["clear", "delete all", "remove all", "empty"]):
+    elif has_cal and _CAL_CLEAR_RE.search(transcription_lower):
         print(cmd(f"Calendar CLEAR matched: has_cal={has_cal}, triggers=['clear','delete all','remove all','empty']"))
         speak("For which date or week would you like to clear?")
-        query = whisper_speech_to_text(selected_device, samplerate).strip()
-
-        if "week" in query.lower():
-            if "this week" in query.lower():
-                clear_calendar(date="this week", week=True)
-            elif "next week" in query.lower():
-                clear_calendar(date="next week", week=True)
-            elif "week of" in query.lower():
-                specific_week_start = query.lower().replace("week of", "").strip()
-                clear_calendar(date=specific_week_start, week=True)
-            else:
-                speak("I couldn't understand the week query.")
+        query = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
+
+        valid, error_msg = _validate_date_or_week(query)
+        if valid:
+            _dispatch_week(query, clear_calendar)
         else:
-            clear_calendar(date=query)
+            speak(error_msg)
 
-    elif has_cal and any(w in transcription_lower for w in ["remove", "delete", "cancel"]):
+    elif has_cal and _CAL_REMOVE_RE.search(transcription_lower):
         print(cmd(f"Calendar REMOVE matched: has_cal={has_cal}, triggers=['remove','delete','cancel']"))
         speak("What is the name of the event to remove?")
-        event_name = whisper_speech_to_text(selected_device, samplerate).strip()
+        event_name = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         speak("What date is this event on?")
-        event_date = whisper_speech_to_text(selected_device, samplerate).strip()
+        event_date = _stt().whisper_speech_to_text(selected_device, samplerate).strip()
 
         remove_event(event_name, event_date)
 
@@ -1345,12 +1516,44 @@ def process_voice_command(transcription, selected_device, samplerate):
             print(cmd(f"OLLAMA fallback: '{transcription[:LOG_CMD_LENGTH]}...'"))
         else:
             print(cmd(f"OLLAMA fallback: '{transcription}'"))
-        interrupted = ask_ollama(transcription)  # Use original case for Ollama
+        interrupted = _llm().ask_ollama(transcription)  # Use original case for Ollama
         if interrupted:
             print(cmd("Response interrupted - returning to listen"))
             speak("Okay.", interruptable=False)
 
+_PENDING_CANCEL_RE = _keyword_re(["no", "nee", "cancel", "annuleer", "stop", "never mind", "laat maar"])
+_CONFIRM_WORDS = frozenset(CALENDAR_CONFIRM_WORDS)
+
+
+def _resolve_pending_calendar(reply):
+    """Handle a reply while a calendar event waits for confirmation.
+
+    A plain yes adds the event directly; anything else but a cancel goes to
+    Ollama (which answers with [CALENDAR_CONFIRM] or changes the event).
+    Returns False if the event was cancelled.
+    """
+    reply_lower = reply.lower().strip(_NORMALIZE_STRIP)
+    if _PENDING_CANCEL_RE.search(reply_lower):
+        _llm().clear_pending_calendar()
+        speak("Okay, cancelled.", wait=False)
+        return False
+
+    words = {w.strip(_NORMALIZE_STRIP) for w in reply_lower.split()}
+    if words and words <= _CONFIRM_WORDS:
+        added = _get_prompt("event_added")
+        if _llm().confirm_pending_event(reply, added):
+            speak(added, wait=False)
+            return True
+
+    print(f"Confirmation: {reply}")
+    _llm().ask_ollama(reply)
+    return True
+
+
 def main():
+    import argparse
+    import time
+
     parser = argparse.ArgumentParser(description='Assistmint Voice Assistant')
     parser.add_argument('--model', '-m', help='Ollama model to use (skip selection)')
     parser.add_argument('--device', '-d', type=int, help='Audio device index (skip selection)')
@@ -1364,21 +1567,26 @@ def main():
 
     # Select or set Ollama model
     if args.model:
-        set_model(args.model)
+        _llm().set_model(args.model)
     else:
-        select_ollama_model()
+        _llm().select_ollama_model()
 
     # Load session history
-    load_session()
+    _llm().load_session()
+
+    # Load Whisper and the Piper voices while the user picks a microphone
+    if WARMUP_MODELS:
+        _stt().warmup()
+        _tts_warmup()
 
     # Select microphone
-    input_devices = list_microphones()
+    input_devices = _stt().list_microphones()
     if args.device is not None:
         selected_device = input_devices[args.device]
         samplerate = selected_device['default_samplerate']
         print(f"Using device {args.device}: {selected_device['name']} ({samplerate} Hz)")
     else:
-        selected_device, samplerate = select_microphone_and_samplerate(input_devices)
+        selected_device, samplerate = _stt().select_microphone_and_samplerate(input_devices)
 
     # Determine mode
     if args.voice:
@@ -1394,7 +1602,10 @@ def main():
 
         if mode == "voice":
             # Initialize wake word detection
-            init_wake_word()
+            _wake().init_wake_word()
+            # Load Whisper now so the first command after the wake word doesn't
+            # wait for it; the module keeps it for the rest of the process
+            _stt().init_whisper()
             print("\n" + "="*50)
             print("Voice mode active - say 'Hey Jarvis' to wake me up!")
             print("="*50 + "\n")
@@ -1402,7 +1613,7 @@ def main():
             voice_loop = True
             while voice_loop:
                 # Low-power wake word listening
-                detected = listen_for_wake_word(selected_device, samplerate)
+                detected = _wake().listen_for_wake_word(selected_device, samplerate)
                 if detected is None:
                     # Error occurred, wait before retry
                     time.sleep(1)
@@ -1413,27 +1624,18 @@ def main():
 
                     # Get the actual command with extended listening
                     print("Listening for your command...")
-                    transcription = whisper_speech_to_text(selected_device, samplerate, extended_listen=True)
+                    transcription = _stt().whisper_speech_to_text(selected_device, samplerate, extended_listen=True)
 
                     if transcription:
                         print(f"Command: {transcription}")
                         process_voice_command(transcription, selected_device, samplerate)
 
                     # Check if calendar confirmation is pending - keep listening without wake word
-                    while has_pending_calendar():
+                    while _llm().has_pending_calendar():
                         print(cmd("Waiting for calendar confirmation... (say ja/yes or nee/no)"))
-                        confirm_transcription = whisper_speech_to_text(selected_device, samplerate)
-                        if confirm_transcription:
-                            confirm_lower = confirm_transcription.lower().strip().rstrip('.,!?')
-                            # Check for cancel words
-                            cancel_words = ["no", "nee", "cancel", "annuleer", "stop", "never mind", "laat maar"]
-                            if any(w in confirm_lower for w in cancel_words):
-                                clear_pending_calendar()
-                                speak("Okay, cancelled.")
-                                break
-                            # Otherwise send to Ollama (it will detect [CALENDAR_CONFIRM] in response)
-                            print(f"Confirmation: {confirm_transcription}")
-                            ask_ollama(confirm_transcription)
+                        confirm_transcription = _stt().whisper_speech_to_text(selected_device, samplerate)
+                        if confirm_transcription and not _resolve_pending_calendar(confirm_transcription):
+                            break
 
                     print("\n💤 Back to sleep... say 'Hey Jarvis' to wake me up\n")
 
@@ -1456,17 +1658,10 @@ def main():
                     process_voice_command(command, selected_device, samplerate)
 
                     # Check if calendar confirmation is pending
-                    while has_pending_calendar():
+                    while _llm().has_pending_calendar():
                         confirm = input("Confirm (ja/yes or nee/no): ").strip()
-                        if not confirm:
-                            continue
-                        confirm_lower = confirm.lower().rstrip('.,!?')
-                        cancel_words = ["no", "nee", "cancel", "annuleer", "stop", "never mind", "laat maar"]
-                        if any(w in confirm_lower for w in cancel_words):
-                            clear_pending_calendar()
-                            speak("Okay, cancelled.")
+                        if confirm and not _resolve_pending_calendar(confirm):
                             break
-                        ask_ollama(confirm)
 
         else:
             print("Invalid mode selected. Please choose 'voice' or 'type'.")
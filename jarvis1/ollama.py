@@ -1,21 +1,118 @@
 import requests
+from requests.adapters import HTTPAdapter
+import atexit
 import json
 import os
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from text_to_speech import speak, get_language
+from text_to_speech import speak, speak_async, get_language, detect_language
 from colors import session
-from config import SYSTEM_PROMPT, SYSTEM_PROMPT_NL, MAX_TOKENS, MAX_MESSAGES, TEMPERATURE, TOP_P, FREQUENCY_PENALTY, PRESENCE_PENALTY, VERBOSE_SESSION, DEBUG_API, SESSION_ENABLED, DEFAULT_MODEL
+from config import SYSTEM_PROMPT, SYSTEM_PROMPT_NL, MAX_TOKENS, MAX_MESSAGES, TEMPERATURE, TOP_P, FREQUENCY_PENALTY, PRESENCE_PENALTY, VERBOSE_SESSION, DEBUG_API, SESSION_ENABLED, DEFAULT_MODEL, OLLAMA_STREAM, MAX_PROMPT_TOKENS, PARSE_MODEL, PARSE_MODEL_KEEP_ALIVE, OLLAMA_API_URL
+
+# orjson is much faster on long histories; stdlib json works the same
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj):
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+OLLAMA_CHAT_URL = f"{OLLAMA_API_URL}/v1/chat/completions"
+OLLAMA_TAGS_URL = f"{OLLAMA_API_URL}/api/tags"
+OLLAMA_PS_URL = f"{OLLAMA_API_URL}/api/ps"
+OLLAMA_GEN_URL = f"{OLLAMA_API_URL}/api/generate"
+
+# One keep-alive HTTP session for all Ollama calls (no new TCP connection per request)
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=2, pool_maxsize=4, max_retries=0))
 
 # Global variable to store selected model (uses config default)
 selected_model = DEFAULT_MODEL
 
 # Session memory
 SESSION_FILE = os.path.expanduser("~/.assistmint_session.json")
-messages = []
+# Rolling window (0 = unlimited); the deque drops the oldest message itself
+_MAXLEN = MAX_MESSAGES if MAX_MESSAGES > 0 else None
+messages = deque(maxlen=_MAXLEN)
+# Reused request list: system prompt slot + history, refilled in place each turn
+_payload_messages = [{"role": "system", "content": ""}]
 
 # Pending calendar event (waiting for confirmation)
 _pending_calendar_event = None
 
+# Calendar blocks the LLM embeds in its answer
+_CALENDAR_MARK = "[CALENDAR_"
+_RE_PENDING = re.compile(r'\[CALENDAR_PENDING\]\s*(\{.*?\})\s*\[/CALENDAR_PENDING\]', re.DOTALL)
+_RE_ADD = re.compile(r'\[CALENDAR_ADD\]\s*(\{.*?\})\s*\[/CALENDAR_ADD\]', re.DOTALL)
+_RE_BLANKS = re.compile(r'\n\s*\n')
+
+
+def _extract_block(text, tag):
+    """Return the JSON object inside [tag]...[/tag], or None.
+
+    Plain find() plus a brace counter that skips quoted strings; the compiled
+    pattern is the fallback when the scanned object doesn't parse.
+    """
+    start = text.find(f"[{tag}]")
+    if start < 0:
+        return None
+    start += len(tag) + 2
+    end = text.find(f"[/{tag}]", start)
+    if end < 0:
+        return None
+    body = text[start:end]
+    first = body.find("{")
+    if first >= 0:
+        depth = 0
+        in_string = escaped = False
+        for i in range(first, len(body)):
+            c = body[i]
+            if in_string:
+                if escaped:
+                    escaped = False
+                elif c == "\\":
+                    escaped = True
+                elif c == '"':
+                    in_string = False
+            elif c == '"':
+                in_string = True
+            elif c == "{":
+                depth += 1
+            elif c == "}":
+                depth -= 1
+                if depth == 0:
+                    block = body[first:i + 1]
+                    try:
+                        _loads(block)
+                        return block
+                    except ValueError:
+                        break
+    match = (_RE_PENDING if tag == "CALENDAR_PENDING" else _RE_ADD).search(text)
+    return match.group(1) if match else None
+
+
+_MM = [f"{m:02d}" for m in range(60)]  # Zero-padded minutes
+
+
+def _to_12h(t):
+    """Convert "HH:MM" (24h) to "H:MM AM/PM" for the calendar functions."""
+    h, m = map(int, t.split(":"))
+    period = "AM" if h < 12 else "PM"
+    return f"{h % 12 or 12}:{_MM[m]} {period}"
+
+
+def _end_time_from_start(t):
+    """Default end time: one hour after a "HH:MM" start."""
+    h, m = map(int, t.split(":"))
+    return f"{(h + 1) % 24:02d}:{_MM[m]}"
+
 
 def has_pending_calendar():
     """Check if there's a calendar event waiting for confirmation."""
@@ -31,29 +128,77 @@ def load_session():
     """Load session from JSON file."""
     global messages
     if not SESSION_ENABLED:
-        messages = []
+        messages = deque(maxlen=_MAXLEN)
         return messages
     if os.path.exists(SESSION_FILE):
         try:
-            with open(SESSION_FILE, 'r') as f:
-                messages = json.load(f)
+            with open(SESSION_FILE, 'rb') as f:
+                messages = deque(_loads(f.read()), maxlen=_MAXLEN)
             if VERBOSE_SESSION:
                 print(session(f"Loaded {len(messages)} messages"))
         except:
-            messages = []
+            messages = deque(maxlen=_MAXLEN)
     return messages
 
+_save_lock = threading.Lock()  # One writer of SESSION_FILE at a time
+
+
 def save_session():
-    """Save session to JSON file."""
+    """Save session to JSON file (compact, via temp file so a crash can't truncate it)."""
+    if not SESSION_ENABLED:
+        return
+    with _save_lock:
+        tmp = SESSION_FILE + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(_dumps(list(messages)))
+        os.replace(tmp, SESSION_FILE)
+
+
+# Background session saving: replies return without waiting on disk I/O
+_save_event = threading.Event()
+_save_thread = None
+
+
+def _save_worker():
+    while True:
+        _save_event.wait()
+        time.sleep(0.2)  # Coalesce back-to-back turns into one write
+        _save_event.clear()
+        try:
+            save_session()
+        except Exception as e:  # Keep the worker alive for later turns
+            print(session(f"Save failed: {e}"))
+
+
+def _schedule_save():
+    """Save the session soon on the background thread (at most one write in flight)."""
+    global _save_thread
     if not SESSION_ENABLED:
         return
-    with open(SESSION_FILE, 'w') as f:
-        json.dump(messages, f, indent=2)
+    if _save_thread is None or not _save_thread.is_alive():
+        _save_thread = threading.Thread(target=_save_worker, name="session-save", daemon=True)
+        _save_thread.start()
+    _save_event.set()
+
+
+@atexit.register
+def _flush_session():
+    """Write the session before the interpreter exits.
+
+    Saves whenever background saving was used: the worker may have cleared
+    the event and be mid-write, and save_session() waits on _save_lock for it.
+    """
+    if _save_thread is not None:
+        _save_event.clear()
+        try:
+            save_session()
+        except Exception as e:
+            print(session(f"Save failed: {e}"))
+
 
 def clear_session():
     """Clear session history."""
-    global messages
-    messages = []
+    messages.clear()
     save_session()
     if VERBOSE_SESSION:
         print(session("Cleared"))
@@ -61,9 +206,9 @@ def clear_session():
 def list_ollama_models():
     """Fetch available models from Ollama."""
     try:
-        response = requests.get("http://localhost:11434/api/tags")
+        response = _SESSION.get(OLLAMA_TAGS_URL, timeout=(3.05, 10))
         if response.status_code == 200:
-            models = response.json().get("models", [])
+            models = _loads(response.content).get("models", [])
             return [m["name"] for m in models]
     except requests.ConnectionError:
         print("Could not connect to Ollama. Make sure it's running.")
@@ -74,21 +219,26 @@ def unload_ollama_model():
     """Tell Ollama to unload ALL loaded models from VRAM immediately."""
     try:
         # Get list of currently loaded models
-        ps_response = requests.get("http://localhost:11434/api/ps", timeout=5)
+        ps_response = _SESSION.get(OLLAMA_PS_URL, timeout=5)
         if ps_response.status_code == 200:
-            loaded = ps_response.json().get("models", [])
+            loaded = _loads(ps_response.content).get("models", [])
             if not loaded:
                 return
-            # Unload each loaded model
-            for model_info in loaded:
-                model_name = model_info.get("name", "")
-                if model_name:
-                    requests.post(
-                        "http://localhost:11434/api/generate",
-                        json={"model": model_name, "keep_alive": 0, "prompt": ""},
-                        timeout=5
-                    )
-                    print(session(f"[VRAM] Unloaded {model_name}"))
+            names = [m["name"] for m in loaded if m.get("name")]
+            if not names:
+                return
+
+            def unload(model_name):
+                _SESSION.post(
+                    OLLAMA_GEN_URL,
+                    json={"model": model_name, "keep_alive": 0, "prompt": ""},
+                    timeout=5
+                )
+                print(session(f"[VRAM] Unloaded {model_name}"))
+
+            # Unload all loaded models at once (wait ~ slowest, not the sum)
+            with ThreadPoolExecutor(max_workers=min(4, len(names))) as ex:
+                list(ex.map(unload, names))
     except Exception as e:
         print(session(f"[VRAM] Unload failed: {e}"))
 
@@ -124,19 +274,66 @@ def select_ollama_model():
     print(f"Selected model: {selected_model}\n")
     return selected_model
 
+# System prompts per language for _prompt_cache_date - the text only changes at midnight
+_PROMPT_CACHE = {}
+_prompt_cache_date = None
+
+
 def _get_system_prompt():
     """Get system prompt based on current language setting."""
+    global _prompt_cache_date
     lang = get_language()
+    today = datetime.now().date()
+    if today != _prompt_cache_date:
+        _PROMPT_CACHE.clear()  # Drop yesterday's prompts
+        _prompt_cache_date = today
+    prompt = _PROMPT_CACHE.get(lang)
+    if prompt is None:
+        # Add today's date to the prompt
+        if lang == "nl":
+            prompt = SYSTEM_PROMPT_NL + f"\n\nVandaag is {today.strftime('%A %d %B %Y')}."
+        else:
+            prompt = SYSTEM_PROMPT + f"\n\nToday is {today.strftime('%A, %B %d, %Y')}."
+        _PROMPT_CACHE[lang] = prompt
 
-    # Add today's date to the prompt
-    today = datetime.now()
-    date_info = f"\n\nToday is {today.strftime('%A, %B %d, %Y')}."
+    if VERBOSE_SESSION:
+        if lang == "nl":
+            print(session("[LLM] Using Dutch system prompt"))
+        else:
+            print(session(f"[LLM] Using English system prompt (lang={lang})"))
+    return prompt
+
+
+# Conflict checks started while the answer is still streaming, keyed by the
+# PENDING block's JSON text; the result of the last check is spoken after it
+_conflict_checks = {}
+_calendar_executor = None
+_last_conflicts = []
 
+
+def _check_conflicts(data):
+    from assistmint.calendar_manager import check_calendar_conflicts
+    return check_calendar_conflicts(data.get("date"), data.get("start"), data.get("end"))
+
+
+def _prefetch_conflicts(block):
+    """Start the conflict check for a PENDING block on the calendar worker."""
+    global _calendar_executor
+    try:
+        data = _loads(block)
+    except ValueError:
+        return  # Reported when the full response is handled
+    if _calendar_executor is None:
+        _calendar_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="calendar")
+    _conflict_checks[block] = _calendar_executor.submit(_check_conflicts, data)
+
+
+def _conflict_notice(conflicts, lang):
+    """Overlap warning in the language the answer is spoken in."""
+    names = ", ".join(conflicts)
     if lang == "nl":
-        print(session(f"[LLM] Using Dutch system prompt"))
-        return SYSTEM_PROMPT_NL + f"\n\nVandaag is {today.strftime('%A %d %B %Y')}."
-    print(session(f"[LLM] Using English system prompt (lang={lang})"))
-    return SYSTEM_PROMPT + date_info
+        return f"Let op: dit overlapt met {names}."
+    return f"Note: this overlaps with {names}."
 
 
 def _execute_calendar_action(response_text):
@@ -145,10 +342,14 @@ def _execute_calendar_action(response_text):
     Supports two-step flow: PENDING (store) -> CONFIRM (add)
     Returns True if action was handled, False otherwise.
     """
-    global _pending_calendar_event
-    import re
+    global _pending_calendar_event, _last_conflicts
 
-    print(session(f"[CALENDAR] Checking response for calendar action..."))
+    _last_conflicts = []
+    if _CALENDAR_MARK not in response_text:
+        return False
+
+    if VERBOSE_SESSION:
+        print(session("[CALENDAR] Checking response for calendar action..."))
 
     # Check for CONFIRM (user said yes to pending event)
     if "[CALENDAR_CONFIRM]" in response_text and _pending_calendar_event:
@@ -157,43 +358,45 @@ def _execute_calendar_action(response_text):
         return True
 
     # Check for PENDING (new event waiting for confirmation)
-    pattern = r'\[CALENDAR_PENDING\]\s*(\{.*?\})\s*\[/CALENDAR_PENDING\]'
-    match = re.search(pattern, response_text, re.DOTALL)
+    match = _extract_block(response_text, "CALENDAR_PENDING")
 
-    print(session(f"[CALENDAR] Looking for PENDING block... found={match is not None}"))
-    if not match:
-        # Debug: show first 200 chars of response
-        print(session(f"[CALENDAR] Response preview: {response_text[:200]}..."))
+    if VERBOSE_SESSION:
+        print(session(f"[CALENDAR] Looking for PENDING block... found={match is not None}"))
+        if not match:
+            # Debug: show first 200 chars of response
+            print(session(f"[CALENDAR] Response preview: {response_text[:200]}..."))
 
     if match:
         try:
-            data = json.loads(match.group(1))
-            print(session(f"[CALENDAR] Pending: {data}"))
+            data = _loads(match)
+            if VERBOSE_SESSION:
+                print(session(f"[CALENDAR] Pending: {data}"))
 
             # Store for later confirmation
             _pending_calendar_event = data
 
-            # Check for conflicts
-            from assistmint.calendar_manager import check_calendar_conflicts
-            conflicts = check_calendar_conflicts(data.get("date"), data.get("start"), data.get("end"))
+            # Check for conflicts (usually already running since the block streamed in)
+            prefetched = _conflict_checks.pop(match, None)
+            _conflict_checks.clear()
+            conflicts = prefetched.result() if prefetched else _check_conflicts(data)
             if conflicts:
                 print(session(f"[CALENDAR] Conflict detected: {conflicts}"))
-                # The LLM will mention this in its response
+                _last_conflicts = conflicts  # Spoken after the answer
 
             return True
 
-        except json.JSONDecodeError as e:
+        except ValueError as e:  # json and orjson decode errors
             print(session(f"[CALENDAR] JSON parse error: {e}"))
             return False
 
     # Legacy: direct [CALENDAR_ADD] (no confirmation needed)
-    pattern_add = r'\[CALENDAR_ADD\]\s*(\{.*?\})\s*\[/CALENDAR_ADD\]'
-    match_add = re.search(pattern_add, response_text, re.DOTALL)
+    match_add = _extract_block(response_text, "CALENDAR_ADD")
 
     if match_add:
         try:
-            data = json.loads(match_add.group(1))
-            print(session(f"[CALENDAR] Direct add: {data}"))
+            data = _loads(match_add)
+            if VERBOSE_SESSION:
+                print(session(f"[CALENDAR] Direct add: {data}"))
             _pending_calendar_event = data
             _add_pending_event()
             return True
@@ -229,22 +432,13 @@ def _add_pending_event():
 
         # Default end time: 1 hour after start
         if not end_time:
-            h, m = map(int, start_time.split(":"))
-            h = (h + 1) % 24
-            end_time = f"{h:02d}:{m:02d}"
-
-        # Convert 24h to 12h for calendar function
-        def to_12h(t):
-            h, m = map(int, t.split(":"))
-            period = "AM" if h < 12 else "PM"
-            h = h % 12 or 12
-            return f"{h}:{m:02d} {period}"
+            end_time = _end_time_from_start(start_time)
 
         # Add to calendar
         add_event_to_calendar_extended(
             event_name=event_name,
-            start_time=to_12h(start_time),
-            end_time=to_12h(end_time),
+            start_time=_to_12h(start_time),
+            end_time=_to_12h(end_time),
             date=date,
             location=location,
             description=description,
@@ -260,36 +454,165 @@ def _add_pending_event():
         return False
 
 
+def confirm_pending_event(reply, acknowledgement):
+    """Add the pending event for a plain yes without an LLM round trip.
+
+    The reply and the spoken acknowledgement still go into the history, so on
+    the next turn the model doesn't see its confirmation question as open and
+    propose the same event again. Returns True if the event was added.
+    """
+    if not _add_pending_event():
+        return False
+    messages.append({"role": "user", "content": reply})
+    messages.append({"role": "assistant", "content": acknowledgement})
+    _schedule_save()
+    return True
+
+
+_CALENDAR_TAGS = {
+    "[CALENDAR_ADD]": "[/CALENDAR_ADD]",
+    "[CALENDAR_PENDING]": "[/CALENDAR_PENDING]",
+    "[CALENDAR_CONFIRM]": "[/CALENDAR_CONFIRM]",
+}
+
+
 def _clean_calendar_response(response_text):
     """Remove calendar blocks from response for cleaner TTS."""
-    import re
-    # Remove all calendar-related blocks
-    clean = re.sub(r'\[CALENDAR_ADD\].*?\[/CALENDAR_ADD\]', '', response_text, flags=re.DOTALL)
-    clean = re.sub(r'\[CALENDAR_PENDING\].*?\[/CALENDAR_PENDING\]', '', clean, flags=re.DOTALL)
-    clean = re.sub(r'\[CALENDAR_CONFIRM\].*?\[/CALENDAR_CONFIRM\]', '', clean, flags=re.DOTALL)
+    if _CALENDAR_MARK not in response_text:
+        return response_text.strip()
+
+    # One pass: copy the text between blocks, skip each [TAG]...[/TAG]
+    out = []
+    pos = 0
+    i = response_text.find(_CALENDAR_MARK)
+    while i >= 0:
+        for open_tag, close_tag in _CALENDAR_TAGS.items():
+            if response_text.startswith(open_tag, i):
+                end = response_text.find(close_tag, i + len(open_tag))
+                if end >= 0:
+                    out.append(response_text[pos:i])
+                    pos = end + len(close_tag)
+                break
+        i = response_text.find(_CALENDAR_MARK, max(pos, i + 1))
+    out.append(response_text[pos:])
+
     # Clean up extra whitespace
-    clean = re.sub(r'\n\s*\n', '\n', clean).strip()
-    return clean
+    return _RE_BLANKS.sub('\n', ''.join(out)).strip()
+
+
+# Streaming: a sentence ends at .!? followed by whitespace, or at a newline
+_SENTENCE_END_RE = re.compile(r'[.!?](?=\s)|\n')
+
+
+def _speakable_length(pending):
+    """How much of the unspoken text can be spoken now.
+
+    Whole sentences only, and never past the start of a (possibly still
+    incomplete) calendar block, whose JSON must not be read out.
+    """
+    mark = pending.find(_CALENDAR_MARK)
+    if mark < 0:
+        bracket = pending.rfind("[")
+        if bracket >= 0 and _CALENDAR_MARK.startswith(pending[bracket:]):
+            mark = bracket
+    head = pending if mark < 0 else pending[:mark]
+    end = 0
+    for match in _SENTENCE_END_RE.finditer(head):
+        end = match.end()
+    return end
+
+
+def _stream_and_speak(response):
+    """Read a streamed chat completion and speak each sentence as it completes.
+
+    Sentences are queued on the TTS worker while the rest is generated.
+    Queuing stops at the first calendar block. An interrupt skips the
+    sentences already queued and closes the stream, so generation stops and
+    only the text received so far is returned.
+
+    Returns:
+        (answer, spoken, playback, lang): the full text, how many leading
+        characters were queued, the speak futures, and the language used
+    """
+    parts = []
+    answer = ""
+    spoken = 0
+    playback = []
+    stop = threading.Event()  # Set by the TTS worker when the user interrupts
+    lang = get_language()
+    holding = False  # calendar block seen
+    prefetched = False  # conflict check started for the PENDING block
+
+    # Closing releases the keep-alive connection once fully read; after an
+    # interrupt it drops the connection instead, which also stops generation
+    with response:
+        for line in response.iter_lines():
+            if stop.is_set():  # User cut us off: don't wait for the rest
+                break
+            if not line.startswith(b"data: "):
+                continue
+            data = line[6:]
+            if data == b"[DONE]":
+                continue  # Read to EOF so the connection goes back to the pool
+            try:
+                chunk = _loads(data)
+            except ValueError:  # Malformed line: skip it like a keep-alive
+                continue
+            choices = chunk.get("choices")
+            if not choices:  # Error or keep-alive chunk: nothing to speak
+                if "error" in chunk:
+                    print(f"Ollama stream error: {chunk['error']}")
+                continue
+            delta = choices[0].get("delta", {}).get("content")
+            if not delta:
+                continue
+            parts.append(delta)
+            if holding:
+                if not prefetched:
+                    block = _extract_block("".join(parts), "CALENDAR_PENDING")
+                    if block:
+                        _prefetch_conflicts(block)
+                        prefetched = True
+                continue
+
+            answer = "".join(parts)
+            pending = answer[spoken:]
+            if _CALENDAR_MARK in pending:
+                holding = True
+            end = _speakable_length(pending)
+            if end:
+                sentence = pending[:end]
+                if lang is None:  # auto mode: keep one voice for the whole answer
+                    lang = detect_language(sentence)
+                playback.append(speak_async(sentence, stop=stop, lang=lang))
+                spoken += end
+
+    return "".join(parts), spoken, playback, lang
 
 
 def ask_ollama(question):
-    """Send a question to Ollama and return the answer."""
-    global messages
+    """Send a question to Ollama and speak the answer.
 
-    # Add user message to history
+    With OLLAMA_STREAM the answer is spoken sentence by sentence while it is
+    still being generated. Returns True if the user interrupted playback.
+    """
+    # Add user message to history (deque maxlen trims to MAX_MESSAGES)
     messages.append({"role": "user", "content": question})
 
-    # Trim if over limit (0 = unlimited)
-    if MAX_MESSAGES > 0 and len(messages) > MAX_MESSAGES:
-        messages = messages[-MAX_MESSAGES:]
+    # Keep the prompt within budget: less history = less prefill per turn
+    if MAX_PROMPT_TOKENS > 0:
+        tokens = sum(len(m["content"]) // 4 for m in messages)
+        while tokens > MAX_PROMPT_TOKENS and len(messages) > 1:
+            tokens -= len(messages.popleft()["content"]) // 4
 
-    url = "http://localhost:11434/v1/chat/completions"  # Ollama API
+    _payload_messages[0]["content"] = _get_system_prompt()
+    _payload_messages[1:] = messages
+
+    url = OLLAMA_CHAT_URL
     payload = {
         "model": selected_model,  # Use selected model
-        "messages": [
-            {"role": "system", "content": _get_system_prompt()},
-        ] + messages,
-        "stream": False,
+        "messages": _payload_messages,
+        "stream": OLLAMA_STREAM,
         "max_tokens": MAX_TOKENS,
         "stop": None,
         "frequency_penalty": FREQUENCY_PENALTY,
@@ -297,34 +620,50 @@ def ask_ollama(question):
         "temperature": TEMPERATURE,
         "top_p": TOP_P
     }
-    headers = {"Content-Type": "application/json"}
 
     if DEBUG_API:
         print("API Call Information:")
         print(f"URL: {url}")
-        print(f"Headers: {headers}")
         print(f"Payload: {json.dumps(payload, indent=4)}")
 
     try:
-        response = requests.post(url, headers=headers, data=json.dumps(payload))
+        # json= sets the Content-Type header; only the connect step is bounded
+        # since long answers on slow hardware can take minutes
+        response = _SESSION.post(url, json=payload, stream=OLLAMA_STREAM, timeout=(3.05, None))
         if DEBUG_API:
             print(f"Response Status Code: {response.status_code}")
-            print(f"Response Content: {response.content.decode('utf-8')}")
+            if not OLLAMA_STREAM:
+                print(f"Response Content: {response.content.decode('utf-8')}")
 
         if response.status_code == 200:
-            answer = response.json().get("choices", [{}])[0].get("message", {}).get("content", "Sorry, I couldn't get a response.")
+            if OLLAMA_STREAM:
+                answer, spoken, playback, lang = _stream_and_speak(response)
+                if DEBUG_API:
+                    print(f"Response Content: {answer}")
+            else:
+                answer = _loads(response.content).get("choices", [{}])[0].get("message", {}).get("content")
+                spoken, playback, lang = 0, [], None
+            if not answer:
+                answer = "Sorry, I couldn't get a response."
             # Add assistant response to history
             messages.append({"role": "assistant", "content": answer})
-            save_session()
+            _schedule_save()
 
             # Check for calendar action in response
+            rest = answer[spoken:]
             calendar_result = _execute_calendar_action(answer)
             if calendar_result:
                 # Remove the JSON block from spoken response
-                clean_answer = _clean_calendar_response(answer)
-                return speak(clean_answer)
-
-            return speak(answer)
+                rest = _clean_calendar_response(rest)
+                if _last_conflicts:
+                    if lang is None:  # auto mode and nothing streamed: follow the answer
+                        lang = detect_language(rest)
+                    rest = f"{rest} {_conflict_notice(_last_conflicts, lang)}"
+
+            # Speak whatever was not streamed (unless the user cut us off)
+            if any(f.result() for f in playback):
+                return True
+            return speak(rest, lang=lang)
         else:
             speak("An error occurred while trying to communicate with Ollama.", interruptable=False)
             return False
@@ -332,7 +671,7 @@ def ask_ollama(question):
         print("Connection error: Unable to reach the Ollama API.")
         speak("Please make sure Ollama is running.", interruptable=False)
         return False
-    except requests.RequestException as e:
+    except (requests.RequestException, ValueError) as e:  # ValueError: body isn't valid JSON
         print(f"API request failed: {e}")
         speak("An error occurred while trying to communicate with Ollama.", interruptable=False)
         return False
@@ -375,35 +714,27 @@ IMPORTANT - Dutch time conventions:
 
 JSON response:"""
 
-    url = "http://localhost:11434/v1/chat/completions"
-    # Use a capable model for parsing (qwen2.5:7b is better at Dutch time conventions)
-    parse_model = "qwen2.5:7b"
+    url = OLLAMA_CHAT_URL
     payload = {
-        "model": parse_model,
+        "model": PARSE_MODEL,
         "messages": [{"role": "user", "content": prompt}],
         "stream": False,
-        "max_tokens": 200,
+        "keep_alive": PARSE_MODEL_KEEP_ALIVE,  # Stay loaded between confirmations
+        "response_format": {"type": "json_object"},  # Constrained decoding: always valid JSON
+        "max_tokens": 120,  # The event object is well under this
         "temperature": 0.1,  # Low temperature for consistent parsing
     }
 
     try:
         # Longer timeout for first request (model loading)
-        response = requests.post(url, json=payload, timeout=60)
+        response = _SESSION.post(url, json=payload, timeout=60)
         if response.status_code == 200:
-            answer = response.json().get("choices", [{}])[0].get("message", {}).get("content", "")
-
-            # Try to parse JSON from response
-            answer = answer.strip()
-            # Remove markdown code blocks if present
-            if answer.startswith("```"):
-                answer = answer.split("```")[1]
-                if answer.startswith("json"):
-                    answer = answer[4:]
-            answer = answer.strip()
+            answer = _loads(response.content).get("choices", [{}])[0].get("message", {}).get("content", "")
 
             try:
-                data = json.loads(answer)
-                print(session(f"[LLM Parse] {data}"))
+                data = _loads(answer)
+                if VERBOSE_SESSION:
+                    print(session(f"[LLM Parse] {data}"))
                 return data
             except json.JSONDecodeError:
                 print(session(f"[LLM Parse] Failed to parse JSON: {answer}"))
@@ -444,19 +775,11 @@ def smart_add_calendar(text):
 
     # Default end time: 1 hour after start
     if not end_time:
-        hour, minute = map(int, start_time.split(":"))
-        hour = (hour + 1) % 24
-        end_time = f"{hour:02d}:{minute:02d}"
+        end_time = _end_time_from_start(start_time)
 
     # Convert 24h time to 12h for add_event_to_calendar
-    def to_12h(time_str):
-        h, m = map(int, time_str.split(":"))
-        period = "AM" if h < 12 else "PM"
-        h = h % 12 or 12
-        return f"{h}:{m:02d} {period}"
-
-    start_12h = to_12h(start_time)
-    end_12h = to_12h(end_time)
+    start_12h = _to_12h(start_time)
+    end_12h = _to_12h(end_time)
 
     add_event_to_calendar(event_name, start_12h, end_12h, date)
     return True
@@ -1,12 +1,18 @@
 import sounddevice as sd
-import queue
+import math
+import re
+import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import noisereduce as nr
 from config import (SILENCE_SKIP_DB, SPEECH_START_DB, SILENCE_DROP_DB, SILENCE_DURATION,
                     SILENCE_DURATION_EXT, WHISPER_MODEL, WHISPER_BEAM_SIZE,
                     WHISPER_SAMPLE_RATE, STT_BLOCKSIZE, USE_GPU, GPU_DEVICE_ID,
-                    WHISPER_COMPUTE_TYPE, NOISE_REDUCE)
+                    WHISPER_COMPUTE_TYPE, WHISPER_COMPUTE_TYPE_CPU, NOISE_REDUCE,
+                    NOISE_REDUCE_GPU, NOISE_REDUCE_STRENGTH, STT_SPECULATIVE_DECODE,
+                    WHISPER_BATCH_SIZE, WHISPER_BATCH_MIN_SECONDS)
 from colors import stt
 
 # Lazy load - deferred to avoid startup delay
@@ -15,6 +21,8 @@ _device_index = 0
 _compute_type = None
 _whisper_model = None
 _WhisperModel = None
+_whisper_lock = threading.Lock()  # Startup warm-up and first request may race
+_batched_pipeline = None
 
 def _select_best_gpu():
     """Auto-select GPU with most VRAM, or use configured GPU_DEVICE_ID."""
@@ -61,23 +69,28 @@ def get_device():
                     _compute_type = WHISPER_COMPUTE_TYPE
                 else:
                     print(stt("GPU requested but CUDA not available - using CPU"))
-                    _device, _device_index, _compute_type = "cpu", 0, "int8"
+                    _device, _device_index, _compute_type = "cpu", 0, WHISPER_COMPUTE_TYPE_CPU
             except ImportError:
                 print(stt("GPU requested but torch not found - using CPU"))
-                _device, _device_index, _compute_type = "cpu", 0, "int8"
+                _device, _device_index, _compute_type = "cpu", 0, WHISPER_COMPUTE_TYPE_CPU
             except Exception as e:
                 print(stt(f"GPU init failed ({e}) - using CPU"))
-                _device, _device_index, _compute_type = "cpu", 0, "int8"
+                _device, _device_index, _compute_type = "cpu", 0, WHISPER_COMPUTE_TYPE_CPU
         else:
             print(stt("Using CPU (GPU disabled in config)"))
-            _device, _device_index, _compute_type = "cpu", 0, "int8"
+            _device, _device_index, _compute_type = "cpu", 0, WHISPER_COMPUTE_TYPE_CPU
     return _device, _device_index, _compute_type
 
 def init_whisper(model_size=None):
     """Initialize Whisper model. Sizes: tiny, base, small, medium, large-v2"""
-    global _whisper_model, _WhisperModel
     if model_size is None:
         model_size = WHISPER_MODEL
+    with _whisper_lock:
+        return _load_whisper(model_size)
+
+
+def _load_whisper(model_size):
+    global _whisper_model, _WhisperModel
     if _whisper_model is None:
         # Lazy import
         if _WhisperModel is None:
@@ -87,18 +100,39 @@ def init_whisper(model_size=None):
 
         device, device_index, compute_type = get_device()
         print(stt(f"Loading Whisper model '{model_size}' on {device} (GPU {device_index})..."))
-        _whisper_model = _WhisperModel(model_size, device=device, device_index=device_index, compute_type=compute_type)
+        try:
+            _whisper_model = _WhisperModel(model_size, device=device, device_index=device_index, compute_type=compute_type)
+        except ValueError as e:
+            # Quantized type not supported by this device/CTranslate2 build
+            print(stt(f"Compute type '{compute_type}' unavailable ({e}) - using default"))
+            _whisper_model = _WhisperModel(model_size, device=device, device_index=device_index, compute_type="default")
         print(stt("Whisper ready!"))
     return _whisper_model
 
+def _get_batched_pipeline(model):
+    """Batched wrapper around the loaded model (created on first long recording)."""
+    global _batched_pipeline
+    if _batched_pipeline is None:
+        from faster_whisper import BatchedInferencePipeline
+        _batched_pipeline = BatchedInferencePipeline(model=model)
+    return _batched_pipeline
+
+
+# PortAudio device enumeration takes ~50-100 ms; reuse it for a few seconds
+_DEVICES_TTL = 5.0
+_devices_cache = {'ts': 0.0, 'val': None}
+
+
+def _query_devices():
+    now = time.monotonic()
+    if _devices_cache['val'] is None or now - _devices_cache['ts'] >= _DEVICES_TTL:
+        _devices_cache.update(ts=now, val=sd.query_devices())
+    return _devices_cache['val']
+
+
 def list_microphones():
-    devices = sd.query_devices()
-    input_devices = []
-    for i, device in enumerate(devices):
-        if device['max_input_channels'] > 0:
-            dev = dict(device)
-            dev['index'] = i
-            input_devices.append(dev)
+    input_devices = [{**dict(device), 'index': i} for i, device in enumerate(_query_devices())
+                     if device['max_input_channels'] > 0]
     for i, device in enumerate(input_devices):
         print(f"{i}: {device['name']} (device {device['index']})")
     return input_devices
@@ -118,20 +152,198 @@ def select_microphone_and_samplerate(input_devices):
     print(f"Sample rate: {samplerate} Hz")
     return selected_device, samplerate
 
+# Whisper sometimes hallucinates in other scripts: Devanagari (Hindi), Chinese,
+# Arabic, Cyrillic, Japanese kana and Korean are stripped from the transcript
+_LEADING_NONASCII_RE = re.compile(r'^[^\x00-\x7F]+\s*')
+_NON_LATIN_RE = re.compile(r'[\u0900-\u097F\u4E00-\u9FFF\u0600-\u06FF\u0400-\u04FF\u3040-\u30FF\uAC00-\uD7AF]+')
+_WS_RE = re.compile(r'\s+')
+
+# dB meter bars for 0..20 filled cells (one per 3 dB from -60 dB)
+_METER_BARS = ['█' * k + '░' * (20 - k) for k in range(21)]
+
+
+def _block_db(data):
+    """Level of an audio block in dB (-60 for silence)."""
+    flat = data.ravel()
+    if flat.size == 0:
+        return -60.0
+    rms = math.sqrt(float(np.dot(flat, flat)) / flat.size)  # dot: no squared temporary
+    return 20.0 * math.log10(rms) if rms > 1e-10 else -60.0
+
+
+_DENOISE_FFT = 512
+_DENOISE_HOP = 256
+_DENOISE_NOISE_QUANTILE = 0.1  # Per-bin noise floor: quiet frames anywhere in the capture
+
+
+def _denoise_gpu(audio_16k, device_index):
+    """Spectral subtraction on the GPU: one STFT/ISTFT instead of noisereduce on the CPU.
+
+    The noise floor is a low percentile of each frequency bin over the whole
+    capture, so a recording that starts with speech doesn't subtract itself.
+    """
+    import torch
+    device = torch.device("cuda", device_index)
+    window = torch.hann_window(_DENOISE_FFT, device=device)
+    x = torch.from_numpy(audio_16k).to(device)
+    spec = torch.stft(x, _DENOISE_FFT, _DENOISE_HOP, _DENOISE_FFT, window, return_complex=True)
+    mag = spec.abs()
+    noise = torch.quantile(mag, _DENOISE_NOISE_QUANTILE, dim=1, keepdim=True)
+    mag = (mag - NOISE_REDUCE_STRENGTH * noise).clamp_min(0)
+    y = torch.istft(torch.polar(mag, spec.angle()), _DENOISE_FFT, _DENOISE_HOP, _DENOISE_FFT, window,
+                    length=len(audio_16k))
+    return y.cpu().numpy()
+
+
+def _transcribe(model, audio_16k, beam_size):
+    """Run Whisper over 16 kHz audio and join the segment texts."""
+    if WHISPER_BATCH_SIZE > 1 and len(audio_16k) >= WHISPER_BATCH_MIN_SECONDS * WHISPER_SAMPLE_RATE:
+        # Long recording: split on speech pauses and decode the chunks together
+        segments, info = _get_batched_pipeline(model).transcribe(
+            audio_16k,
+            batch_size=WHISPER_BATCH_SIZE,
+            beam_size=beam_size,
+            no_speech_threshold=0.6,
+            log_prob_threshold=-1.0,
+        )
+    else:
+        segments, info = model.transcribe(
+            audio_16k,
+            beam_size=beam_size,
+            # Anti-hallucination settings
+            no_speech_threshold=0.6,           # Skip if probability of no speech > 60%
+            log_prob_threshold=-1.0,           # Skip low confidence segments
+            hallucination_silence_threshold=0.5,  # Skip hallucinations after 0.5s silence
+            condition_on_previous_text=False,  # Don't let previous text influence (reduces repetition)
+        )
+    # Segments decode lazily: an OOM surfaces here, not in transcribe()
+    return " ".join([seg.text for seg in segments]).strip()
+
+
+def _free_cuda_cache():
+    try:
+        import torch
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except ImportError:
+        pass
+
+
+def _requantize_whisper():
+    """After repeated OOMs, reload Whisper as int8_float16 on the next init_whisper()."""
+    global _whisper_model, _batched_pipeline, _compute_type
+    if _device != "cuda" or _compute_type == "int8_float16":
+        return
+    print(stt(f"Still out of GPU memory - switching Whisper from {_compute_type} to int8_float16"))
+    with _whisper_lock:
+        _compute_type = "int8_float16"
+        _whisper_model = None
+        _batched_pipeline = None
+
+
+def _decode(model, audio_data, samplerate):
+    """Resample, denoise and transcribe captured mono audio.
+
+    Returns (text, avg_db); text is None when the capture was too quiet to
+    contain speech. Safe to run on a worker thread.
+    """
+    # Check if there was actual audio (not just silence)
+    avg_db = _block_db(audio_data)
+    if avg_db < SILENCE_SKIP_DB:  # Too quiet, probably no speech
+        return None, avg_db
+
+    # Transcribe directly from memory (no temp file needed)
+    # faster-whisper accepts numpy array - resample to 16kHz if needed
+    if int(samplerate) != WHISPER_SAMPLE_RATE:
+        from scipy import signal
+        # Polyphase FIR: no FFT over the whole capture (slow on unlucky lengths)
+        g = math.gcd(int(samplerate), WHISPER_SAMPLE_RATE)
+        audio_16k = signal.resample_poly(audio_data, WHISPER_SAMPLE_RATE // g,
+                                         int(samplerate) // g).astype(np.float32, copy=False)
+    else:
+        # Capture buffer is already float32 and append-only: pass it without a copy
+        audio_16k = np.ascontiguousarray(audio_data, dtype=np.float32)
+
+    # Apply noise reduction if enabled
+    if NOISE_REDUCE:
+        device, device_index, _ = get_device()
+        if device == "cuda" and NOISE_REDUCE_GPU:
+            audio_16k = _denoise_gpu(audio_16k, device_index)
+        else:
+            audio_16k = nr.reduce_noise(y=audio_16k, sr=WHISPER_SAMPLE_RATE, prop_decrease=0.8)
+
+    try:
+        text = _transcribe(model, audio_16k, WHISPER_BEAM_SIZE)
+    except RuntimeError as e:
+        if "out of memory" not in str(e).lower():
+            raise
+        _free_cuda_cache()
+        if WHISPER_BEAM_SIZE == 1:
+            _requantize_whisper()
+            raise
+        # VRAM is tight: one beam needs a fraction of the decoder memory
+        print(stt("Out of GPU memory - retrying with beam_size=1"))
+        try:
+            text = _transcribe(model, audio_16k, 1)
+        except RuntimeError as e:
+            if "out of memory" in str(e).lower():
+                _requantize_whisper()
+            raise
+
+    # Filter non-Latin hallucinations (Hindi, Chinese, Arabic, etc.)
+    text = _LEADING_NONASCII_RE.sub('', text)
+    text = _NON_LATIN_RE.sub('', text)
+    text = _WS_RE.sub(' ', text).strip()
+    return text, avg_db
+
+
+# Worker for speculative decoding during the end-of-speech pause
+_decode_executor = None
+
+
+def _start_speculative_decode(model, audio_data, samplerate):
+    """Start decoding the audio captured so far on the worker thread."""
+    global _decode_executor
+    if _decode_executor is None:
+        _decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt-decode")
+    return _decode_executor.submit(_decode, model, audio_data, samplerate)
+
+
 def whisper_speech_to_text(selected_device, samplerate, extended_listen=False):
     """Record audio and transcribe with Whisper.
 
     Args:
         extended_listen: If True, waits for longer pause before transcribing.
+
+    With STT_SPECULATIVE_DECODE, decoding starts as soon as the speaker
+    pauses, so it overlaps the SILENCE_DURATION wait instead of following it.
+    If speech resumes, the speculative result is discarded.
     """
     model = init_whisper()
-    q = queue.Queue()
-    audio_buffer = []
+    # Capture buffer written in place by the audio callback (append-only, so
+    # views of the first n samples stay valid); doubled if a capture runs long
+    capture = np.empty(int(samplerate) * 30, dtype=np.float32)
+    captured = 0
+    ready = threading.Event()  # Set by the callback after each block
+    speculative = None  # Future decoding the capture up to the current pause
+    in_flight = None    # Last submitted decode, even if discarded
 
     def callback(indata, frames, time_info, status):
+        nonlocal capture, captured
         if status:
             print(status)
-        q.put(indata.copy())
+        start, end = captured, captured + frames
+        if end > len(capture):
+            grown = np.empty(max(end, 2 * len(capture)), dtype=np.float32)
+            grown[:start] = capture[:start]
+            capture = grown
+        capture[start:end] = indata[:, 0]
+        captured = end  # Single writer: the VAD loop only reads up to here
+        ready.set()
+
+    def captured_audio():
+        n = captured  # Read before the buffer: a grown buffer holds the same first n samples
+        return capture[:n]
 
     try:
         with sd.InputStream(samplerate=int(samplerate), blocksize=STT_BLOCKSIZE,
@@ -147,18 +359,19 @@ def whisper_speech_to_text(selected_device, samplerate, extended_listen=False):
             drop_start = None
             speech_started = False
             silence_threshold = SILENCE_DURATION_EXT if extended_listen else SILENCE_DURATION
+            read = 0  # Start of the next block the VAD loop hasn't seen
 
             while True:
-                try:
-                    data = q.get(timeout=0.3)
-                except queue.Empty:
+                if read + STT_BLOCKSIZE > captured:
+                    ready.clear()
+                    if read + STT_BLOCKSIZE > captured:  # Re-check: a block may land before clear()
+                        ready.wait(timeout=0.3)
                     continue
-
-                audio_buffer.append(data)
+                data = capture[read:read + STT_BLOCKSIZE]
+                read += STT_BLOCKSIZE
 
                 # Calculate dB
-                rms = np.sqrt(np.mean(data ** 2)) if len(data) > 0 else 0
-                current_db = 20 * np.log10(rms) if rms > 1e-10 else -60.0
+                current_db = _block_db(data)
 
                 # Track peak (ignore clipped)
                 if current_db > peak_db and current_db < -5:
@@ -168,72 +381,38 @@ def whisper_speech_to_text(selected_device, samplerate, extended_listen=False):
                         speech_started = True
 
                 # Show dB meter
-                bar_len = int((current_db + 60) / 60 * 20)
-                bar = '█' * max(0, min(20, bar_len)) + '░' * (20 - max(0, min(20, bar_len)))
-                print(f"\r[{bar}] {current_db:5.1f}dB ", end='', flush=True)
+                bar = _METER_BARS[max(0, min(20, int((current_db + 60) / 3)))]
+                sys.stdout.write(f"\r[{bar}] {current_db:5.1f}dB ")
+                sys.stdout.flush()
 
                 # Check for silence after speech
                 if speech_started and current_db < (peak_db - SILENCE_DROP_DB):
                     if drop_start is None:
                         drop_start = time.time()
+                        # Pause started: decode what we have while we wait.
+                        # Skip if a discarded decode is still occupying the worker.
+                        if STT_SPECULATIVE_DECODE and (in_flight is None or in_flight.done()):
+                            speculative = in_flight = _start_speculative_decode(model, captured_audio(), samplerate)
                     elif (time.time() - drop_start) > silence_threshold:
                         print()  # Newline after meter
                         break
                 else:
                     drop_start = None
+                    speculative = None  # Speech resumed - result would be stale
 
-        # Convert buffer to numpy array
-        if not audio_buffer:
+        if not captured:
             return ""
 
-        audio_data = np.concatenate(audio_buffer, axis=0).flatten()
+        print(stt("Transcribing..."))
+        if speculative is not None:
+            text, avg_db = speculative.result()
+        else:
+            text, avg_db = _decode(model, captured_audio(), samplerate)
 
-        # Check if there was actual audio (not just silence)
-        rms = np.sqrt(np.mean(audio_data ** 2))
-        avg_db = 20 * np.log10(rms) if rms > 1e-10 else -60.0
-        if avg_db < SILENCE_SKIP_DB:  # Too quiet, probably no speech
+        if text is None:
             print(stt(f"Skipping - too quiet ({avg_db:.1f}dB)"))
             return ""
 
-        # Transcribe directly from memory (no temp file needed)
-        # faster-whisper accepts numpy array - resample to 16kHz if needed
-        if int(samplerate) != WHISPER_SAMPLE_RATE:
-            from scipy import signal
-            num_samples = int(len(audio_data) * WHISPER_SAMPLE_RATE / samplerate)
-            audio_16k = signal.resample(audio_data, num_samples).astype(np.float32)
-        else:
-            audio_16k = audio_data.astype(np.float32)
-
-        # Apply noise reduction if enabled
-        if NOISE_REDUCE:
-            print(stt("Reducing noise..."))
-            audio_16k = nr.reduce_noise(y=audio_16k, sr=WHISPER_SAMPLE_RATE, prop_decrease=0.8)
-
-        print(stt("Transcribing..."))
-        segments, info = model.transcribe(
-            audio_16k,
-            beam_size=WHISPER_BEAM_SIZE,
-            # Anti-hallucination settings
-            no_speech_threshold=0.6,           # Skip if probability of no speech > 60%
-            log_prob_threshold=-1.0,           # Skip low confidence segments
-            hallucination_silence_threshold=0.5,  # Skip hallucinations after 0.5s silence
-            condition_on_previous_text=False,  # Don't let previous text influence (reduces repetition)
-        )
-        text = " ".join([seg.text for seg in segments]).strip()
-
-        # Filter non-Latin hallucinations (Hindi, Chinese, Arabic, etc.)
-        import re
-        # Remove leading non-ASCII characters and clean up
-        text = re.sub(r'^[^\x00-\x7F]+\s*', '', text)
-        # Remove any remaining non-Latin script blocks
-        text = re.sub(r'[\u0900-\u097F]+', '', text)  # Devanagari (Hindi)
-        text = re.sub(r'[\u4E00-\u9FFF]+', '', text)  # Chinese
-        text = re.sub(r'[\u0600-\u06FF]+', '', text)  # Arabic
-        text = re.sub(r'[\u0400-\u04FF]+', '', text)  # Cyrillic
-        text = re.sub(r'[\u3040-\u30FF]+', '', text)  # Japanese
-        text = re.sub(r'[\uAC00-\uD7AF]+', '', text)  # Korean
-        text = re.sub(r'\s+', ' ', text).strip()
-
         print(stt(f"Result: {text}"))
         return text
 
@@ -250,3 +429,19 @@ def whisper_speech_to_text(selected_device, samplerate, extended_listen=False):
                 pass
     return ""
 
+
+def warmup():
+    """Load Whisper and decode one second of silence on a background thread.
+
+    The first real request then finds the model in memory and the GPU
+    kernels/workspaces already initialized.
+    """
+    def run():
+        try:
+            model = init_whisper()
+            segments, _ = model.transcribe(np.zeros(WHISPER_SAMPLE_RATE, dtype=np.float32), beam_size=1)
+            list(segments)  # Decoding happens while iterating
+        except Exception as e:
+            print(stt(f"Warm-up failed: {e}"))
+
+    threading.Thread(target=run, name="stt-warmup", daemon=True).start()
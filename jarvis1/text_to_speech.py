@@ -1,5 +1,11 @@
+import functools
+import math
 import os
+import queue
+import threading
 import time
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import sounddevice as sd
 import re
@@ -75,8 +81,9 @@ def _select_best_gpu():
     return best_gpu
 
 
+@functools.cache
 def _check_cuda_available():
-    """Check if CUDA is available for Piper."""
+    """Check if CUDA is available for Piper (once per process)."""
     if not USE_GPU:
         return False
     try:
@@ -102,6 +109,31 @@ def _check_cuda_available():
     except ImportError:
         return False
 
+# CUDA EP options: heuristic cuDNN algorithm choice avoids the long exhaustive
+# search on first synthesis; grow the arena by what is requested, not doubling
+_CUDA_PROVIDER_OPTIONS = {
+    "cudnn_conv_algo_search": "HEURISTIC",
+    "arena_extend_strategy": "kSameAsRequested",
+    "do_copy_in_default_stream": True,
+}
+
+
+def _load_piper_voice(model_path, use_cuda):
+    """Load a Piper voice, tuning its ONNX Runtime session for the GPU."""
+    from piper import PiperVoice
+    voice = PiperVoice.load(model_path, use_cuda=use_cuda)
+    session = getattr(voice, "session", None)
+    if use_cuda and session is not None:
+        try:
+            session.set_providers(
+                ["CUDAExecutionProvider", "CPUExecutionProvider"],
+                [dict(_CUDA_PROVIDER_OPTIONS, device_id=_select_best_gpu()), {}],
+            )
+        except Exception as e:
+            print(tts_log(f"Keeping default CUDA settings ({e})"))
+    return voice
+
+
 def _get_voice(lang="nl"):
     """Lazy load Piper voice (GPU if available, CPU fallback)."""
     global _piper_voice_nl, _piper_voice_en
@@ -110,78 +142,88 @@ def _get_voice(lang="nl"):
 
     if lang == "nl":
         if _piper_voice_nl is None:
-            from piper import PiperVoice
             model_path = os.path.join(VOICE_DIR, "nl_BE-nathalie-medium.onnx")
             device_str = "GPU" if use_cuda else "CPU"
             print(tts_log(f"Loading Dutch voice ({device_str})..."))
-            _piper_voice_nl = PiperVoice.load(model_path, use_cuda=use_cuda)
+            _piper_voice_nl = _load_piper_voice(model_path, use_cuda)
             print(tts_log("Dutch voice ready"))
         return _piper_voice_nl
     else:
         if _piper_voice_en is None:
-            from piper import PiperVoice
             model_path = os.path.join(VOICE_DIR, "en_US-lessac-medium.onnx")
             device_str = "GPU" if use_cuda else "CPU"
             print(tts_log(f"Loading English voice ({device_str})..."))
-            _piper_voice_en = PiperVoice.load(model_path, use_cuda=use_cuda)
+            _piper_voice_en = _load_piper_voice(model_path, use_cuda)
             print(tts_log("English voice ready"))
         return _piper_voice_en
 
 
+# Common Dutch words; the distinctive ones decide for short phrases
+_NL_WORDS = frozenset({"de", "het", "een", "van", "en", "in", "is", "dat", "op", "te",
+                       "voor", "met", "zijn", "niet", "aan", "dit", "ook", "als", "maar", "om",
+                       "je", "ik", "we", "hij", "zij", "u", "kan", "zou", "wel", "nog"})
+_NL_DISTINCTIVE = _NL_WORDS - {"de", "is", "in", "en", "van"}  # Skip words common in both
+_TOKEN_RE = re.compile(r"[a-zà-ÿ']+")
+
+
 def detect_language(text):
     """Simple language detection based on common words."""
-    nl_words = ["de", "het", "een", "van", "en", "in", "is", "dat", "op", "te",
-                "voor", "met", "zijn", "niet", "aan", "dit", "ook", "als", "maar", "om",
-                "je", "ik", "we", "hij", "zij", "u", "kan", "zou", "wel", "nog"]
-
-    words = text.lower().split()
+    words = _TOKEN_RE.findall(text.lower())
     if len(words) < 3:
         # For short phrases, check if any word is distinctly Dutch
-        for w in words:
-            if w in nl_words and w not in ["de", "is", "in", "en", "van"]:  # Skip words common in both
-                return "nl"
-        return "en"  # Default to English for short phrases
+        return "nl" if not _NL_DISTINCTIVE.isdisjoint(words) else "en"
 
-    nl_count = sum(1 for w in words if w in nl_words)
+    nl_count = sum(1 for w in words if w in _NL_WORDS)
     ratio = nl_count / len(words)
 
     return "nl" if ratio > TTS_LANG_THRESHOLD else "en"
 
 
+# Markdown formatting: (pattern, replacement), applied in order
+_MARKDOWN_SUBS = [
+    (re.compile(r'\*\*([^*]+)\*\*'), r'\1'),
+    (re.compile(r'\*([^*]+)\*'), r'\1'),
+    (re.compile(r'__([^_]+)__'), r'\1'),
+    (re.compile(r'_([^_]+)_'), r'\1'),
+    (re.compile(r'```[^`]*```'), ''),
+    (re.compile(r'`([^`]+)`'), r'\1'),
+    (re.compile(r'^#+\s*', re.MULTILINE), ''),
+    (re.compile(r'^\s*[-*]\s+', re.MULTILINE), ''),
+    (re.compile(r'^\s*\d+\.\s+', re.MULTILINE), ''),
+]
+# Special characters -> speakable words, one translate() pass
+_SPECIAL_CHARS = str.maketrans({
+    '#': ' hashtag ', '@': ' at ', '&': ' and ', '%': ' percent ',
+    '$': ' dollar ', '*': '', '+': ' plus ', '=': ' equals ',
+    '<': ' less than ', '>': ' greater than ', '/': ' slash ',
+    '\\': ' backslash ', '|': ' pipe ', '~': ' tilde ', '^': ' caret ',
+    '_': ' ', '{': '', '}': '', '[': '', ']': '', '`': '',
+})
+_NON_ASCII_RE = re.compile(r'[^\x00-\x7F]+')
+_WS_RE = re.compile(r'\s+')
+
+
 def clean_text(text):
     """Replace unsupported characters with speakable alternatives."""
     # Remove markdown formatting
-    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)
-    text = re.sub(r'\*([^*]+)\*', r'\1', text)
-    text = re.sub(r'__([^_]+)__', r'\1', text)
-    text = re.sub(r'_([^_]+)_', r'\1', text)
-    text = re.sub(r'```[^`]*```', '', text)
-    text = re.sub(r'`([^`]+)`', r'\1', text)
-    text = re.sub(r'^#+\s*', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*[-*]\s+', '', text, flags=re.MULTILINE)
-    text = re.sub(r'^\s*\d+\.\s+', '', text, flags=re.MULTILINE)
+    for pattern, repl in _MARKDOWN_SUBS:
+        text = pattern.sub(repl, text)
 
     # Replace special characters
-    replacements = {
-        '#': ' hashtag ', '@': ' at ', '&': ' and ', '%': ' percent ',
-        '$': ' dollar ', '*': '', '+': ' plus ', '=': ' equals ',
-        '<': ' less than ', '>': ' greater than ', '/': ' slash ',
-        '\\': ' backslash ', '|': ' pipe ', '~': ' tilde ', '^': ' caret ',
-        '_': ' ', '{': '', '}': '', '[': '', ']': '', '`': '',
-    }
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    text = text.translate(_SPECIAL_CHARS)
 
     # Remove emojis and non-ASCII
-    text = re.sub(r'[^\x00-\x7F]+', '', text)
-    text = re.sub(r'\s+', ' ', text).strip()
+    text = _NON_ASCII_RE.sub('', text)
+    text = _WS_RE.sub(' ', text).strip()
 
     return text
 
 
-def speak(text, speed=None, pitch=None, volume=None, interruptable=True, lang=None):
+def speak(text, speed=None, pitch=None, volume=None, interruptable=True, lang=None, wait=True):
     """Speak text using Piper TTS with optional interrupt detection.
 
+    All speech goes through one TTS worker, so queued sentences never overlap.
+
     Args:
         text: Text to speak
         speed: Speech rate override (None = use per-language config)
@@ -189,10 +231,20 @@ def speak(text, speed=None, pitch=None, volume=None, interruptable=True, lang=No
         volume: Volume multiplier override (None = use per-language config)
         interruptable: If True, monitor mic for interrupt
         lang: Force language ('nl' or 'en'), or None for auto-detect
+        wait: If False, queue the text and return immediately. Never monitors
+            the mic then: the caller is about to open it itself, and a second
+            open of an ALSA hw device fails
 
     Returns:
-        True if interrupted, False otherwise
+        True if interrupted, False otherwise (always False with wait=False)
     """
+    playback = speak_async(text, speed=speed, pitch=pitch, volume=volume,
+                           interruptable=interruptable and wait, lang=lang)
+    return playback.result() if wait else False
+
+
+def _speak(text, speed=None, pitch=None, volume=None, interruptable=True, lang=None):
+    """Synthesize and play text on the TTS worker (see speak)."""
     text = clean_text(text)
 
     if not text or text.isspace():
@@ -225,79 +277,176 @@ def speak(text, speed=None, pitch=None, volume=None, interruptable=True, lang=No
     try:
         voice = _get_voice(lang)
 
-        # Synthesize - returns AudioChunk objects
-        chunks = list(voice.synthesize(text))
-        if not chunks:
+        # Synthesize chunk by chunk (one per sentence) and play each as it arrives,
+        # so a long reply starts sounding after its first sentence
+        chunks = iter(voice.synthesize(text))
+        first = next(chunks, None)
+        if first is None:
             return False
 
-        # Combine all audio chunks
-        audio_arrays = [chunk.audio_float_array for chunk in chunks]
-        audio_float = np.concatenate(audio_arrays) if len(audio_arrays) > 1 else audio_arrays[0]
-        sample_rate = chunks[0].sample_rate
-
-        # Apply pitch adjustment (resample to change pitch, then adjust playback rate)
+        # Pitch and speed are both length changes: resample once by the combined ratio
         # pitch < 1.0 = lower pitch, pitch > 1.0 = higher pitch
-        if pitch != 1.0:
+        # More samples = lower pitch when played at same rate
+        ratio = Fraction(1 / (pitch * speed)).limit_denominator(1000)
+        if ratio != 1:
             from scipy import signal
-            # Resample to change pitch - more samples = lower pitch when played at same rate
-            new_length = int(len(audio_float) / pitch)
-            audio_float = signal.resample(audio_float, new_length)
-            # Adjust sample rate to maintain original duration
-            sample_rate = int(sample_rate / pitch)
-
-        # Apply speed adjustment if needed
-        if speed != 1.0:
-            from scipy import signal
-            new_length = int(len(audio_float) / speed)
-            audio_float = signal.resample(audio_float, new_length)
-
-        # Apply volume adjustment
-        if volume != 1.0:
-            audio_float = audio_float * volume
-            # Clip to prevent distortion
-            audio_float = np.clip(audio_float, -1.0, 1.0)
-
-        if not interruptable:
-            # Simple playback
-            sd.play(audio_float, sample_rate)
-            sd.wait()
-            return False
-
-        # Interruptable playback with mic monitoring
-        # Play audio in background
-        sd.play(audio_float, sample_rate)
-
-        start_time = time.time()
+        # Adjust sample rate so pitch alone keeps the original duration
+        sample_rate = int(first.sample_rate / pitch)
+
+        def prepare(chunk):
+            audio_float = chunk.audio_float_array
+            if ratio != 1:
+                audio_float = signal.resample_poly(audio_float, ratio.numerator, ratio.denominator)
+            # Apply volume adjustment
+            if volume != 1.0:
+                # In place: the buffer is ours, no temporaries for scale or clip
+                np.multiply(audio_float, volume, out=audio_float)
+                # Clip to prevent distortion
+                np.clip(audio_float, -1.0, 1.0, out=audio_float)
+            return audio_float
+
+        pending = queue.Queue()  # Prepared chunks, None = end of speech
+        current = None
+        pos = 0
+
+        def play(outdata, frames, time_info, status):
+            # Runs on the audio thread: copy queued chunks out, silence if synthesis lags
+            nonlocal current, pos
+            filled = 0
+            while filled < frames:
+                if current is None or pos >= len(current):
+                    try:
+                        current = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    pos = 0
+                    if current is None:
+                        outdata[filled:] = 0
+                        raise sd.CallbackStop
+                n = min(frames - filled, len(current) - pos)
+                outdata[filled:filled + n, 0] = current[pos:pos + n]
+                filled += n
+                pos += n
+            outdata[filled:] = 0
+
+        start_time = time.monotonic()
         loud_start = None
+        loud_db = None
+        stop = threading.Event()  # Playback finished or interrupted
+
+        def monitor(indata, frames, time_info, status):
+            # Runs on the audio thread for each mic block; Python sleeps otherwise
+            nonlocal loud_start, loud_db
+            now = time.monotonic()
+            # Grace period - ignore first TTS_GRACE_PERIOD seconds
+            if now - start_time < TTS_GRACE_PERIOD:
+                return
+
+            flat = indata[:, 0]
+            rms = math.sqrt(float(np.dot(flat, flat)) / flat.size)  # No squared temporary
+            db = 20.0 * math.log10(rms) if rms > 1e-10 else -60.0
+
+            # Track sustained loud audio
+            if db > INTERRUPT_DB:
+                if loud_start is None:
+                    loud_start = now
+                elif now - loud_start > INTERRUPT_DURATION:
+                    loud_db = db
+                    stop.set()
+                    raise sd.CallbackStop
+            else:
+                loud_start = None
+
+        audio = prepare(first)
+        queued = len(audio)
+        pending.put(audio)
+
+        with sd.OutputStream(samplerate=sample_rate, channels=1, dtype='float32',
+                             blocksize=AUDIO_BLOCKSIZE, callback=play,
+                             finished_callback=stop.set) as out:
+            # Interruptable playback with mic monitoring; without a mic just play
+            mic = None
+            if interruptable:
+                try:
+                    mic = sd.InputStream(samplerate=AUDIO_SAMPLE_RATE, channels=1, dtype='float32',
+                                         blocksize=AUDIO_BLOCKSIZE, callback=monitor)
+                    mic.start()
+                except Exception as e:
+                    mic = None
 
-        try:
-            with sd.InputStream(samplerate=AUDIO_SAMPLE_RATE, channels=1, dtype='float32', blocksize=AUDIO_BLOCKSIZE) as stream:
-                while sd.get_stream().active:
-                    audio, _ = stream.read(AUDIO_BLOCKSIZE)
-
-                    # Grace period - ignore first TTS_GRACE_PERIOD seconds
-                    if time.time() - start_time < TTS_GRACE_PERIOD:
-                        continue
-
-                    rms = np.sqrt(np.mean(audio ** 2))
-                    db = 20 * np.log10(rms) if rms > 1e-10 else -60.0
-
-                    # Track sustained loud audio
-                    if db > INTERRUPT_DB:
-                        if loud_start is None:
-                            loud_start = time.time()
-                        elif time.time() - loud_start > INTERRUPT_DURATION:
-                            print(f"\n{tts_log(f'Break detected! (sustained {db:.1f}dB)')}")
-                            sd.stop()
-                            time.sleep(0.2)
-                            return True
-                    else:
-                        loud_start = None
-        except Exception as e:
-            sd.wait()
+            try:
+                for chunk in chunks:
+                    if stop.is_set():
+                        break  # Interrupted: don't synthesize the rest
+                    audio = prepare(chunk)
+                    queued += len(audio)
+                    pending.put(audio)
+                pending.put(None)
+                stop.wait(timeout=queued / sample_rate + 1.0)
+            finally:
+                if mic is not None:
+                    mic.close()
+
+            if loud_db is not None:
+                print(f"\n{tts_log(f'Break detected! (sustained {loud_db:.1f}dB)')}")
+                out.abort()
+                time.sleep(0.2)
+                return True
 
         return False
 
     except Exception as e:
         print(tts_log(f"TTS error: {e}"))
         return False
+
+
+# Single background worker so async speech never overlaps itself
+_speak_executor = None
+
+
+def _tts_worker():
+    global _speak_executor
+    if _speak_executor is None:
+        _speak_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts")
+    return _speak_executor
+
+
+def speak_async(text, stop=None, **kwargs):
+    """Run speak() on a background thread.
+
+    Returns a Future whose result() is speak's return value (True if
+    interrupted). Lets callers do other work (e.g. load models) while the
+    prompt is playing.
+
+    Speech queued with the same stop Event is skipped (returning True) once
+    one of them is interrupted, so an interrupt ends a whole streamed answer.
+    """
+    if stop is None:
+        return _tts_worker().submit(_speak, text, **kwargs)
+
+    def run():
+        if stop.is_set():
+            return True
+        interrupted = _speak(text, **kwargs)
+        if interrupted:
+            stop.set()
+        return interrupted
+
+    return _tts_worker().submit(run)
+
+
+def warmup():
+    """Load both voices and synthesize once on the TTS worker.
+
+    Runs ahead of any queued speech, so the first prompt doesn't wait for the
+    model load or the ONNX Runtime engine build.
+    """
+    def run():
+        for lang in ("nl", "en"):
+            try:
+                for _ in _get_voice(lang).synthesize("Ok."):
+                    pass
+            except Exception as e:
+                print(tts_log(f"Warm-up failed ({lang}): {e}"))
+
+    return _tts_worker().submit(run)
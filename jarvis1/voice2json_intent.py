@@ -3,9 +3,13 @@ Voice2json Intent Recognition Module
 Uses voice2json via Docker for bilingual (EN/NL) intent recognition.
 """
 
+import atexit
 import subprocess
 import json
 import os
+import select
+import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from colors import v2j, error
 
@@ -37,39 +41,116 @@ INTENT_ACTIONS = {
 DEBUG = os.environ.get("VOICE2JSON_DEBUG", "0") == "1"
 
 
-def _run_voice2json(profile: str, command: str, args: list = None, input_text: str = None) -> Optional[str]:
-    """Run voice2json command via Docker."""
-    cmd = [
-        "docker", "run", "--rm",
+def _docker_cmd(profile: str, command: str, args: list = None) -> list:
+    """docker run -i command line for a voice2json command fed through stdin."""
+    return [
+        "docker", "run", "-i", "--rm",
         "-v", f"{os.environ['HOME']}:{os.environ['HOME']}",
         "-w", os.getcwd(),
         "-e", f"HOME={os.environ['HOME']}",
+        "-e", "PYTHONUNBUFFERED=1",  # One JSON line out per line in, no buffering
         "--user", f"{os.getuid()}:{os.getgid()}",
         "synesthesiam/voice2json",
         "--profile", profile,
-        command
+        command,
+        *(args or [])
     ]
-    if args:
-        cmd.extend(args)
 
+
+# Long-running recognize-intent containers, one per profile: a line of text in,
+# a line of JSON out. Starting a container per call cost ~0.5 s each.
+_v2j_procs: Dict[str, subprocess.Popen] = {}
+_unread: Dict[str, int] = {}  # Replies still in the pipe after an early return
+_linebuf: Dict[str, bytes] = {}  # Bytes read past the last returned line
+
+# Recent results by (normalized text, language); "yes", "help", "stop" repeat a lot
+_intent_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_INTENT_CACHE_SIZE = 256
+_CONFIDENT = 0.9  # A match this sure skips waiting for the other language
+
+
+def _intent_proc(profile: str) -> subprocess.Popen:
+    """Get (or start) the recognize-intent process for a profile."""
+    proc = _v2j_procs.get(profile)
+    if proc is None or proc.poll() is not None:
+        # --text-input with no sentences: one plain-text sentence per stdin line
+        proc = subprocess.Popen(_docker_cmd(profile, "recognize-intent", args=["--text-input"]),
+                                stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                stderr=None if DEBUG else subprocess.DEVNULL,
+                                bufsize=0)  # Raw pipes: select() sees every unread byte
+        _v2j_procs[profile] = proc
+    return proc
+
+
+def _drop_proc(profile: str):
+    _unread.pop(profile, None)
+    _linebuf.pop(profile, None)
+    proc = _v2j_procs.pop(profile, None)
+    if proc is not None and proc.poll() is None:
+        proc.kill()
+
+
+@atexit.register
+def _stop_procs():
+    """Close stdin so recognize-intent exits and docker removes the --rm container."""
+    for proc in _v2j_procs.values():
+        try:
+            proc.stdin.close()
+        except OSError:
+            pass
+    for profile, proc in list(_v2j_procs.items()):
+        try:
+            proc.wait(timeout=3)
+        except subprocess.TimeoutExpired:
+            pass
+        _drop_proc(profile)  # Kills only what is still running
+
+
+def _send_intent_text(profile: str, text: str) -> bool:
+    """Write one sentence to the profile's recognize-intent process."""
     try:
-        if input_text:
-            result = subprocess.run(cmd, input=input_text, capture_output=True, text=True, timeout=10)
-        else:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-
-        if DEBUG:
-            print(v2j(f"Command: {' '.join(cmd)}"))
-            if result.stderr:
-                print(v2j(f"Stderr: {result.stderr[:200]}"))
-
-        return result.stdout.strip() if result.stdout else None
-    except subprocess.TimeoutExpired:
-        print(error("Docker command timed out"))
-        return None
-    except Exception as e:
-        print(error(f"{e}"))
+        proc = _intent_proc(profile)
+        proc.stdin.write((text.replace("\n", " ") + "\n").encode())
+        return True
+    except OSError as e:
+        print(error(f"voice2json ({profile}) unavailable: {e}"))
+        _drop_proc(profile)
+        return False
+
+
+def _read_intent_json(profile: str, timeout: float = 10) -> Optional[str]:
+    """Read the JSON line answering the last sentence sent to a profile.
+
+    Reads the raw fd into our own line buffer: a stale and a fresh reply often
+    arrive together, and a buffered readline() would hide the second from select().
+    """
+    proc = _v2j_procs.get(profile)
+    if proc is None:
         return None
+    fd = proc.stdout.fileno()
+    deadline = time.monotonic() + timeout
+    buf = _linebuf.get(profile, b"")
+    while True:
+        newline = buf.find(b"\n")
+        if newline >= 0:
+            line, buf = buf[:newline].strip(), buf[newline + 1:]
+            if not line:
+                continue
+            if _unread.get(profile):
+                _unread[profile] -= 1  # Stale reply to an earlier sentence
+                continue
+            _linebuf[profile] = buf
+            return line.decode()
+        remaining = deadline - time.monotonic()
+        if remaining <= 0 or not select.select([fd], [], [], remaining)[0]:
+            print(error(f"voice2json ({profile}) timed out"))
+            _drop_proc(profile)
+            return None
+        data = os.read(fd, 65536)
+        if not data:  # Process exited
+            _drop_proc(profile)
+            return None
+        buf += data
 
 
 def recognize_intent(text: str, language: str = "auto") -> Dict[str, Any]:
@@ -93,6 +174,12 @@ def recognize_intent(text: str, language: str = "auto") -> Dict[str, Any]:
         "text": text
     }
 
+    key = (text.strip().lower(), language)
+    cached = _intent_cache.get(key)
+    if cached is not None:
+        _intent_cache.move_to_end(key)
+        return dict(cached, text=text)
+
     profiles_to_try = []
     if language == "auto":
         # Try both, prefer the one with higher confidence
@@ -106,10 +193,22 @@ def recognize_intent(text: str, language: str = "auto") -> Dict[str, Any]:
     best_match = None
     best_confidence = 0.0
 
-    for lang, profile in profiles_to_try:
-        output = _run_voice2json(profile, "recognize-intent", ["--text-input", text])
+    # Send to every profile first so "auto" recognizes in both languages at once
+    sent = [(lang, profile) for lang, profile in profiles_to_try
+            if _send_intent_text(profile, text)]
+
+    answered = 0
+    for i, (lang, profile) in enumerate(sent):
+        if best_confidence >= _CONFIDENT:
+            # Sure enough already: leave the other reply to be skipped later
+            for _, other in sent[i:]:
+                _unread[other] = _unread.get(other, 0) + 1
+            answered = len(sent)
+            break
+        output = _read_intent_json(profile)
 
         if output:
+            answered += 1
             try:
                 data = json.loads(output)
                 intent_name = data.get("intent", {}).get("name")
@@ -134,8 +233,13 @@ def recognize_intent(text: str, language: str = "auto") -> Dict[str, Any]:
                     print(v2j(f"JSON parse error: {e}"))
 
     if best_match and best_confidence > 0.5:  # Threshold for accepting intent
-        return best_match
+        result = best_match
 
+    # Only cache complete answers, not ones cut short by a failing container
+    if sent and answered == len(sent):
+        _intent_cache[key] = dict(result)
+        if len(_intent_cache) > _INTENT_CACHE_SIZE:
+            _intent_cache.popitem(last=False)
     return result
 
 
@@ -161,16 +265,7 @@ def transcribe_audio(wav_file: str, language: str = "en") -> Optional[str]:
         with open(wav_file, "rb") as f:
             wav_data = f.read()
 
-        cmd = [
-            "docker", "run", "-i", "--rm",
-            "-v", f"{os.environ['HOME']}:{os.environ['HOME']}",
-            "-w", os.getcwd(),
-            "-e", f"HOME={os.environ['HOME']}",
-            "--user", f"{os.getuid()}:{os.getgid()}",
-            "synesthesiam/voice2json",
-            "--profile", profile,
-            "transcribe-wav"
-        ]
+        cmd = _docker_cmd(profile, "transcribe-wav")
 
         result = subprocess.run(cmd, input=wav_data, capture_output=True, timeout=30)
 
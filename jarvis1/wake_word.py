@@ -1,24 +1,63 @@
 import sounddevice as sd
 import numpy as np
-from openwakeword.model import Model
-from scipy import signal
-import time
+import math
+import os
+import threading
 from colors import wake
-from config import WAKE_WORD, WAKE_THRESHOLD, AUDIO_SAMPLE_RATE
+from config import (WAKE_WORD, WAKE_THRESHOLD, AUDIO_SAMPLE_RATE, WAKE_INT8,
+                    WAKE_ENERGY_GATE, WAKE_GATE_MARGIN_DB, WAKE_GATE_HANGOVER)
 
 # Global wake word model
 _oww_model = None
+_INT8_DIR = os.path.expanduser("~/.cache/jarvis/wakeword-int8")
+
+
+def _int8_model_path(name):
+    """INT8 copy of a bundled wake word model, quantized once and cached.
+
+    Saved as <name>.onnx so predictions stay keyed by the wake word name.
+    Returns None if it can't be made (fp32 model is used then).
+    """
+    path = os.path.join(_INT8_DIR, f"{name}.onnx")
+    if os.path.exists(path):
+        return path
+    try:
+        import openwakeword
+        from onnxruntime.quantization import quantize_dynamic, QuantType
+        source = next(p for p in openwakeword.get_pretrained_model_paths("onnx")
+                      if os.path.basename(p).startswith(name))
+        print(wake(f"Quantizing {os.path.basename(source)} to INT8..."))
+        os.makedirs(_INT8_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        quantize_dynamic(source, tmp, weight_type=QuantType.QInt8, per_channel=True, reduce_range=True)
+        os.replace(tmp, path)
+        return path
+    except Exception as e:
+        print(wake(f"INT8 wake word model unavailable ({e}) - using fp32"))
+        return None
+
 
 def init_wake_word():
     """Initialize OpenWakeWord model."""
     global _oww_model
     if _oww_model is None:
         print(wake("Loading wake word model..."))
-        # Load all default wake word models (includes hey_jarvis, alexa, etc.)
-        _oww_model = Model()
+        from openwakeword.model import Model  # Lazy: pulls in onnxruntime
+        # Only the configured wake word: every loaded model runs on every block
+        model = (_int8_model_path(WAKE_WORD) if WAKE_INT8 else None) or WAKE_WORD
+        _oww_model = Model(wakeword_models=[model], inference_framework='onnx')
         print(wake(f"Ready! Say '{WAKE_WORD.replace('_', ' ').title()}' to activate."))
     return _oww_model
 
+def _to_int16(audio, scratch, out):
+    """Scale float audio in [-1, 1] to int16 in two passes, no temporaries.
+
+    Clipping first keeps the unsafe float->int16 cast from wrapping around.
+    """
+    np.clip(audio, -1.0, 1.0, out=scratch)
+    np.multiply(scratch, np.float32(32767.0), out=out, casting='unsafe')
+    return out
+
 def listen_for_wake_word(selected_device, samplerate, timeout=None):
     """
     Efficient wake word detection - uses minimal CPU while waiting.
@@ -30,44 +69,106 @@ def listen_for_wake_word(selected_device, samplerate, timeout=None):
     target_rate = AUDIO_SAMPLE_RATE
     native_rate = int(samplerate)
     need_resample = native_rate != target_rate
+    if need_resample:
+        from scipy import signal  # Lazy: most of scipy loads with it
+    # Polyphase ratio, e.g. 44100 -> 16000 is up 160 / down 441
+    g = math.gcd(native_rate, target_rate)
+    up, down = target_rate // g, native_rate // g
 
     # Calculate chunk size for ~80ms of audio at native rate
     native_chunk = int(native_rate * 0.08)
 
-    detected = False
-    start_time = time.time()
+    # Reused int16 conversion buffers, sized for one (resampled) block
+    buf_len = -(-native_chunk * up // down) if need_resample else native_chunk
+    f32_buf = np.empty(buf_len, dtype=np.float32)
+    i16_buf = np.empty(buf_len, dtype=np.int16)
+
+    detected = threading.Event()  # Set by the callback; the caller sleeps on it
+    # Hot-path names as closure locals: no global lookups per block
+    wake_key = WAKE_WORD
+    threshold = WAKE_THRESHOLD
+    predict = model.predict
+
+    # Energy gate: the floor is the quietest block of the first second (so
+    # speech during calibration can't raise it); until then every block runs
+    gate = WAKE_ENERGY_GATE
+    calibrate_blocks = 12  # ~1 s of 80ms blocks
+    margin = 10 ** (WAKE_GATE_MARGIN_DB / 10)  # dB -> mean-square ratio
+    quietest = None
+    seen = 0
+    floor = None
+    hangover = 0
+    gated = False  # Last block was skipped
+    # Last skipped block, fed ahead of the reopening one so the model's
+    # streaming buffers get the quiet onset of the word, not stale audio
+    preroll = np.empty(native_chunk, dtype=np.float32)
+    preroll_len = 0
+
+    def feed(audio):
+        """Resample and convert one native-rate block, then score it."""
+        nonlocal f32_buf, i16_buf
+        # Resample to 16kHz if needed
+        if need_resample:
+            # Polyphase FIR: no per-block FFT, no slow cases on prime-ish block lengths
+            audio = signal.resample_poly(audio, up, down)
+
+        # Convert to 16-bit int for model, in place (no per-block temporaries)
+        n = len(audio)
+        if n > len(f32_buf):
+            f32_buf = np.empty(n, dtype=np.float32)
+            i16_buf = np.empty(n, dtype=np.int16)
+        # Feed to wake word model
+        prediction = predict(_to_int16(audio, f32_buf[:n], i16_buf[:n]))
+        return prediction.get(wake_key, 0.0)
 
     def audio_callback(indata, frames, time_info, status):
-        nonlocal detected
-        if detected:
+        nonlocal preroll, preroll_len, quietest, seen, floor, hangover, gated
+        if detected.is_set():
             return
         if status:
             print(status)
 
-        # Convert to float and get mono
-        audio = indata[:, 0]
-
-        # Resample to 16kHz if needed
-        if need_resample:
-            num_samples = int(len(audio) * target_rate / native_rate)
-            audio = signal.resample(audio, num_samples)
-
-        # Convert to 16-bit int for model
-        audio_data = (audio * 32767).astype(np.int16)
-
-        # Feed to wake word model
-        prediction = model.predict(audio_data)
+        # Raw float32 mono block: view it in place, no array wrapper or slice
+        audio = np.frombuffer(indata, dtype=np.float32)
+
+        if gate and len(audio):
+            energy = float(np.dot(audio, audio)) / len(audio)  # Mean square, no temporary
+            if floor is None:
+                # Digital silence (muted/idle device) would pin the floor near 0
+                if energy > 0.0:
+                    quietest = energy if quietest is None else min(quietest, energy)
+                    seen += 1
+                    if seen >= calibrate_blocks:
+                        floor = max(quietest, 1e-8) * margin
+            elif energy >= floor:
+                hangover = WAKE_GATE_HANGOVER
+            elif hangover > 0:
+                hangover -= 1  # Short dips inside speech still reach the model
+            else:
+                # Quiet room: skip resampling and inference, keep the block as pre-roll
+                if len(audio) > len(preroll):
+                    preroll = np.empty(len(audio), dtype=np.float32)
+                preroll[:len(audio)] = audio
+                preroll_len = len(audio)
+                gated = True
+                return
+
+        score = 0.0
+        if gated:
+            gated = False
+            score = feed(preroll[:preroll_len])
+        score = max(score, feed(audio))
 
         # Only trigger on the configured wake word
-        if WAKE_WORD in prediction and prediction[WAKE_WORD] > WAKE_THRESHOLD:
-            print(f"\n{wake(f'Detected: {WAKE_WORD} ({prediction[WAKE_WORD]:.2f})')}")
-            detected = True
+        if score > threshold:
+            print(f"\n{wake(f'Detected: {wake_key} ({score:.2f})')}")
+            detected.set()
             return
 
     print(wake(f"Listening... (say '{WAKE_WORD.replace('_', ' ').title()}')"))
 
     try:
-        with sd.InputStream(
+        with sd.RawInputStream(
             samplerate=native_rate,
             blocksize=native_chunk,
             device=selected_device['index'],
@@ -75,12 +176,8 @@ def listen_for_wake_word(selected_device, samplerate, timeout=None):
             dtype='float32',
             callback=audio_callback
         ):
-            while not detected:
-                time.sleep(0.1)
-                if timeout and (time.time() - start_time) > timeout:
-                    return False
-
-        return True
+            # No polling: wakes as soon as the callback fires
+            return detected.wait(timeout=timeout or None)
 
     except Exception as e:
         print(f"Wake word error: {e}")
@@ -28,10 +28,13 @@ from assistmint.core.audio import (
     speak,
     init_wake_word,
     listen_for_wake_word,
-    get_stt_engine  # For unloading Whisper when sleeping
+    set_language,
+    get_stt_engine,  # For unloading Whisper when sleeping
+    get_tts_engine
 )
 from assistmint.core.nlp import apply_corrections, is_hallucination, get_intent_router
 from assistmint.core.actions import execute_action, is_system_action
+from assistmint.core.resources.manager import ResourceType
 
 # Import config
 try:
@@ -56,6 +59,16 @@ set_calendar_config(
     default_duration=CALENDAR_DEFAULT_DURATION,
 )
 
+# Resolved once here rather than by an import on every command
+try:
+    from config import LANG_SWITCH_EN, LANG_SWITCH_NL, LANG_SWITCH_AUTO
+except ImportError:
+    LANG_SWITCH_EN = LANG_SWITCH_NL = LANG_SWITCH_AUTO = None
+try:
+    from modules.chat.module import clear_session, clear_pending_calendar
+except ImportError:
+    clear_session = clear_pending_calendar = None
+
 # Global flags
 _quiet_help = False
 
@@ -139,9 +152,6 @@ def init_assistant():
     # Setup VRAM auto-unload
     try:
         from config import AUTO_UNLOAD_ENABLED, AUTO_UNLOAD_TIMEOUT
-        from assistmint.core.audio.stt import get_stt_engine
-        from assistmint.core.audio.tts import get_tts_engine
-        from assistmint.core.resources.manager import ResourceType
 
         if AUTO_UNLOAD_ENABLED and rm.gpu_available:
             print(f"\n{B}{CYAN}[5/5] VRAM Optimization{R}")
@@ -213,20 +223,15 @@ def process_command(text: str, context: ModuleContext, loader) -> bool:
     # PRIORITY: Clear session (before any other processing)
     clear_session_triggers = ["clear session", "forget everything", "vergeet alles", "wis sessie"]
     if any(t in text_lower for t in clear_session_triggers):
-        try:
-            from modules.chat.module import clear_session
+        if clear_session is not None:
             clear_session()
             speak("Sessie gewist." if "vergeet" in text_lower or "wis" in text_lower else "Session cleared.", interruptable=False)
-        except ImportError:
+        else:
             speak("Could not clear session.")
         return True
 
     # PRIORITY: Language switching (before any other processing)
-    try:
-        from config import LANG_SWITCH_EN, LANG_SWITCH_NL, LANG_SWITCH_AUTO
-        from assistmint.core.audio.tts import set_language
-        from modules.chat.module import clear_pending_calendar
-
+    if LANG_SWITCH_EN is not None and clear_pending_calendar is not None:
         if any(t in text_lower for t in LANG_SWITCH_EN):
             set_language("en")
             clear_pending_calendar()  # Clear any pending calendar state
@@ -242,8 +247,6 @@ def process_command(text: str, context: ModuleContext, loader) -> bool:
             clear_pending_calendar()
             speak("Auto.", interruptable=False)
             return True
-    except ImportError:
-        pass
 
     # Update context with text
     context.text = text
@@ -410,20 +413,21 @@ def main():
             context.session_data["input_mode"] = "voice"
             init_wake_word()
 
-            # Show VRAM status
-            import subprocess
-            try:
-                result = subprocess.run(
-                    ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"],
-                    capture_output=True, text=True, timeout=5
-                )
-                if result.returncode == 0:
-                    used, total = map(int, result.stdout.strip().split(','))
-                    pct = int(used / total * 100)
-                    status = "⚠ HIGH" if pct > 80 else "✓"
-                    print(f"{status} VRAM: {used}MB/{total}MB ({pct}%)")
-            except Exception:
-                pass
+            # Show VRAM status (no nvidia-smi process on CPU-only machines)
+            if get_resource_manager().gpu_available:
+                import subprocess
+                try:
+                    result = subprocess.run(
+                        ["nvidia-smi", "--query-gpu=memory.used,memory.total", "--format=csv,noheader,nounits"],
+                        capture_output=True, text=True, timeout=5
+                    )
+                    if result.returncode == 0:
+                        used, total = map(int, result.stdout.strip().split(','))
+                        pct = int(used / total * 100)
+                        status = "⚠ HIGH" if pct > 80 else "✓"
+                        print(f"{status} VRAM: {used}MB/{total}MB ({pct}%)")
+                except Exception:
+                    pass
 
             print(f"\nVoice mode - say '{WAKE_WORD.replace('_', ' ').title()}' to wake\n")
 